@@ -0,0 +1,44 @@
+"""Per-todo current_date/display/days_until against todo.evaluate_due_dates
+
+    python -m benchmark.due_dates --todos 100000
+"""
+import argparse
+import random
+import statistics
+import time
+import typing
+
+from src import todo
+from benchmark.query_plans import TODAY, random_todo
+
+
+def per_todo(todos: typing.List[todo.Todo], /) -> None:
+    for t in todos:
+        t.current_date(TODAY)
+        t.display(TODAY)
+        t.days_until(TODAY)
+
+
+def batch(todos: typing.List[todo.Todo], /) -> None:
+    todo.evaluate_due_dates(todos, TODAY)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--todos", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    todos = [random_todo(rng, user_id=1) for _ in range(args.todos)]
+    for name, fn in (("per todo", per_todo), ("evaluate_due_dates", batch)):
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            fn(todos)
+            timings.append(time.perf_counter() - start)
+        print(f"{name}: {statistics.median(timings) * 1000:.1f} ms for {args.todos:,} todos")
+
+
+if __name__ == "__main__":
+    main()
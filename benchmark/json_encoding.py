@@ -0,0 +1,68 @@
+"""Encode time per 1k todos for the todo list body, jsonable_encoder + JSONResponse against dump_todo_list
+
+    python -m benchmark.json_encoding --todos 10000
+"""
+import argparse
+import random
+import statistics
+import time
+import typing
+
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+
+from src import api
+from src.api import json_response
+from benchmark.query_plans import TODAY, random_todo
+
+
+def generic(todos: typing.List[api.TodoResponse], /) -> bytes:
+    """The encode path before: jsonable_encoder walks every response, then JSONResponse dumps the result"""
+    return JSONResponse(content=jsonable_encoder(todos)).body
+
+
+def fast(todos: typing.List[api.TodoResponse], /) -> bytes:
+    """The encode path now: the response fields are dumped as they are"""
+    return api.dump_todo_list(todos)
+
+
+def measure(
+    name: str,
+    fn: typing.Callable[[typing.List[api.TodoResponse]], bytes],
+    todos: typing.List[api.TodoResponse],
+    /,
+    *,
+    repeat: int,
+) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(todos)
+        timings.append(time.perf_counter() - start)
+    per_1k = statistics.median(timings) / len(todos) * 1000
+    print(f"{name}: {per_1k * 1000:.2f} ms per 1k todos")
+    return per_1k
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--todos", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    todos = api.TodoResponse.many_from_domain([random_todo(rng, user_id=1) for _ in range(args.todos)], today=TODAY)
+    assert generic(todos) == fast(todos)
+
+    before = measure("jsonable_encoder", generic, todos, repeat=args.repeat)
+    encoder = "orjson" if json_response.orjson is not None else "json"
+    after = measure(f"dump_todo_list ({encoder})", fast, todos, repeat=args.repeat)
+    if json_response.orjson is not None:
+        orjson, json_response.orjson = json_response.orjson, None
+        measure("dump_todo_list (json)", fast, todos, repeat=args.repeat)
+        json_response.orjson = orjson
+    print(f"{before / after:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
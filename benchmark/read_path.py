@@ -0,0 +1,70 @@
+"""CPU time and allocations per row when listing todos, validated models against trusted construct()
+
+    python -m benchmark.read_path --todos 10000
+"""
+import argparse
+import random
+import statistics
+import time
+import tracemalloc
+import typing
+
+from src import api, todo
+from src.todo.adapter.sqlalchemy_todo_repository import from_domain, to_domain
+from benchmark.query_plans import TODAY, random_todo
+
+Row = typing.Tuple[typing.Type[todo.Todo], typing.Dict[str, typing.Any]]
+
+
+def validated(rows: typing.List[Row], /) -> typing.List[api.TodoResponse]:
+    """The read path before: pydantic validated every row and then every response"""
+    todos = [cls(**fields) for cls, fields in rows]
+    return [api.TodoResponse.from_domain(t, today=TODAY) for t in todos]
+
+
+def trusted(rows: typing.List[Row], /) -> typing.List[api.TodoResponse]:
+    """The read path now: to_domain and many_from_domain construct() without validation"""
+    todos = [cls.construct(**fields) for cls, fields in rows]  # type: ignore
+    return api.TodoResponse.many_from_domain(todos, today=TODAY)
+
+
+def measure(fn: typing.Callable[[typing.List[Row]], typing.Any], rows: typing.List[Row], /, *, repeat: int) -> None:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(rows)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    result = fn(rows)
+    snapshot = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+
+    print(
+        f"{fn.__name__}: {statistics.median(timings) * 1000:.1f} ms, "
+        f"{statistics.median(timings) / len(rows) * 1e6:.1f} us/row, "
+        f"peak {peak / len(rows):,.0f} bytes/row, {blocks / len(rows):.1f} live blocks/row"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--todos", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    dtos = [from_domain(random_todo(rng, user_id=1), today=TODAY) for _ in range(args.todos)]
+    for todo_id, dto in enumerate(dtos, start=1):
+        dto.todo_id = todo_id
+    todos = [to_domain(dto) for dto in dtos]
+    rows: typing.List[Row] = [(type(t), t.dict()) for t in todos]
+    for fn in (validated, trusted):
+        measure(fn, rows, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
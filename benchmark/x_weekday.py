@@ -0,0 +1,69 @@
+"""The old day scan of get_x_weekday_of_month against the closed form and the per-year table
+
+    python -m benchmark.x_weekday --years 200
+"""
+import argparse
+import calendar
+import datetime
+import itertools
+import statistics
+import time
+import typing
+
+from src import todo
+from src.todo.domain.todos import irregular
+
+Rule = typing.Tuple[int, int, int, todo.Weekday]
+
+
+def scan_x_weekday_of_month(year: int, month: int, week_num: int, week_day: todo.Weekday) -> datetime.date:
+    """get_x_weekday_of_month before the closed form, without its lru_cache"""
+    days_in_month = calendar.monthrange(year, month)[1]
+    return list(
+        itertools.islice(
+            (
+                dt
+                for day in range(1, days_in_month, 1)
+                if (dt := datetime.date(year, month, day)).weekday() == week_day.py_weekday
+            ),
+            week_num,
+        )
+    )[-1]
+
+
+def scan(rules: typing.List[Rule], /) -> None:
+    for rule in rules:
+        scan_x_weekday_of_month(*rule)
+
+
+def closed_form(rules: typing.List[Rule], /) -> None:
+    for rule in rules:
+        irregular.get_x_weekday_of_month(*rule)
+
+
+def table(rules: typing.List[Rule], /) -> None:
+    irregular.x_weekday_table.cache_clear()
+    for year, month, week_num, week_day in rules:
+        dates = irregular.x_weekday_table(year)[(month, week_day)]
+        dates[min(week_num, len(dates)) - 1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rules = list(itertools.product(range(2000, 2000 + args.years), range(1, 13), range(1, 6), todo.Weekday))
+    for fn in (scan, closed_form, table):
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            fn(rules)
+            timings.append(time.perf_counter() - start)
+        median = statistics.median(timings)
+        print(f"{fn.__name__}: {median * 1000:.1f} ms, {median / len(rules) * 1e6:.2f} us per date")
+
+
+if __name__ == "__main__":
+    main()
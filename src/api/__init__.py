@@ -1,4 +1,6 @@
 from src.api.api import *
 from src.api.exceptions import *
+from src.api.json_response import *
+from src.api.metrics_middleware import *
+from src.api.query_log_middleware import *
 from src.api.response import *
-
@@ -4,7 +4,7 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse
 
 
-__all__ = ("CREDENTIALS_EXCEPTION", "http_error_handler")
+__all__ = ("CREDENTIALS_EXCEPTION", "SERVICE_BUSY_EXCEPTION", "http_error_handler")
 
 CREDENTIALS_EXCEPTION = fastapi.HTTPException(
     status_code=fastapi.status.HTTP_401_UNAUTHORIZED,
@@ -12,6 +12,15 @@ CREDENTIALS_EXCEPTION = fastapi.HTTPException(
     headers={"WWW-Authenticate": "Bearer"},
 )
 
+SERVICE_BUSY_EXCEPTION = fastapi.HTTPException(
+    status_code=fastapi.status.HTTP_503_SERVICE_UNAVAILABLE,
+    detail="The server is busy, please try again shortly",
+    headers={"Retry-After": "1"},
+)
+
 
 async def http_error_handler(_: Request, exc: HTTPException) -> JSONResponse:
-    return JSONResponse({"errors": [exc.detail]}, status_code=exc.status_code)
+    # carries Retry-After on 503s and WWW-Authenticate on 401s through to the client
+    return JSONResponse(
+        {"errors": [exc.detail]}, status_code=exc.status_code, headers=getattr(exc, "headers", None)
+    )
@@ -0,0 +1,55 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src import core
+
+__all__ = ("QueryLogMiddleware",)
+
+logger = core.logger.getChild("requests")
+
+# a statement that runs this often in one request is most likely running once per row
+REPEATED_STATEMENT_THRESHOLD = 5
+
+
+class QueryLogMiddleware:
+    """Records the queries of every http request, for DEBUG mode
+
+    Each response gets an X-Query-Count header, the count is logged per request and statements repeated at least
+    REPEATED_STATEMENT_THRESHOLD times are logged as a warning.
+    """
+
+    def __init__(self, /, app: ASGIApp, query_log: core.QueryLog):
+        self.app = app
+        self.query_log = query_log
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with self.query_log.record() as queries:
+
+            async def send_with_query_count(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    # the response starts once the route is done, streamed bodies may still run queries after it
+                    MutableHeaders(scope=message)["X-Query-Count"] = str(len(queries))
+                await send(message)
+
+            start = time.perf_counter()
+            try:
+                await self.app(scope, receive, send_with_query_count)
+            finally:
+                elapsed = time.perf_counter() - start
+                logger.debug(
+                    f"{scope['method']} {scope['path']} ran {len(queries)} queries in "
+                    f"{sum(q.seconds for q in queries) * 1000:.1f} of {elapsed * 1000:.1f} ms"
+                )
+                for statement, count in core.repeated_statements(
+                    queries, at_least=REPEATED_STATEMENT_THRESHOLD
+                ).items():
+                    logger.warning(
+                        f"{scope['method']} {scope['path']} ran the same statement {count} times: "
+                        f"{' '.join(statement.split())}"
+                    )
@@ -8,6 +8,9 @@ import pydantic
 from src import core, todo, auth
 
 __all__ = (
+    "BulkItemResult",
+    "BulkResponse",
+    "OccurrenceResponse",
     "TodoResponse",
     "UserResponse",
 )
@@ -27,21 +30,57 @@ class TodoResponse(pydantic.BaseModel):
         anystr_strip_whitespace = True
 
     @staticmethod
-    def from_domain(
-        domain: todo.Todo, /, *, today: typing.Optional[datetime.date] = None
-    ) -> TodoResponse:
-        if today is None:
-            today = datetime.date.today()
+    def from_domain(domain: todo.Todo, /, *, today: datetime.date) -> TodoResponse:
         return TodoResponse(
             todo_id=domain.todo_id,
             category=domain.category,
             description=domain.description,
             frequency=str(domain),
-            next=domain.current_date(today),
+            next=domain.due_date(today),
             display=domain.display(today),
             note=domain.note,
         )
 
+    @staticmethod
+    def many_from_domain(
+        todos: typing.Sequence[todo.Todo], /, *, today: datetime.date
+    ) -> typing.List[TodoResponse]:
+        due_dates = todo.evaluate_due_dates(todos, today)
+        # the domain todos are already valid, so the responses skip pydantic validation
+        return [
+            TodoResponse.construct(
+                todo_id=t.todo_id,
+                category=t.category,
+                description=t.description,
+                frequency=str(t),
+                next=today + datetime.timedelta(days=days_until),
+                display=display,
+                note=t.note,
+            )
+            for t, display, days_until in zip(todos, due_dates.display, due_dates.days_until)
+        ]
+
+
+class OccurrenceResponse(pydantic.BaseModel):
+    todo_id: int
+    date: datetime.date
+    category: core.TodoCategory
+    description: str
+    frequency: str
+
+    class Config:
+        allow_mutation = False
+
+    @staticmethod
+    def from_domain(domain: todo.Todo, /, *, date: datetime.date) -> OccurrenceResponse:
+        return OccurrenceResponse(
+            todo_id=domain.todo_id,
+            date=date,
+            category=domain.category,
+            description=domain.description,
+            frequency=str(domain),
+        )
+
 
 class UserResponse(pydantic.BaseModel):
     username: str
@@ -53,3 +92,16 @@ class UserResponse(pydantic.BaseModel):
             username=domain.username,
             email=domain.email,
         )
+
+
+class BulkItemResult(pydantic.BaseModel):
+    """Outcome of the item at index in a bulk request, either the todo or the errors that kept it out"""
+
+    index: int
+    todo_id: typing.Optional[int] = None
+    todo: typing.Optional[TodoResponse] = None
+    errors: typing.Optional[typing.List[typing.Dict[str, typing.Any]]] = None
+
+
+class BulkResponse(pydantic.BaseModel):
+    results: typing.List[BulkItemResult]
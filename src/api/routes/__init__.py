@@ -1,2 +1,4 @@
 from src.api.routes.auth import *
+from src.api.routes.metrics import *
+from src.api.routes.today import *
 from src.api.routes.todos import *
@@ -15,7 +15,7 @@ router = fastapi.APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/token")
 
 
-def get_current_active_user(
+async def get_current_active_user(
     token: str = fastapi.Depends(oauth2_scheme),
     token_service: auth.TokenService = fastapi.Depends(
         service_locator.default().token_service
@@ -25,7 +25,7 @@ def get_current_active_user(
     ),
 ) -> auth.User:
     username = token_service.username(token=token)
-    if active_user := user_service.get_user(username):
+    if active_user := await user_service.get_user(username):
         return active_user
     raise exceptions.CREDENTIALS_EXCEPTION
 
@@ -44,14 +44,18 @@ async def login(
     ),
 ) -> auth.Token:
     try:
-        user = user_service.get_user(form_data.username)
+        user = await user_service.get_user(form_data.username)
     except core.exception.UserNotFound:
         raise exceptions.CREDENTIALS_EXCEPTION
     else:
-        if password_hasher.verify(
-            hashed_password=user.password_hash,
-            plain_password=pydantic.SecretStr(form_data.password),
-        ):
+        try:
+            verified = await password_hasher.verify(
+                hashed_password=user.password_hash,
+                plain_password=pydantic.SecretStr(form_data.password),
+            )
+        except core.exception.ServiceBusy:
+            raise exceptions.SERVICE_BUSY_EXCEPTION
+        if verified:
             return token_service.create({"sub": user.username})
         else:
             raise exceptions.CREDENTIALS_EXCEPTION
@@ -76,8 +80,11 @@ async def register(
         service_locator.default().password_hasher
     ),
 ) -> response.UserResponse:
-    pw_hash = password_hasher.create(pydantic.SecretStr(password))
-    user = user_service.create_user(
+    try:
+        pw_hash = await password_hasher.create(pydantic.SecretStr(password))
+    except core.exception.ServiceBusy:
+        raise exceptions.SERVICE_BUSY_EXCEPTION
+    user = await user_service.create_user(
         username=username, email=email, password_hash=pw_hash
     )
     return response.UserResponse.from_domain(user)
@@ -0,0 +1,14 @@
+import fastapi
+from starlette.responses import PlainTextResponse
+
+from src import core
+
+__all__ = ("router",)
+
+router = fastapi.APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics() -> PlainTextResponse:
+    """This process's metrics in the prometheus text format, only served when METRICS_ENABLED is set"""
+    return PlainTextResponse(core.metrics.render(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,33 @@
+import datetime
+import typing
+import zoneinfo
+
+import fastapi
+from starlette.status import HTTP_400_BAD_REQUEST
+
+from src import service_locator
+
+__all__ = ("get_today",)
+
+
+async def get_today(
+    x_timezone: typing.Optional[str] = fastapi.Header(None),
+    default_timezone: typing.Optional[datetime.tzinfo] = fastapi.Depends(
+        service_locator.default().default_timezone
+    ),
+) -> datetime.date:
+    """The current date of the caller, read once per request and passed to everything that needs it
+
+    The caller's IANA timezone comes from the X-Timezone header, falling back to the TIMEZONE setting and then to
+    the server's local time.
+    """
+    timezone = default_timezone
+    if x_timezone:
+        try:
+            timezone = zoneinfo.ZoneInfo(x_timezone)
+        except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+            raise fastapi.HTTPException(
+                status_code=HTTP_400_BAD_REQUEST,
+                detail=f"X-Timezone {x_timezone!r} is not a known timezone",
+            )
+    return datetime.datetime.now(timezone).date()
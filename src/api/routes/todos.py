@@ -1,42 +1,77 @@
 import datetime
+import functools
+import hashlib
+import heapq
 import typing
 
 import fastapi
 import pydantic
-from starlette.status import HTTP_400_BAD_REQUEST
+from starlette.responses import StreamingResponse
+from starlette.status import HTTP_304_NOT_MODIFIED, HTTP_400_BAD_REQUEST
 
 from src import auth, todo, core, service_locator
 from src.api import response
-from src.api.routes import get_current_active_user
+from src.api.json_response import TodoListResponse, dump_todo_list
+from src.api.routes.auth import get_current_active_user
+from src.api.routes.today import get_today
 
 __all__ = ("router",)
 
 router = fastapi.APIRouter()
 
+MAX_BULK_ITEMS = 5_000
 
-def update_todo(
+MAX_PAGE_SIZE = 1_000
+
+MAX_CALENDAR_DAYS = 3_660
+
+TODO_TYPES: typing.Dict[core.FrequencyDbName, typing.Type[todo.Todo]] = {
+    core.FrequencyDbName.DAILY: todo.Daily,
+    core.FrequencyDbName.EASTER: todo.Easter,
+    core.FrequencyDbName.IRREGULAR: todo.Irregular,
+    core.FrequencyDbName.MONTHLY: todo.Monthly,
+    core.FrequencyDbName.ONCE: todo.Once,
+    core.FrequencyDbName.WEEKLY: todo.Weekly,
+    core.FrequencyDbName.XDAYS: todo.XDays,
+    core.FrequencyDbName.YEARLY: todo.Yearly,
+}
+
+
+async def update_todo(
     *,
     user_id: int,
     todo_id: int,
+    todo_type: typing.Type[todo.Todo],
     todo_service: todo.TodoService,
     updates: typing.Dict[str, typing.Any],
+    today: datetime.date,
 ) -> response.TodoResponse:
-    original_todo = todo_service.get_by_id(user_id=user_id, todo_id=todo_id)
-    if original_todo:
-        data = original_todo.dict()
-        data.update(updates)
-        _, _, errors = pydantic.validate_model(todo.Todo, data)
-        if errors:
-            raise fastapi.HTTPException(
-                status_code=fastapi.status.HTTP_400_BAD_REQUEST,
-                detail=errors.json(),
-            )
-
-        updated_todo = original_todo.copy(update=updates)
-        updated_todo_from_db = todo_service.update_todo(user_id=user_id, todo=updated_todo)
-        return response.TodoResponse.from_domain(updated_todo_from_db)
-    else:
+    """Write just the changed fields of the user's todo, 404 if it has none with todo_id that takes them"""
+    try:
+        updated_todo = await todo_service.patch_todo(
+            user_id=user_id, todo_id=todo_id, todo_type=todo_type, updates=updates
+        )
+    except pydantic.ValidationError as e:
+        raise fastapi.HTTPException(
+            status_code=fastapi.status.HTTP_400_BAD_REQUEST,
+            detail=e.json(),
+        )
+    if updated_todo is None:
         raise fastapi.HTTPException(status_code=fastapi.status.HTTP_404_NOT_FOUND, detail="Todo does not exist.")
+    return response.TodoResponse.from_domain(updated_todo, today=today)
+
+
+def build_todo(todo_type: typing.Type[todo.Todo], /, *, today: datetime.date, **fields: typing.Any) -> todo.Todo:
+    """The todo one of the single add routes was asked for, 400 if its fields are invalid"""
+    try:
+        new_todo = todo_type(**fields)
+        new_todo.validate_current_date(today)
+    except pydantic.ValidationError as e:
+        raise fastapi.HTTPException(
+            status_code=fastapi.status.HTTP_400_BAD_REQUEST,
+            detail=e.json(),
+        )
+    return new_todo
 
 
 @router.post("/daily", response_model=response.TodoResponse, status_code=201)
@@ -44,19 +79,22 @@ async def add_daily_todo(
     description: str,
     note: typing.Optional[str] = None,
     start_date: typing.Optional[datetime.date] = None,
+    today: datetime.date = fastapi.Depends(get_today),
     current_user: auth.User = fastapi.Depends(get_current_active_user),
     todo_service: todo.TodoService = fastapi.Depends(
         service_locator.default().todo_service
     ),
 ) -> response.TodoResponse:
     if start_date is None:
-        start_date = datetime.date.today()
+        start_date = today
     if note is None:
         note = ""
-    daily_todo = todo.Daily(
+    daily_todo = build_todo(
+        todo.Daily,
+        today=today,
         advance_days=0,
         category=core.TodoCategory.Todo,
-        date_added=datetime.date.today(),
+        date_added=today,
         date_completed=None,
         description=description,
         note=note,
@@ -64,8 +102,8 @@ async def add_daily_todo(
         todo_id=-1,
         user_id=current_user.user_id,
     )
-    new_todo = todo_service.add_todo(user_id=current_user.user_id, todo=daily_todo)
-    return response.TodoResponse.from_domain(new_todo)
+    new_todo = await todo_service.add_todo(user_id=current_user.user_id, todo=daily_todo, today=today)
+    return response.TodoResponse.from_domain(new_todo, today=today)
 
 
 @router.post("/daily/{todo_id}", response_model=response.TodoResponse)
@@ -74,24 +112,27 @@ async def update_daily_todo(
     description: typing.Optional[str] = None,
     note: typing.Optional[str] = None,
     start_date: typing.Optional[datetime.date] = None,
+    today: datetime.date = fastapi.Depends(get_today),
     current_user: auth.User = fastapi.Depends(get_current_active_user),
     todo_service: todo.TodoService = fastapi.Depends(
         service_locator.default().todo_service
     ),
 ) -> response.TodoResponse:
     updates: typing.Dict[str, typing.Any] = {}
-    if start_date is None:
+    if start_date is not None:
         updates["start_date"] = start_date
     if description is not None:
         updates["description"] = description
     if note is not None:
         updates["note"] = note
 
-    return update_todo(
+    return await update_todo(
         user_id=current_user.user_id,
         todo_id=todo_id,
+        todo_type=todo.Daily,
         todo_service=todo_service,
         updates=updates,
+        today=today,
     )
 
 
@@ -104,42 +145,34 @@ async def add_irregular_todo(
     week: int,
     note: typing.Optional[str] = None,
     start_date: typing.Optional[datetime.date] = None,
+    today: datetime.date = fastapi.Depends(get_today),
     current_user: auth.User = fastapi.Depends(get_current_active_user),
     todo_service: todo.TodoService = fastapi.Depends(
         service_locator.default().todo_service
     ),
 ) -> response.TodoResponse:
-    validation_errors: typing.List[str] = []
-    if month not in range(1, 12):
-        validation_errors.append("month must be between 1 and 12")
-    if week_day not in range(1, 7):
-        validation_errors.append("week_day must be between 1 and 7")
-    if week not in range(1, 5):
-        validation_errors.append("week must be between 1 and 5")
-    if validation_errors:
-        errors_str = "; ".join(validation_errors)
-        msg = f"Validation errors: {errors_str}"
-        raise fastapi.HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=msg)
     if start_date is None:
-        start_date = datetime.date.today()
+        start_date = today
     if note is None:
         note = ""
-    irregular_todo = todo.Irregular(
+    irregular_todo = build_todo(
+        todo.Irregular,
+        today=today,
         advance_days=advance_days,
         category=core.TodoCategory.Todo,
-        date_added=datetime.date.today(),
+        date_added=today,
         date_completed=None,
         description=description,
         note=note,
         start_date=start_date,
         todo_id=-1,
         user_id=current_user.user_id,
-        month=todo.Month(month),
-        week_day=todo.Weekday(week_day),
+        month=month,
+        week_day=week_day,
         week_number=week,
     )
-    new_todo = todo_service.add_todo(user_id=current_user.user_id, todo=irregular_todo)
-    return response.TodoResponse.from_domain(new_todo)
+    new_todo = await todo_service.add_todo(user_id=current_user.user_id, todo=irregular_todo, today=today)
+    return response.TodoResponse.from_domain(new_todo, today=today)
 
 
 @router.post("/irregular/{todo_id}", response_model=response.TodoResponse)
@@ -152,6 +185,7 @@ async def update_irregular_todo(
     week: typing.Optional[int] = None,
     note: typing.Optional[str] = None,
     start_date: typing.Optional[datetime.date] = None,
+    today: datetime.date = fastapi.Depends(get_today),
     current_user: auth.User = fastapi.Depends(get_current_active_user),
     todo_service: todo.TodoService = fastapi.Depends(
         service_locator.default().todo_service
@@ -167,17 +201,19 @@ async def update_irregular_todo(
     if week_day is not None:
         updates["week_day"] = week_day
     if week is not None:
-        updates["week"] = week
+        updates["week_number"] = week
     if note is not None:
         updates["note"] = note
     if start_date is not None:
         updates["start_date"] = start_date
 
-    return update_todo(
+    return await update_todo(
         user_id=current_user.user_id,
         todo_id=todo_id,
+        todo_type=todo.Irregular,
         todo_service=todo_service,
         updates=updates,
+        today=today,
     )
 
 
@@ -188,25 +224,22 @@ async def add_monthly_todo(
     month_day: int,
     note: typing.Optional[str] = None,
     start_date: typing.Optional[datetime.date] = None,
+    today: datetime.date = fastapi.Depends(get_today),
     current_user: auth.User = fastapi.Depends(get_current_active_user),
     todo_service: todo.TodoService = fastapi.Depends(
         service_locator.default().todo_service
     ),
 ) -> response.TodoResponse:
-    if month_day not in range(1, 28):
-        raise fastapi.HTTPException(
-            status_code=HTTP_400_BAD_REQUEST,
-            detail="month_day must be between 1 and 28",
-        )
-
     if start_date is None:
-        start_date = datetime.date.today()
+        start_date = today
     if note is None:
         note = ""
-    monthly_todo = todo.Monthly(
+    monthly_todo = build_todo(
+        todo.Monthly,
+        today=today,
         advance_days=advance_days,
         category=core.TodoCategory.Todo,
-        date_added=datetime.date.today(),
+        date_added=today,
         date_completed=None,
         description=description,
         note=note,
@@ -215,8 +248,8 @@ async def add_monthly_todo(
         user_id=current_user.user_id,
         month_day=month_day,
     )
-    new_todo = todo_service.add_todo(user_id=current_user.user_id, todo=monthly_todo)
-    return response.TodoResponse.from_domain(new_todo)
+    new_todo = await todo_service.add_todo(user_id=current_user.user_id, todo=monthly_todo, today=today)
+    return response.TodoResponse.from_domain(new_todo, today=today)
 
 
 @router.post("/monthly/{todo_id}", response_model=response.TodoResponse)
@@ -227,17 +260,12 @@ async def update_monthly_todo(
     month_day: typing.Optional[int] = None,
     note: typing.Optional[str] = None,
     start_date: typing.Optional[datetime.date] = None,
+    today: datetime.date = fastapi.Depends(get_today),
     current_user: auth.User = fastapi.Depends(get_current_active_user),
     todo_service: todo.TodoService = fastapi.Depends(
         service_locator.default().todo_service
     ),
 ) -> response.TodoResponse:
-    if month_day and month_day not in range(1, 28):
-        raise fastapi.HTTPException(
-            status_code=HTTP_400_BAD_REQUEST,
-            detail="month_day must be between 1 and 28",
-        )
-
     updates: typing.Dict[str, typing.Any] = {}
     if description is not None:
         updates["description"] = description
@@ -250,11 +278,13 @@ async def update_monthly_todo(
     if start_date is not None:
         updates["start_date"] = start_date
 
-    return update_todo(
+    return await update_todo(
         user_id=current_user.user_id,
         todo_id=todo_id,
+        todo_type=todo.Monthly,
         todo_service=todo_service,
         updates=updates,
+        today=today,
     )
 
 
@@ -263,6 +293,7 @@ async def add_one_time_todo(
     description: str,
     date: datetime.date,
     note: typing.Optional[str] = None,
+    today: datetime.date = fastapi.Depends(get_today),
     current_user: auth.User = fastapi.Depends(get_current_active_user),
     todo_service: todo.TodoService = fastapi.Depends(
         service_locator.default().todo_service
@@ -270,10 +301,12 @@ async def add_one_time_todo(
 ) -> response.TodoResponse:
     if note is None:
         note = ""
-    once_todo = todo.Once(
+    once_todo = build_todo(
+        todo.Once,
+        today=today,
         advance_days=0,
         category=core.TodoCategory.Todo,
-        date_added=datetime.date.today(),
+        date_added=today,
         date_completed=None,
         description=description,
         note=note,
@@ -282,17 +315,18 @@ async def add_one_time_todo(
         todo_id=-1,
         user_id=current_user.user_id,
     )
-    new_todo = todo_service.add_todo(user_id=current_user.user_id, todo=once_todo)
-    return response.TodoResponse.from_domain(new_todo)
+    new_todo = await todo_service.add_todo(user_id=current_user.user_id, todo=once_todo, today=today)
+    return response.TodoResponse.from_domain(new_todo, today=today)
 
 
-@router.post("/once", response_model=response.TodoResponse)
+@router.post("/once/{todo_id}", response_model=response.TodoResponse)
 async def update_one_time_todo(
     todo_id: int,
     description: typing.Optional[str] = None,
     date: typing.Optional[datetime.date] = None,
     note: typing.Optional[str] = None,
     advance_days: typing.Optional[int] = None,
+    today: datetime.date = fastapi.Depends(get_today),
     current_user: auth.User = fastapi.Depends(get_current_active_user),
     todo_service: todo.TodoService = fastapi.Depends(
         service_locator.default().todo_service
@@ -306,13 +340,15 @@ async def update_one_time_todo(
     if note is not None:
         updates["note"] = note
     if date is not None:
-        updates["date"] = date
+        updates["once_date"] = date
 
-    return update_todo(
+    return await update_todo(
         user_id=current_user.user_id,
         todo_id=todo_id,
+        todo_type=todo.Once,
         todo_service=todo_service,
         updates=updates,
+        today=today,
     )
 
 
@@ -322,6 +358,7 @@ async def add_weekly_todo(
     start_date: datetime.date,
     week_day: int,
     note: typing.Optional[str] = None,
+    today: datetime.date = fastapi.Depends(get_today),
     current_user: auth.User = fastapi.Depends(get_current_active_user),
     todo_service: todo.TodoService = fastapi.Depends(
         service_locator.default().todo_service
@@ -329,20 +366,22 @@ async def add_weekly_todo(
 ) -> response.TodoResponse:
     if note is None:
         note = ""
-    weekly_todo = todo.Weekly(
+    weekly_todo = build_todo(
+        todo.Weekly,
+        today=today,
         advance_days=0,
         category=core.TodoCategory.Todo,
-        date_added=datetime.date.today(),
+        date_added=today,
         date_completed=None,
         description=description,
         note=note,
         start_date=start_date,
         todo_id=-1,
         user_id=current_user.user_id,
-        week_day=todo.Weekday(week_day),
+        week_day=week_day,
     )
-    new_todo = todo_service.add_todo(user_id=current_user.user_id, todo=weekly_todo)
-    return response.TodoResponse.from_domain(new_todo)
+    new_todo = await todo_service.add_todo(user_id=current_user.user_id, todo=weekly_todo, today=today)
+    return response.TodoResponse.from_domain(new_todo, today=today)
 
 
 @router.post("/weekly/{todo_id}", response_model=response.TodoResponse)
@@ -352,6 +391,7 @@ async def update_weekly_todo(
     date: typing.Optional[datetime.date] = None,
     week_day: typing.Optional[int] = None,
     note: typing.Optional[str] = None,
+    today: datetime.date = fastapi.Depends(get_today),
     current_user: auth.User = fastapi.Depends(get_current_active_user),
     todo_service: todo.TodoService = fastapi.Depends(
         service_locator.default().todo_service
@@ -365,13 +405,15 @@ async def update_weekly_todo(
     if note is not None:
         updates["note"] = note
     if date is not None:
-        updates["date"] = date
+        updates["start_date"] = date
 
-    return update_todo(
+    return await update_todo(
         user_id=current_user.user_id,
         todo_id=todo_id,
+        todo_type=todo.Weekly,
         todo_service=todo_service,
         updates=updates,
+        today=today,
     )
 
 
@@ -381,6 +423,7 @@ async def add_xdays_todo(
     start_date: datetime.date,
     days: int,
     note: typing.Optional[str] = None,
+    today: datetime.date = fastapi.Depends(get_today),
     current_user: auth.User = fastapi.Depends(get_current_active_user),
     todo_service: todo.TodoService = fastapi.Depends(
         service_locator.default().todo_service
@@ -388,10 +431,12 @@ async def add_xdays_todo(
 ) -> response.TodoResponse:
     if note is None:
         note = ""
-    xdays_todo = todo.XDays(
+    xdays_todo = build_todo(
+        todo.XDays,
+        today=today,
         advance_days=0,
         category=core.TodoCategory.Todo,
-        date_added=datetime.date.today(),
+        date_added=today,
         date_completed=None,
         description=description,
         note=note,
@@ -400,8 +445,8 @@ async def add_xdays_todo(
         user_id=current_user.user_id,
         days=days,
     )
-    new_todo = todo_service.add_todo(user_id=current_user.user_id, todo=xdays_todo)
-    return response.TodoResponse.from_domain(new_todo)
+    new_todo = await todo_service.add_todo(user_id=current_user.user_id, todo=xdays_todo, today=today)
+    return response.TodoResponse.from_domain(new_todo, today=today)
 
 
 @router.post("/xdays/{todo_id}", response_model=response.TodoResponse)
@@ -411,6 +456,7 @@ async def update_xdays_todo(
     start_date: typing.Optional[datetime.date] = None,
     days: typing.Optional[int] = None,
     note: typing.Optional[str] = None,
+    today: datetime.date = fastapi.Depends(get_today),
     current_user: auth.User = fastapi.Depends(get_current_active_user),
     todo_service: todo.TodoService = fastapi.Depends(
         service_locator.default().todo_service
@@ -424,13 +470,15 @@ async def update_xdays_todo(
     if note is not None:
         updates["note"] = note
     if start_date is not None:
-        updates["date"] = start_date
+        updates["start_date"] = start_date
 
-    return update_todo(
+    return await update_todo(
         user_id=current_user.user_id,
         todo_id=todo_id,
+        todo_type=todo.XDays,
         todo_service=todo_service,
         updates=updates,
+        today=today,
     )
 
 
@@ -441,26 +489,20 @@ async def add_yearly_todo(
     month: int,
     day: int,
     note: typing.Optional[str] = None,
+    today: datetime.date = fastapi.Depends(get_today),
     current_user: auth.User = fastapi.Depends(get_current_active_user),
     todo_service: todo.TodoService = fastapi.Depends(
         service_locator.default().todo_service
     ),
 ) -> response.TodoResponse:
-    validation_errors: typing.List[str] = []
-    if month not in range(1, 12):
-        validation_errors.append("month must be between 1 and 12")
-    if day not in range(1, 31):
-        validation_errors.append("day must be between 1 and 31")
-    if validation_errors:
-        errors_str = "; ".join(validation_errors)
-        msg = f"Validation errors: {errors_str}"
-        raise fastapi.HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=msg)
     if note is None:
         note = ""
-    yearly_todo = todo.Yearly(
+    yearly_todo = build_todo(
+        todo.Yearly,
+        today=today,
         advance_days=0,
         category=core.TodoCategory.Todo,
-        date_added=datetime.date.today(),
+        date_added=today,
         date_completed=None,
         description=description,
         note=note,
@@ -468,10 +510,10 @@ async def add_yearly_todo(
         todo_id=-1,
         user_id=current_user.user_id,
         day=day,
-        month=todo.Month(month),
+        month=month,
     )
-    new_todo = todo_service.add_todo(user_id=current_user.user_id, todo=yearly_todo)
-    return response.TodoResponse.from_domain(new_todo)
+    new_todo = await todo_service.add_todo(user_id=current_user.user_id, todo=yearly_todo, today=today)
+    return response.TodoResponse.from_domain(new_todo, today=today)
 
 
 @router.post("/yearly/{todo_id}", response_model=response.TodoResponse)
@@ -482,6 +524,7 @@ async def update_yearly_todo(
     month: typing.Optional[int] = None,
     day: typing.Optional[int] = None,
     note: typing.Optional[str] = None,
+    today: datetime.date = fastapi.Depends(get_today),
     current_user: auth.User = fastapi.Depends(get_current_active_user),
     todo_service: todo.TodoService = fastapi.Depends(
         service_locator.default().todo_service
@@ -493,20 +536,264 @@ async def update_yearly_todo(
     if month is not None:
         updates["month"] = month
     if day is not None:
-        updates["day"] = month
+        updates["day"] = day
     if note is not None:
         updates["note"] = note
     if start_date is not None:
-        updates["date"] = start_date
+        updates["start_date"] = start_date
 
-    return update_todo(
+    return await update_todo(
         user_id=current_user.user_id,
         todo_id=todo_id,
+        todo_type=todo.Yearly,
         todo_service=todo_service,
         updates=updates,
+        today=today,
+    )
+
+
+def new_todo_from_dict(
+    data: typing.Dict[str, typing.Any], /, *, user_id: int, today: datetime.date
+) -> todo.Todo:
+    """Build a todo from one item of a bulk request, raising a ValueError or pydantic.ValidationError if it's invalid"""
+    try:
+        frequency = core.FrequencyDbName(data.get("frequency"))
+    except ValueError:
+        raise ValueError(f"frequency must be one of {', '.join(f.value for f in core.FrequencyDbName)}")
+
+    defaults: typing.Dict[str, typing.Any] = {
+        "advance_days": 0,
+        "category": core.TodoCategory.Todo,
+        "note": "",
+        "start_date": data.get("once_date") or today,
+    }
+    fixed: typing.Dict[str, typing.Any] = {
+        "date_added": today,
+        "date_completed": None,
+        "todo_id": -1,
+        "user_id": user_id,
+    }
+    new_todo = TODO_TYPES[frequency](**(defaults | data | fixed))
+    new_todo.validate_current_date(today)
+    return new_todo
+
+
+def bulk_error(loc: str, msg: str) -> typing.List[typing.Dict[str, typing.Any]]:
+    return [{"loc": [loc], "msg": msg, "type": "value_error"}]
+
+
+def check_bulk_size(items: typing.Sized, /) -> None:
+    if len(items) > MAX_BULK_ITEMS:
+        raise fastapi.HTTPException(
+            status_code=fastapi.status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"A bulk request can hold at most {MAX_BULK_ITEMS} items, but got {len(items)}.",
+        )
+
+
+@router.post("/bulk", response_model=response.BulkResponse)
+async def add_todos(
+    items: typing.List[typing.Dict[str, typing.Any]] = fastapi.Body(...),
+    today: datetime.date = fastapi.Depends(get_today),
+    current_user: auth.User = fastapi.Depends(get_current_active_user),
+    todo_service: todo.TodoService = fastapi.Depends(
+        service_locator.default().todo_service
+    ),
+) -> response.BulkResponse:
+    """Add todos of any frequency in one transaction, each item is a todo plus a frequency key
+
+    Invalid items are reported by index and don't stop the valid ones from being added.
+    """
+    check_bulk_size(items)
+    results: typing.Dict[int, response.BulkItemResult] = {}
+    valid: typing.List[typing.Tuple[int, todo.Todo]] = []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, new_todo_from_dict(item, user_id=current_user.user_id, today=today)))
+        except pydantic.ValidationError as e:
+            results[index] = response.BulkItemResult(index=index, errors=e.errors())
+        except ValueError as e:
+            results[index] = response.BulkItemResult(index=index, errors=bulk_error("frequency", str(e)))
+
+    if valid:
+        new_todos = await todo_service.add_todos(
+            user_id=current_user.user_id, todos=[t for _, t in valid], today=today
+        )
+        for (index, _), new_todo in zip(valid, new_todos):
+            results[index] = response.BulkItemResult(
+                index=index,
+                todo_id=new_todo.todo_id,
+                todo=response.TodoResponse.from_domain(new_todo, today=today),
+            )
+    return response.BulkResponse(results=[results[index] for index in range(len(items))])
+
+
+@router.patch("/bulk", response_model=response.BulkResponse)
+async def update_todos(
+    items: typing.List[typing.Dict[str, typing.Any]] = fastapi.Body(...),
+    today: datetime.date = fastapi.Depends(get_today),
+    current_user: auth.User = fastapi.Depends(get_current_active_user),
+    todo_service: todo.TodoService = fastapi.Depends(
+        service_locator.default().todo_service
+    ),
+) -> response.BulkResponse:
+    """Patch todos in one transaction, each item is a todo_id plus the fields to change
+
+    Only the given fields are written, as with the single todo routes.  A todo's frequency can't be changed, and the
+    fields in todo.READ_ONLY_FIELDS and date_completed can't be set, todos are completed with POST /bulk/complete.
+    Invalid items are reported by index and don't stop the valid ones.
+    """
+    check_bulk_size(items)
+    todo_ids = [todo_id for item in items if isinstance(todo_id := item.get("todo_id"), int)]
+    existing = {
+        t.todo_id: t for t in await todo_service.get_by_ids(user_id=current_user.user_id, todo_ids=todo_ids)
+    }
+
+    results: typing.Dict[int, response.BulkItemResult] = {}
+    valid: typing.List[typing.Tuple[int, todo.TodoPatch]] = []
+    for index, item in enumerate(items):
+        current_todo = existing.get(item.get("todo_id"))  # type: ignore
+        if current_todo is None:
+            results[index] = response.BulkItemResult(
+                index=index, todo_id=item.get("todo_id"), errors=bulk_error("todo_id", "Todo does not exist.")
+            )
+            continue
+
+        updates = {k: v for k, v in item.items() if k not in ("frequency", "todo_id")}
+        if "date_completed" in updates:
+            results[index] = response.BulkItemResult(
+                index=index,
+                todo_id=item["todo_id"],
+                errors=bulk_error("date_completed", "date_completed can't be updated"),
+            )
+            continue
+        todo_type = type(current_todo)
+        try:
+            # a field can be fine on its own and make no date with the others, e.g. day 31 of a yearly todo in April
+            current_todo.copy(update=todo_type.validate_updates(updates)).validate_current_date(today)
+        except pydantic.ValidationError as e:
+            results[index] = response.BulkItemResult(index=index, todo_id=item["todo_id"], errors=e.errors())
+        else:
+            valid.append((index, todo.TodoPatch(todo_id=item["todo_id"], todo_type=todo_type, updates=updates)))
+
+    if valid:
+        patched_todos = await todo_service.patch_todos(
+            user_id=current_user.user_id, patches=[p for _, p in valid]
+        )
+        for (index, patch), patched_todo in zip(valid, patched_todos):
+            if patched_todo is None:
+                # deleted since get_by_ids
+                results[index] = response.BulkItemResult(
+                    index=index, todo_id=patch.todo_id, errors=bulk_error("todo_id", "Todo does not exist.")
+                )
+            else:
+                results[index] = response.BulkItemResult(
+                    index=index,
+                    todo_id=patched_todo.todo_id,
+                    todo=response.TodoResponse.from_domain(patched_todo, today=today),
+                )
+    return response.BulkResponse(results=[results[index] for index in range(len(items))])
+
+
+@router.delete("/bulk", response_model=response.BulkResponse)
+async def delete_todos(
+    todo_ids: typing.List[int] = fastapi.Body(...),
+    current_user: auth.User = fastapi.Depends(get_current_active_user),
+    todo_service: todo.TodoService = fastapi.Depends(
+        service_locator.default().todo_service
+    ),
+) -> response.BulkResponse:
+    check_bulk_size(todo_ids)
+    deleted = set(await todo_service.delete_todos(user_id=current_user.user_id, todo_ids=todo_ids))
+    return response.BulkResponse(
+        results=[
+            response.BulkItemResult(index=index, todo_id=todo_id)
+            if todo_id in deleted
+            else response.BulkItemResult(
+                index=index, todo_id=todo_id, errors=bulk_error("todo_id", "Todo does not exist.")
+            )
+            for index, todo_id in enumerate(todo_ids)
+        ]
     )
 
 
+@router.post("/bulk/complete", response_model=response.BulkResponse)
+async def mark_todos_complete(
+    todo_ids: typing.List[int] = fastapi.Body(...),
+    today: datetime.date = fastapi.Depends(get_today),
+    current_user: auth.User = fastapi.Depends(get_current_active_user),
+    todo_service: todo.TodoService = fastapi.Depends(
+        service_locator.default().todo_service
+    ),
+) -> response.BulkResponse:
+    """Complete todos as of today in one transaction, ids the user has no todo for are reported by index"""
+    check_bulk_size(todo_ids)
+    completed = {
+        t.todo_id: t
+        for t in await todo_service.mark_many_complete(
+            user_id=current_user.user_id, todo_ids=todo_ids, today=today
+        )
+    }
+    return response.BulkResponse(
+        results=[
+            response.BulkItemResult(
+                index=index,
+                todo_id=todo_id,
+                todo=response.TodoResponse.from_domain(completed[todo_id], today=today),
+            )
+            if todo_id in completed
+            else response.BulkItemResult(
+                index=index, todo_id=todo_id, errors=bulk_error("todo_id", "Todo does not exist.")
+            )
+            for index, todo_id in enumerate(todo_ids)
+        ]
+    )
+
+
+@router.get("/current", response_model=typing.List[response.TodoResponse])
+async def current_todos(
+    category: core.TodoCategory = core.TodoCategory.Todo,
+    if_none_match: typing.Optional[str] = fastapi.Header(None),
+    today: datetime.date = fastapi.Depends(get_today),
+    current_user: auth.User = fastapi.Depends(get_current_active_user),
+    todo_service: todo.TodoService = fastapi.Depends(
+        service_locator.default().todo_service
+    ),
+    todo_list_cache: typing.Optional[todo.TodoListCache] = fastapi.Depends(
+        service_locator.default().todo_list_cache
+    ),
+) -> fastapi.Response:
+    """The user's todos of the category that are showing today
+
+    Like the full list, it carries an ETag and is cached per user, category and day until the user's todos change.
+    """
+
+    async def read() -> typing.List[todo.Todo]:
+        return await todo_service.get_current_todos(
+            user_id=current_user.user_id, category=category.value, today=today
+        )
+
+    todo_list = await cached_todo_list(
+        read, cache=todo_list_cache, user_id=current_user.user_id, today=today, category=category.value
+    )
+    return etag_response(todo_list, if_none_match=if_none_match)
+
+
+@router.post("/{todo_id}/complete", response_model=response.TodoResponse)
+async def mark_todo_complete(
+    todo_id: int,
+    today: datetime.date = fastapi.Depends(get_today),
+    current_user: auth.User = fastapi.Depends(get_current_active_user),
+    todo_service: todo.TodoService = fastapi.Depends(
+        service_locator.default().todo_service
+    ),
+) -> response.TodoResponse:
+    """Complete the todo as of today and return it with its next due date"""
+    completed = await todo_service.mark_complete(user_id=current_user.user_id, todo_id=todo_id, today=today)
+    if completed is None:
+        raise fastapi.HTTPException(status_code=fastapi.status.HTTP_404_NOT_FOUND, detail="Todo does not exist.")
+    return response.TodoResponse.from_domain(completed, today=today)
+
+
 @router.delete("/{todo_id}", status_code=204)
 async def delete_todo(
     todo_id: int,
@@ -515,15 +802,153 @@ async def delete_todo(
         service_locator.default().todo_service
     ),
 ) -> None:
-    todo_service.delete_todo(user_id=current_user.user_id, todo_id=todo_id)
+    await todo_service.delete_todo(user_id=current_user.user_id, todo_id=todo_id)
 
 
 @router.get("")
 async def all_todos(
+    after: typing.Optional[int] = None,
+    limit: typing.Optional[int] = None,
+    stream: bool = False,
+    if_none_match: typing.Optional[str] = fastapi.Header(None),
+    today: datetime.date = fastapi.Depends(get_today),
     current_user: auth.User = fastapi.Depends(get_current_active_user),
     todo_service: todo.TodoService = fastapi.Depends(
         service_locator.default().todo_service
     ),
-) -> typing.List[response.TodoResponse]:
-    todos = todo_service.all(current_user.user_id)
-    return [response.TodoResponse.from_domain(t) for t in todos]
+    todo_list_cache: typing.Optional[todo.TodoListCache] = fastapi.Depends(
+        service_locator.default().todo_list_cache
+    ),
+) -> fastapi.Response:
+    """The user's todos in todo_id order
+
+    The full list carries an ETag, and a request whose If-None-Match matches it gets a 304 without a body.  The
+    serialized list is cached per user and day until the user's todos change.
+
+    With after or limit, returns a page of at most limit (MAX_PAGE_SIZE by default) todos following the todo_id
+    after, and sets an X-Next-After header to pass as after for the next page until the last page.  With stream,
+    sends every todo as newline delimited json while it is read from the database.
+    """
+    if stream:
+        return StreamingResponse(
+            ndjson_lines(todo_service.stream(user_id=current_user.user_id), today=today),
+            media_type="application/x-ndjson",
+        )
+
+    if after is None and limit is None:
+        todo_list = await cached_todo_list(
+            functools.partial(todo_service.all, current_user.user_id),
+            cache=todo_list_cache,
+            user_id=current_user.user_id,
+            today=today,
+        )
+        return etag_response(todo_list, if_none_match=if_none_match)
+
+    if limit is None:
+        limit = MAX_PAGE_SIZE
+    elif limit not in range(1, MAX_PAGE_SIZE + 1):
+        raise fastapi.HTTPException(
+            status_code=HTTP_400_BAD_REQUEST,
+            detail=f"limit must be between 1 and {MAX_PAGE_SIZE}",
+        )
+    todos = await todo_service.page(user_id=current_user.user_id, after_id=after, limit=limit)
+    headers = {"X-Next-After": str(todos[-1].todo_id)} if len(todos) == limit else None
+    return TodoListResponse(response.TodoResponse.many_from_domain(todos, today=today), headers=headers)
+
+
+async def cached_todo_list(
+    read: typing.Callable[[], typing.Awaitable[typing.List[todo.Todo]]],
+    /,
+    *,
+    cache: typing.Optional[todo.TodoListCache],
+    user_id: int,
+    today: datetime.date,
+    category: typing.Optional[str] = None,
+) -> todo.CachedTodoList:
+    """The serialized list from the cache, or from read and stored unless the user's todos changed meanwhile"""
+    if cache is None:
+        return serialize_todo_list(await read(), today=today)
+
+    if cached := await cache.get(user_id=user_id, today=today, category=category):
+        return cached
+    version = await cache.version(user_id)
+    todo_list = serialize_todo_list(await read(), today=today)
+    await cache.set(user_id=user_id, version=version, today=today, category=category, value=todo_list)
+    return todo_list
+
+
+def serialize_todo_list(todos: typing.Sequence[todo.Todo], /, *, today: datetime.date) -> todo.CachedTodoList:
+    body = dump_todo_list(response.TodoResponse.many_from_domain(todos, today=today))
+    return todo.CachedTodoList(etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"', body=body)
+
+
+def etag_response(todo_list: todo.CachedTodoList, /, *, if_none_match: typing.Optional[str]) -> fastapi.Response:
+    if if_none_match and (if_none_match.strip() == "*" or todo_list.etag in _etags(if_none_match)):
+        return fastapi.Response(status_code=HTTP_304_NOT_MODIFIED, headers={"ETag": todo_list.etag})
+    return fastapi.Response(
+        content=todo_list.body, media_type="application/json", headers={"ETag": todo_list.etag}
+    )
+
+
+def _etags(if_none_match: str, /) -> typing.List[str]:
+    # weak validators compare equal to strong ones for If-None-Match
+    return [etag.strip().removeprefix("W/") for etag in if_none_match.split(",")]
+
+
+async def ndjson_lines(
+    todos: typing.AsyncIterator[todo.Todo], /, *, today: datetime.date
+) -> typing.AsyncIterator[str]:
+    async for t in todos:
+        yield response.TodoResponse.from_domain(t, today=today).json() + "\n"
+
+
+@router.get("/calendar")
+async def todo_calendar(
+    start: datetime.date,
+    end: datetime.date,
+    holidays: bool = False,
+    current_user: auth.User = fastapi.Depends(get_current_active_user),
+    todo_service: todo.TodoService = fastapi.Depends(
+        service_locator.default().todo_service
+    ),
+    holiday_calendar: todo.HolidayCalendar = fastapi.Depends(
+        service_locator.default().holiday_calendar
+    ),
+) -> StreamingResponse:
+    """Every due date of the user's todos from start through end, as newline delimited json in date order
+
+    Dates are generated while the response is sent, so the body is never held in memory as a whole.  With
+    holidays, the shared holiday calendar is merged in.
+    """
+    if end < start:
+        raise fastapi.HTTPException(
+            status_code=HTTP_400_BAD_REQUEST,
+            detail="end must not be before start",
+        )
+    if (end - start).days >= MAX_CALENDAR_DAYS:
+        raise fastapi.HTTPException(
+            status_code=HTTP_400_BAD_REQUEST,
+            detail=f"The range can span at most {MAX_CALENDAR_DAYS} days",
+        )
+    todos = await todo_service.all(current_user.user_id)
+    return StreamingResponse(
+        calendar_lines(todos, start=start, end=end, holiday_calendar=holiday_calendar if holidays else None),
+        media_type="application/x-ndjson",
+    )
+
+
+def calendar_lines(
+    todos: typing.Iterable[todo.Todo],
+    /,
+    *,
+    start: datetime.date,
+    end: datetime.date,
+    holiday_calendar: typing.Optional[todo.HolidayCalendar] = None,
+) -> typing.Iterator[str]:
+    occurrences = todo.merge_occurrences(todos, start=start, end=end)
+    if holiday_calendar is not None:
+        occurrences = heapq.merge(
+            occurrences, holiday_calendar.between(start, end), key=lambda pair: pair[0]
+        )
+    for dt, t in occurrences:
+        yield response.OccurrenceResponse.from_domain(t, date=dt).json() + "\n"
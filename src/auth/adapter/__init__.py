@@ -1 +1,3 @@
+from src.auth.adapter.in_memory_user_cache import *
+from src.auth.adapter.key_value_user_cache import *
 from src.auth.adapter.sqlalchemy_user_repository import *
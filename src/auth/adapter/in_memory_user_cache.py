@@ -0,0 +1,75 @@
+import collections
+import itertools
+import threading
+import time
+import typing
+
+from src import core
+from src.auth import domain
+
+__all__ = ("InMemoryUserCache",)
+
+
+class _Entry(typing.NamedTuple):
+    version: str
+    expires_at: float
+    user: typing.Optional[domain.User]
+
+
+class InMemoryUserCache(domain.UserCache):
+    """LRU cache of users that also forgets entries ttl_seconds after they were set
+
+    Each worker process has its own copy, so a removed user can stay cached in the other workers for up to
+    ttl_seconds.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int,
+        ttl_seconds: float,
+        clock: typing.Callable[[], float] = time.monotonic,
+        metrics: typing.Optional[core.CacheMetrics] = None,
+    ):
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._versions = itertools.count()
+        self._users: typing.OrderedDict[str, _Entry] = collections.OrderedDict()
+        self.metrics = metrics or core.CacheMetrics()
+
+    async def get(self, /, username: str) -> typing.Optional[domain.User]:
+        with self._lock:
+            if (entry := self._users.get(username)) is None or entry.user is None:
+                self.metrics.miss()
+                return None
+            if entry.expires_at <= self._clock():
+                del self._users[username]
+                self.metrics.miss()
+                return None
+            self._users.move_to_end(username)
+            self.metrics.hit()
+            return entry.user
+
+    async def version(self, /, username: str) -> str:
+        with self._lock:
+            if (entry := self._users.get(username)) is None:
+                entry = self._users[username] = _Entry(version=str(next(self._versions)), expires_at=0, user=None)
+                self._evict()
+            return entry.version
+
+    async def set(self, /, user: domain.User, *, version: str) -> None:
+        with self._lock:
+            if (entry := self._users.get(user.username)) is None or entry.version != version:
+                return
+            self._users[user.username] = entry._replace(expires_at=self._clock() + self._ttl_seconds, user=user)
+            self._users.move_to_end(user.username)
+
+    async def delete(self, /, username: str) -> None:
+        with self._lock:
+            self._users.pop(username, None)
+
+    def _evict(self) -> None:
+        while len(self._users) > self._max_size:
+            self._users.popitem(last=False)
@@ -0,0 +1,68 @@
+import typing
+import uuid
+
+from starlette.concurrency import run_in_threadpool
+
+from src import core
+from src.auth import domain
+
+__all__ = ("KeyValueUserCache",)
+
+
+class KeyValueUserCache(domain.UserCache):
+    """Users stored as json in a redis-compatible store, shared by every worker that uses the same store
+
+    A user is stored under the username's current version, a random token kept under its own key.  Deleting a
+    username deletes that token, so a user stored under it is never read again and expires after ttl_seconds.
+    The store's client is synchronous, so each method runs its round trips in the threadpool.
+    """
+
+    def __init__(
+        self,
+        /,
+        store: core.KeyValueStore,
+        *,
+        ttl_seconds: int,
+        key_prefix: str = "todo-api:user:",
+        metrics: typing.Optional[core.CacheMetrics] = None,
+    ):
+        self._store = store
+        self._ttl_seconds = ttl_seconds
+        self._key_prefix = key_prefix
+        self.metrics = metrics or core.CacheMetrics()
+
+    async def get(self, /, username: str) -> typing.Optional[domain.User]:
+        return await run_in_threadpool(self._get, username)
+
+    async def version(self, /, username: str) -> str:
+        return await run_in_threadpool(self._version, username)
+
+    async def set(self, /, user: domain.User, *, version: str) -> None:
+        await run_in_threadpool(
+            self._store.set, self._key(user.username, version), user.json().encode(), ex=self._ttl_seconds
+        )
+
+    async def delete(self, /, username: str) -> None:
+        await run_in_threadpool(self._store.delete, self._version_key(username))
+
+    def _get(self, username: str, /) -> typing.Optional[domain.User]:
+        if (version := self._store.get(self._version_key(username))) is None or (
+            value := self._store.get(self._key(username, version.decode()))
+        ) is None:
+            self.metrics.miss()
+            return None
+        self.metrics.hit()
+        return domain.User.parse_raw(value)
+
+    def _version(self, username: str, /) -> str:
+        if (version := self._store.get(self._version_key(username))) is not None:
+            return version.decode()
+        new_version = uuid.uuid4().hex
+        self._store.set(self._version_key(username), new_version.encode(), ex=self._ttl_seconds)
+        return new_version
+
+    def _version_key(self, username: str, /) -> str:
+        return f"{self._key_prefix}{username}:version"
+
+    def _key(self, username: str, version: str, /) -> str:
+        return f"{self._key_prefix}{username}:{version}"
@@ -9,6 +9,7 @@ from src.auth import domain
 __all__ = ("SqlalchemyUserRepository",)
 
 
+@core.metered
 class SqlalchemyUserRepository(domain.UserRepo):
     def __init__(self, /, session: orm.Session):
         self._session = session
@@ -2,5 +2,6 @@ from src.auth.domain.password_hash_service import *
 from src.auth.domain.token import *
 from src.auth.domain.token_service import *
 from src.auth.domain.user import *
+from src.auth.domain.user_cache import *
 from src.auth.domain.user_repository import *
 from src.auth.domain.user_service import *
@@ -9,9 +9,12 @@ __all__ = ("PasswordHashService",)
 
 class PasswordHashService(abc.ABC):
     @abc.abstractmethod
-    def create(self, /, plain_password: pydantic.SecretStr) -> str:
+    async def create(self, /, plain_password: pydantic.SecretStr) -> str:
         raise NotImplementedError
 
     @abc.abstractmethod
-    def verify(self, *, hashed_password: str, plain_password: pydantic.SecretStr) -> bool:
+    async def verify(self, *, hashed_password: str, plain_password: pydantic.SecretStr) -> bool:
         raise NotImplementedError
+
+    def close(self) -> None:
+        pass
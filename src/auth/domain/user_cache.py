@@ -0,0 +1,32 @@
+import abc
+import typing
+
+from src.auth import domain
+
+__all__ = ("UserCache",)
+
+
+class UserCache(abc.ABC):
+    """Users by username
+
+    Readers take the username's version before they read the user and hand it to set, so a user read before a
+    delete can't be stored after the delete, as with TodoListCache.  The methods are coroutines so that a cache
+    kept on another server can be reached without blocking the event loop.
+    """
+
+    @abc.abstractmethod
+    async def get(self, /, username: str) -> typing.Optional[domain.User]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def version(self, /, username: str) -> str:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def set(self, /, user: domain.User, *, version: str) -> None:
+        """Store user, unless its username was deleted since version was taken"""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def delete(self, /, username: str) -> None:
+        raise NotImplementedError
@@ -1,3 +1,5 @@
 from src.auth.service.bcrypt_password_hash_service import *
+from src.auth.service.cached_user_service import *
 from src.auth.service.jwt_token_service import *
+from src.auth.service.sqlalchemy_async_user_service import *
 from src.auth.service.sqlalchemy_user_service import *
@@ -1,17 +1,53 @@
+import asyncio
+import typing
+from concurrent import futures
+
 import pydantic
 from passlib import context as passlib_context
 
+from src import core
 from src.auth import domain
 
 __all__ = ("BcryptPasswordHashService",)
 
 
 class BcryptPasswordHashService(domain.PasswordHashService):
-    def __init__(self) -> None:
-        self._context = passlib_context.CryptContext(schemes=["bcrypt"], deprecated="auto")
+    """Hashes on a pool of max_workers threads, which bcrypt can use in parallel since it releases the GIL
+
+    Once max_pending hashes are running or queued, further calls raise ServiceBusy straight away rather than
+    queue behind them.
+    """
+
+    def __init__(self, *, rounds: int = 12, max_workers: int = 2, max_pending: int = 32) -> None:
+        self._context = passlib_context.CryptContext(
+            schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds
+        )
+        self._executor = futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self._max_pending = max_pending
+        self._pending = 0
+
+    async def create(self, /, plain_password: pydantic.SecretStr) -> str:
+        return await self._run(self._context.hash, plain_password.get_secret_value())
+
+    async def verify(self, *, hashed_password: str, plain_password: pydantic.SecretStr) -> bool:
+        return await self._run(self._context.verify, plain_password.get_secret_value(), hashed_password)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, fn: typing.Callable[..., typing.Any], /, *args: typing.Any) -> typing.Any:
+        if self._pending >= self._max_pending:
+            raise core.exception.ServiceBusy(
+                f"There are already {self._pending} passwords waiting to be hashed."
+            )
+        self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, _timed, fn, *args)
+        finally:
+            self._pending -= 1
 
-    def create(self, /, plain_password: pydantic.SecretStr) -> str:
-        return self._context.hash(plain_password.get_secret_value())
 
-    def verify(self, *, hashed_password: str, plain_password: pydantic.SecretStr) -> bool:
-        return self._context.verify(plain_password.get_secret_value(), hashed_password)
+def _timed(fn: typing.Callable[..., typing.Any], /, *args: typing.Any) -> typing.Any:
+    # runs on the pool, so the time spent waiting for a thread isn't counted
+    with core.metrics.password_hash_seconds.time(operation=fn.__name__):
+        return fn(*args)
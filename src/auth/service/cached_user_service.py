@@ -0,0 +1,37 @@
+import pydantic
+
+from src.auth import domain
+
+__all__ = ("CachedUserService",)
+
+
+class CachedUserService(domain.UserService):
+    """Serves get_user from a UserCache and drops a user from it whenever the user is created or removed"""
+
+    def __init__(self, /, user_service: domain.UserService, *, cache: domain.UserCache):
+        self._user_service = user_service
+        self._cache = cache
+
+    async def create_user(
+        self,
+        *,
+        username: str,
+        email: pydantic.EmailStr,
+        password_hash: str,
+    ) -> domain.User:
+        await self._cache.delete(username)
+        return await self._user_service.create_user(
+            username=username, email=email, password_hash=password_hash
+        )
+
+    async def get_user(self, /, username: str) -> domain.User:
+        if user := await self._cache.get(username):
+            return user
+        version = await self._cache.version(username)
+        user = await self._user_service.get_user(username)
+        await self._cache.set(user, version=version)
+        return user
+
+    async def remove_user(self, /, username: str) -> None:
+        await self._user_service.remove_user(username)
+        await self._cache.delete(username)
@@ -1,4 +1,7 @@
+import collections
 import datetime
+import threading
+import time
 import typing
 
 import jwt
@@ -11,16 +14,30 @@ __all__ = ("JwtTokenService",)
 
 
 class JwtTokenService(domain.TokenService):
+    """Creates and verifies tokens
+
+    Verified claims are kept in an LRU cache of up to decode_cache_size tokens until their exp, since clients
+    send the same bearer token on every request.  A decode_cache_size of 0 turns the cache off.
+    """
+
     def __init__(
         self,
         *,
         secret_key: Secret,
         expires_delta: datetime.timedelta,
         algorithm: str,
+        decode_cache_size: int = 0,
+        clock: typing.Callable[[], float] = time.time,
     ):
         self._secret_key = secret_key
         self._expires_delta = expires_delta
         self._algorithm = algorithm
+        self._decode_cache_size = decode_cache_size
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._decoded: typing.OrderedDict[str, typing.Dict[str, typing.Any]] = collections.OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def create(self, /, data: typing.Dict[str, typing.Any]) -> domain.Token:
         expire = datetime.datetime.utcnow() + self._expires_delta
@@ -36,8 +53,55 @@ class JwtTokenService(domain.TokenService):
         )
 
     def username(self, /, token: str) -> str:
+        payload = self._cached_claims(token)
+        if payload is None:
+            payload = self._decode(token)
+            self._cache_claims(token, payload)
+
+        username: typing.Optional[str] = payload.get("sub")
+        if username is None:
+            raise core.exception.MalformedTokenException(
+                "Token is missing a 'sub' key."
+            )
+        else:
+            return username
+
+    def cache_info(self) -> typing.Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.cache_hits,
+                "misses": self.cache_misses,
+                "size": len(self._decoded),
+                "max_size": self._decode_cache_size,
+            }
+
+    def _cached_claims(self, token: str, /) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        if not self._decode_cache_size:
+            return None
+        with self._lock:
+            payload = self._decoded.get(token)
+            if payload is not None and payload["exp"] <= self._clock():
+                # let jwt.decode raise the usual expired signature error
+                del self._decoded[token]
+                payload = None
+            if payload is None:
+                self.cache_misses += 1
+                return None
+            self._decoded.move_to_end(token)
+            self.cache_hits += 1
+            return payload
+
+    def _cache_claims(self, token: str, payload: typing.Dict[str, typing.Any], /) -> None:
+        if not self._decode_cache_size or not isinstance(payload.get("exp"), (int, float)):
+            return
+        with self._lock:
+            self._decoded[token] = payload
+            while len(self._decoded) > self._decode_cache_size:
+                self._decoded.popitem(last=False)
+
+    def _decode(self, token: str, /) -> typing.Dict[str, typing.Any]:
         try:
-            payload: typing.Dict[str, typing.Any] = jwt.decode(
+            return jwt.decode(
                 jwt=token,
                 key=str(self._secret_key),
                 # key self._secret_key.get_secret_value(),
@@ -47,11 +111,3 @@ class JwtTokenService(domain.TokenService):
             raise core.exception.AuthException(
                 f"An error occurred when decoding the jwt token: {e}."
             )
-
-        username: typing.Optional[str] = payload.get("sub")
-        if username is None:
-            raise core.exception.MalformedTokenException(
-                "Token is missing a 'sub' key."
-            )
-        else:
-            return username
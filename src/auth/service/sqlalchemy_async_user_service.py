@@ -0,0 +1,56 @@
+import typing
+
+import pydantic
+from sqlalchemy import orm
+
+from src import core
+from src.auth import domain, adapter
+
+__all__ = ("SqlalchemyAsyncUserService",)
+
+T = typing.TypeVar("T")
+
+
+class SqlalchemyAsyncUserService(domain.UserService):
+    def __init__(self, /, uow: core.SqlAlchemyAsyncUnitOfWork):
+        self._uow = uow
+
+    async def create_user(
+        self,
+        *,
+        username: str,
+        email: pydantic.EmailStr,
+        password_hash: str,
+    ) -> domain.User:
+        async with self._uow:
+            if await self._run(lambda repo: repo.get_user(username)):
+                raise core.exception.UserAlreadyExists(
+                    f"The username {username!r} is already in use."
+                )
+
+            new_user = await self._run(
+                lambda repo: repo.add_user(
+                    username=username, email=email, password_hash=password_hash
+                )
+            )
+            await self._uow.commit()
+            return new_user
+
+    async def get_user(self, /, username: str) -> domain.User:
+        async with self._uow.read_only():
+            maybe_user = await self._run(lambda repo: repo.get_user(username))
+            if maybe_user is None:
+                raise core.exception.CredentialsException("User not found")
+            else:
+                return maybe_user
+
+    async def remove_user(self, /, username: str) -> None:
+        async with self._uow:
+            await self._run(lambda repo: repo.remove_user(username))
+            await self._uow.commit()
+
+    async def _run(self, fn: typing.Callable[[domain.UserRepo], T], /) -> T:
+        def run_with_repo(session: orm.Session) -> T:
+            return fn(adapter.SqlalchemyUserRepository(session))
+
+        return await self._uow.run_sync(run_with_repo)
@@ -1,45 +1,64 @@
+import typing
+
 import pydantic
+from starlette.concurrency import run_in_threadpool
 
 from src import core
 from src.auth import domain, adapter
 
 __all__ = ("SqlalchemyUserService",)
 
+T = typing.TypeVar("T")
+
 
 class SqlalchemyUserService(domain.UserService):
+    """Users over blocking SQLAlchemy sessions, each unit of work runs in the threadpool to keep the event loop free"""
+
     def __init__(self, /, uow: core.SqlAlchemyUnitOfWork):
         self._uow = uow
 
-    def create_user(
+    async def create_user(
         self,
         *,
         username: str,
         email: pydantic.EmailStr,
         password_hash: str,
     ) -> domain.User:
-        with self._uow:
-            if self._repo.get_user(username):
+        def add_user(repo: adapter.SqlalchemyUserRepository) -> None:
+            if repo.get_user(username):
                 raise core.exception.UserAlreadyExists(
                     f"The username {username!r} is already in use."
                 )
+            repo.add_user(username=username, email=email, password_hash=password_hash)
+
+        await self._write(add_user)
+        return await self.get_user(username)
+
+    async def get_user(self, /, username: str) -> domain.User:
+        maybe_user = await self._read(lambda repo: repo.get_user(username))
+        if maybe_user is None:
+            raise core.exception.CredentialsException("User not found")
+        else:
+            return maybe_user
+
+    async def remove_user(self, /, username: str) -> None:
+        await self._write(lambda repo: repo.remove_user(username))
+
+    async def _read(self, fn: typing.Callable[[adapter.SqlalchemyUserRepository], T], /) -> T:
+        def read() -> T:
+            with self._uow.read_only():
+                return fn(self._repo)
+
+        return await run_in_threadpool(read)
+
+    async def _write(self, fn: typing.Callable[[adapter.SqlalchemyUserRepository], T], /) -> T:
+        def write() -> T:
+            with self._uow:
+                result = fn(self._repo)
+                self._uow.commit()
+                return result
 
-            self._repo.add_user(
-                username=username, email=email, password_hash=password_hash
-            )
-            self._uow.commit()
-            return self.get_user(username)
-
-    def get_user(self, /, username: str) -> domain.User:
-        with self._uow:
-            maybe_user = self._repo.get_user(username)
-            if maybe_user is None:
-                raise core.exception.CredentialsException("User not found")
-            else:
-                return maybe_user
-
-    def remove_user(self, /, username: str) -> None:
-        with self._uow:
-            return self._repo.remove_user(username)
+        return await run_in_threadpool(write)
 
     @property
     def _repo(self) -> adapter.SqlalchemyUserRepository:
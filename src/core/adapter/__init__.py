@@ -1,4 +1,12 @@
+from src.core.adapter.cache_metrics import *
 from src.core.adapter.db_schema import *
 from src.core.adapter.environ_config import *
+from src.core.adapter.in_memory_key_value_store import *
 from src.core.adapter.logger import *
+from src.core.adapter.metrics import *
+from src.core.adapter.migrations import *
+from src.core.adapter.pool_metrics import *
+from src.core.adapter.query_log import *
+from src.core.adapter.sql_functions import *
+from src.core.adapter.sqlalchemy_async_unit_of_work import *
 from src.core.adapter.sqlalchemy_unit_of_work import *
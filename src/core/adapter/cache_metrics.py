@@ -0,0 +1,25 @@
+import threading
+import typing
+
+__all__ = ("CacheMetrics",)
+
+
+class CacheMetrics:
+    """Hits and misses of a cache, counted by the cache on every get"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def hit(self) -> None:
+        with self._lock:
+            self.hits += 1
+
+    def miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def as_dict(self) -> typing.Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
@@ -20,7 +20,12 @@ Base = declarative_base()
 
 class TodoDTO(Base):
     __tablename__ = "todo"
-    __table_args__ = {"schema": "todo"}
+    __table_args__ = (
+        # keep in sync with the migrations
+        sa.Index("ix_todo_user_id_category_display_from_date", "user_id", "category", "display_from_date"),
+        sa.Index("ix_todo_user_id_date_completed", "user_id", "date_completed"),
+        {"schema": "todo"},
+    )
 
     todo_id = sa.Column(sa.Integer, sa.Sequence("todo_id_seq"), primary_key=True)
     user_id = sa.Column(sa.Integer, sa.ForeignKey("auth.user.user_id"))
@@ -38,6 +43,9 @@ class TodoDTO(Base):
     week_number = sa.Column(sa.Integer, nullable=True)
     year = sa.Column(sa.Integer, nullable=True)
     frequency = sa.Column(sa.Enum(domain.FrequencyDbName), nullable=False)
+    next_due_date = sa.Column(sa.Date, nullable=True)
+    display_from_date = sa.Column(sa.Date, nullable=True)
+    due_dates_as_of = sa.Column(sa.Date, nullable=True)
 
     # user = orm.relationship(UserDTO, back_populates="todos")
 
@@ -50,7 +58,9 @@ class TodoDTO(Base):
             f"date_added={self.date_added!r}, date_completed={self.date_completed!r}, days={self.days}, "
             f"description={self.description!r}, mont={self.month}, mont_day={self.month_day}, note={self.note!r}, "
             f"start_date={self.start_date!r}, category={self.start_date!r}, week_day={self.week_day!r}, "
-            f"week_number={self.week_number}, year={self.year}, frequency={self.frequency!r})"
+            f"week_number={self.week_number}, year={self.year}, frequency={self.frequency!r}, "
+            f"next_due_date={self.next_due_date!r}, display_from_date={self.display_from_date!r}, "
+            f"due_dates_as_of={self.due_dates_as_of!r})"
         )
 
 
@@ -1,9 +1,11 @@
 import typing
+import zoneinfo
 
 from starlette.config import Config
 from starlette.datastructures import Secret, URL, CommaSeparatedStrings
 
 from src.core import domain
+from src.core.domain import exception
 
 __all__ = ("EnvironConfig",)
 
@@ -20,6 +22,14 @@ class EnvironConfig(domain.Config):
             default="",
         )
 
+    @property
+    def async_db(self) -> bool:
+        return self._config("ASYNC_DB", cast=bool, default=False)
+
+    @property
+    def bcrypt_rounds(self) -> int:
+        return self._config("BCRYPT_ROUNDS", cast=int, default=12)
+
     @property
     def debug(self) -> bool:
         return self._config("DEBUG", cast=bool, default=False)
@@ -28,6 +38,72 @@ class EnvironConfig(domain.Config):
     def db_url(self) -> URL:
         return self._config("DB_URL", cast=URL)
 
+    @property
+    def db_isolation_level(self) -> str:
+        return self._config("DB_ISOLATION_LEVEL", default="REPEATABLE READ")
+
+    @property
+    def db_read_isolation_level(self) -> str:
+        return self._config("DB_READ_ISOLATION_LEVEL", default="READ COMMITTED")
+
+    @property
+    def db_max_overflow(self) -> int:
+        return self._config("DB_MAX_OVERFLOW", cast=int, default=10)
+
+    @property
+    def db_pool_class(self) -> typing.Literal["queue", "null"]:
+        pool_class = self._config("DB_POOL_CLASS", default="queue").lower()
+        if pool_class not in ("queue", "null"):
+            raise exception.InvalidConfigurationSetting(
+                "DB_POOL_CLASS",
+                f"DB_POOL_CLASS must be either 'queue' or 'null', but got {pool_class!r}.",
+            )
+        return pool_class
+
+    @property
+    def db_pool_pre_ping(self) -> bool:
+        return self._config("DB_POOL_PRE_PING", cast=bool, default=False)
+
+    @property
+    def db_pool_recycle_seconds(self) -> int:
+        return self._config("DB_POOL_RECYCLE_SECONDS", cast=int, default=-1)
+
+    @property
+    def db_pool_size(self) -> int:
+        return self._config("DB_POOL_SIZE", cast=int, default=5)
+
+    @property
+    def db_pool_timeout_seconds(self) -> int:
+        return self._config("DB_POOL_TIMEOUT_SECONDS", cast=int, default=30)
+
+    @property
+    def db_statement_timeout_ms(self) -> int:
+        return self._config("DB_STATEMENT_TIMEOUT_MS", cast=int, default=0)
+
+    @property
+    def holiday_calendar_years(self) -> int:
+        return self._config("HOLIDAY_CALENDAR_YEARS", cast=int, default=20)
+
+    @property
+    def jwt_decode_cache_size(self) -> int:
+        return self._config("JWT_DECODE_CACHE_SIZE", cast=int, default=10_000)
+
+    @property
+    def metrics_enabled(self) -> bool:
+        return self._config("METRICS_ENABLED", cast=bool, default=False)
+
+    @property
+    def password_hash_max_pending(self) -> int:
+        return self._config("PASSWORD_HASH_MAX_PENDING", cast=int, default=32)
+
+    @property
+    def password_hash_workers(self) -> int:
+        return self._config("PASSWORD_HASH_WORKERS", cast=int, default=2)
+
+    @property
+    def redis_url(self) -> typing.Optional[str]:
+        return self._config("REDIS_URL", default=None)
+
     @property
     def secret_key(self) -> Secret:
         return self._config("SECRET_KEY", cast=Secret)
@@ -35,3 +111,58 @@ class EnvironConfig(domain.Config):
     @property
     def access_token_expire_minutes(self) -> int:
         return self._config("ACCESS_TOKEN_EXPIRE_MINUTES", cast=int, default=120)
+
+    @property
+    def slow_query_ms(self) -> int:
+        return self._config("SLOW_QUERY_MS", cast=int, default=500)
+
+    @property
+    def timezone(self) -> typing.Optional[str]:
+        timezone = self._config("TIMEZONE", default=None)
+        if timezone:
+            try:
+                zoneinfo.ZoneInfo(timezone)
+            except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+                raise exception.InvalidConfigurationSetting(
+                    "TIMEZONE", f"TIMEZONE must be an IANA timezone name, but got {timezone!r}."
+                )
+        return timezone or None
+
+    @property
+    def todo_list_cache(self) -> typing.Literal["memory", "redis", "none"]:
+        # a memory cache is per worker process, and a write only invalidates it in the worker that took the write,
+        # so without a shared store the lists aren't cached unless TODO_LIST_CACHE=memory asks for it
+        default = "redis" if self.redis_url else "none"
+        todo_list_cache = self._config("TODO_LIST_CACHE", default=default).lower()
+        if todo_list_cache not in ("memory", "redis", "none"):
+            raise exception.InvalidConfigurationSetting(
+                "TODO_LIST_CACHE",
+                f"TODO_LIST_CACHE must be one of 'memory', 'redis' or 'none', but got {todo_list_cache!r}.",
+            )
+        return todo_list_cache
+
+    @property
+    def todo_list_cache_max_size(self) -> int:
+        return self._config("TODO_LIST_CACHE_MAX_SIZE", cast=int, default=10_000)
+
+    @property
+    def todo_list_cache_ttl_seconds(self) -> int:
+        return self._config("TODO_LIST_CACHE_TTL_SECONDS", cast=int, default=300)
+
+    @property
+    def user_cache(self) -> typing.Literal["memory", "redis", "none"]:
+        user_cache = self._config("USER_CACHE", default="memory").lower()
+        if user_cache not in ("memory", "redis", "none"):
+            raise exception.InvalidConfigurationSetting(
+                "USER_CACHE",
+                f"USER_CACHE must be one of 'memory', 'redis' or 'none', but got {user_cache!r}.",
+            )
+        return user_cache
+
+    @property
+    def user_cache_max_size(self) -> int:
+        return self._config("USER_CACHE_MAX_SIZE", cast=int, default=10_000)
+
+    @property
+    def user_cache_ttl_seconds(self) -> int:
+        return self._config("USER_CACHE_TTL_SECONDS", cast=int, default=60)
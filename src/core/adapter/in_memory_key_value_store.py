@@ -0,0 +1,46 @@
+import threading
+import time
+import typing
+
+from src.core import domain
+
+__all__ = ("InMemoryKeyValueStore", "key_value_store")
+
+
+class InMemoryKeyValueStore:
+    """In-process stand-in for a redis server, for local development and tests"""
+
+    def __init__(self, *, clock: typing.Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._values: typing.Dict[str, typing.Tuple[typing.Optional[float], bytes]] = {}
+
+    def get(self, name: str) -> typing.Optional[bytes]:
+        with self._lock:
+            if (entry := self._values.get(name)) is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= self._clock():
+                del self._values[name]
+                return None
+            return value
+
+    def set(self, name: str, value: bytes, ex: typing.Optional[int] = None) -> bool:
+        with self._lock:
+            expires_at = None if ex is None else self._clock() + ex
+            self._values[name] = (expires_at, value)
+        return True
+
+    def delete(self, *names: str) -> int:
+        with self._lock:
+            return sum(self._values.pop(name, None) is not None for name in names)
+
+
+def key_value_store(url: str, /) -> domain.KeyValueStore:
+    """memory:// gives an InMemoryKeyValueStore, anything else is handed to redis, which must be installed"""
+    if url.startswith("memory://"):
+        return InMemoryKeyValueStore()
+
+    import redis  # type: ignore
+
+    return redis.Redis.from_url(url)
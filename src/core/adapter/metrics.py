@@ -0,0 +1,281 @@
+import bisect
+import contextlib
+import contextvars
+import functools
+import inspect
+import threading
+import time
+import typing
+
+import sqlalchemy as sa
+
+__all__ = ("Counter", "Gauge", "Histogram", "Metrics", "metered", "metrics")
+
+Labels = typing.Tuple[typing.Tuple[str, str], ...]
+
+F = typing.TypeVar("F", bound=typing.Callable[..., typing.Any])
+
+# the prometheus client's defaults, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+# the repository method running in this context, which the queries it sends are counted under
+_operation: contextvars.ContextVar[typing.Tuple[str, str]] = contextvars.ContextVar(
+    "operation", default=("", "")
+)
+
+
+class Counter:
+    def __init__(self, /, registry: "Metrics", name: str, help: str):
+        self._registry = registry
+        self.name = name
+        self.help = help
+        self._lock = threading.Lock()
+        self._values: typing.Dict[Labels, float] = {}
+
+    def inc(self, /, amount: float = 1, **labels: str) -> None:
+        if not self._registry.enabled:
+            return
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, /, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(tuple(sorted(labels.items())), 0)
+
+    def render(self) -> typing.Iterator[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} counter"
+        with self._lock:
+            values = list(self._values.items())
+        for labels, value in values:
+            yield f"{self.name}{_format_labels(labels)} {_format_value(value)}"
+
+
+class Gauge:
+    """Read from fn when the metrics are rendered, for values that something else already keeps
+
+    kind is "counter" for totals that only go up, so prometheus treats them as such.
+    """
+
+    def __init__(
+        self,
+        /,
+        name: str,
+        help: str,
+        fn: typing.Callable[[], float],
+        kind: typing.Literal["gauge", "counter"] = "gauge",
+    ):
+        self.name = name
+        self.help = help
+        self._fn = fn
+        self._kind = kind
+
+    def render(self) -> typing.Iterator[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} {self._kind}"
+        yield f"{self.name} {_format_value(self._fn())}"
+
+
+class Histogram:
+    def __init__(
+        self,
+        /,
+        registry: "Metrics",
+        name: str,
+        help: str,
+        buckets: typing.Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self._registry = registry
+        self.name = name
+        self.help = help
+        self._buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # per label set, the observations per bucket (the last one is +Inf), their sum and their count
+        self._values: typing.Dict[Labels, typing.Tuple[typing.List[int], float, int]] = {}
+
+    def observe(self, /, value: float, **labels: str) -> None:
+        if not self._registry.enabled:
+            return
+        key = tuple(sorted(labels.items()))
+        index = bisect.bisect_left(self._buckets, value)
+        with self._lock:
+            counts, total, count = self._values.get(key) or ([0] * (len(self._buckets) + 1), 0.0, 0)
+            counts[index] += 1
+            self._values[key] = (counts, total + value, count + 1)
+
+    @contextlib.contextmanager
+    def time(self, /, **labels: str) -> typing.Iterator[None]:
+        if not self._registry.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, /, **labels: str) -> int:
+        with self._lock:
+            entry = self._values.get(tuple(sorted(labels.items())))
+            return 0 if entry is None else entry[2]
+
+    def render(self) -> typing.Iterator[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} histogram"
+        with self._lock:
+            values = [(labels, list(counts), total, count) for labels, (counts, total, count) in self._values.items()]
+        for labels, counts, total, count in values:
+            cumulative = 0
+            for bound, bucket_count in zip((*self._buckets, float("inf")), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                yield f"{self.name}_bucket{_format_labels(labels + (('le', le),))} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}"
+            yield f"{self.name}_count{_format_labels(labels)} {count}"
+
+
+class Metrics:
+    """Metrics of this process in the prometheus text format
+
+    Nothing is recorded until enable() is called, so instrumented code costs a flag check when metrics are off.
+    Each worker process has its own values, which prometheus sums when it scrapes every worker.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._metrics: typing.Dict[str, typing.Union[Counter, Gauge, Histogram]] = {}
+
+        self.db_queries = self.counter(
+            "todo_api_db_queries_total", "Statements sent to the database, per repository method"
+        )
+        self.db_query_seconds = self.histogram(
+            "todo_api_db_query_seconds",
+            "Time the database took to run a statement, per repository method",
+            buckets=QUERY_BUCKETS,
+        )
+        self.repository_seconds = self.histogram(
+            "todo_api_repository_seconds", "Time spent in a repository method, queries included"
+        )
+        self.request_seconds = self.histogram(
+            "todo_api_request_seconds", "Time to respond to a request, per route and status code"
+        )
+        self.password_hash_seconds = self.histogram(
+            "todo_api_password_hash_seconds", "Time bcrypt took to create or verify a hash, without queueing"
+        )
+        self.due_dates_seconds = self.histogram(
+            "todo_api_due_dates_seconds",
+            "Time to evaluate the due dates of a batch of todos",
+            buckets=QUERY_BUCKETS,
+        )
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def counter(self, /, name: str, help: str) -> Counter:
+        return self._register(Counter(self, name, help))  # type: ignore
+
+    def gauge(
+        self,
+        /,
+        name: str,
+        help: str,
+        fn: typing.Callable[[], float],
+        kind: typing.Literal["gauge", "counter"] = "gauge",
+    ) -> Gauge:
+        """Register fn under name, replacing whatever was registered there before"""
+        gauge = Gauge(name, help, fn, kind)
+        with self._lock:
+            self._metrics[name] = gauge
+        return gauge
+
+    def histogram(self, /, name: str, help: str, buckets: typing.Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(self, name, help, buckets))  # type: ignore
+
+    def listen(self, /, engine: sa.engine.Engine) -> None:
+        """Count and time every statement the engine sends, under the repository method that sent it"""
+        sa.event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        sa.event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(line for metric in metrics for line in metric.render()) + "\n"
+
+    def _register(
+        self, metric: typing.Union[Counter, Histogram], /
+    ) -> typing.Union[Counter, Gauge, Histogram]:
+        with self._lock:
+            # modules are only imported once, but keep a second registration from resetting the values
+            return self._metrics.setdefault(metric.name, metric)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):  # type: ignore
+        if self.enabled:
+            conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):  # type: ignore
+        if not self.enabled or not (started := conn.info.get("query_started_at")):
+            return
+        elapsed = time.perf_counter() - started.pop()
+        repository, method = _operation.get()
+        labels = {"repository": repository or "none", "method": method or "none"}
+        self.db_queries.inc(**labels)
+        self.db_query_seconds.observe(elapsed, **labels)
+
+
+metrics = Metrics()
+
+
+def metered(cls: typing.Type[typing.Any]) -> typing.Type[typing.Any]:
+    """Class decorator timing the public methods of a repository and labelling the queries they send
+
+    Generator methods are left alone, their body only runs once the caller iterates, after the wrapper returned.
+    """
+    for name, attr in list(vars(cls).items()):
+        if not name.startswith("_") and inspect.isfunction(attr) and not inspect.isgeneratorfunction(attr):
+            setattr(cls, name, _metered_method(attr, repository=cls.__name__, method=name))
+    return cls
+
+
+def current_operation() -> typing.Tuple[str, str]:
+    """The repository and method whose queries are running, or empty strings outside a @metered method"""
+    return _operation.get()
+
+
+def _metered_method(fn: F, /, *, repository: str, method: str) -> F:
+    @functools.wraps(fn)
+    def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        # the operation is set with metrics off too, so the query log can say which method sent a slow query
+        token = _operation.set((repository, method))
+        if not metrics.enabled:
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _operation.reset(token)
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            metrics.repository_seconds.observe(
+                time.perf_counter() - start, repository=repository, method=method
+            )
+            _operation.reset(token)
+
+    return wrapper  # type: ignore
+
+
+def _format_labels(labels: Labels, /) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _escape(value: str, /) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float, /) -> str:
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
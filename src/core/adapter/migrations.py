@@ -0,0 +1,150 @@
+"""Versioned schema migrations
+
+Each migration runs once, in version order, and is recorded in the schema_version table.  Migrations must
+be idempotent so that databases created by Base.metadata.create_all before versioning existed upgrade cleanly.
+"""
+from __future__ import annotations
+
+import datetime
+import typing
+
+import sqlalchemy as sa
+
+from src.core import domain
+from src.core.adapter.logger import logger as _root_logger
+
+__all__ = (
+    "MIGRATIONS",
+    "Migration",
+    "current_schema_version",
+    "migrate",
+)
+
+
+logger = _root_logger.getChild("migrations")
+
+
+class Migration(typing.NamedTuple):
+    version: int
+    description: str
+    upgrade: typing.Callable[[sa.engine.Connection], None]
+
+
+_version_metadata = sa.MetaData()
+
+_schema_version = sa.Table(
+    "schema_version",
+    _version_metadata,
+    sa.Column("version", sa.Integer, primary_key=True, autoincrement=False),
+    sa.Column("description", sa.Text, nullable=False),
+    sa.Column("applied_at", sa.DateTime, nullable=False),
+)
+
+# an arbitrary application-wide key for pg_advisory_xact_lock, shared by every worker that migrates
+_MIGRATION_LOCK_KEY = 8_172_604_531
+
+
+def _create_tables(con: sa.engine.Connection) -> None:
+    # a snapshot of the tables as first released, later migrations change it
+    if con.dialect.name == "postgresql":
+        con.execute(sa.text("CREATE SCHEMA IF NOT EXISTS auth"))
+        con.execute(sa.text("CREATE SCHEMA IF NOT EXISTS todo"))
+
+    metadata = sa.MetaData()
+    sa.Table(
+        "user",
+        metadata,
+        sa.Column("user_id", sa.Integer, sa.Sequence("user_id_seq"), primary_key=True),
+        sa.Column("username", sa.String, unique=True, nullable=False),
+        sa.Column("email", sa.String, nullable=False),
+        sa.Column("password_hash", sa.String, nullable=False),
+        schema="auth",
+    )
+    sa.Table(
+        "todo",
+        metadata,
+        sa.Column("todo_id", sa.Integer, sa.Sequence("todo_id_seq"), primary_key=True),
+        sa.Column("user_id", sa.Integer, sa.ForeignKey("auth.user.user_id")),
+        sa.Column("advance_days", sa.Integer, nullable=False),
+        sa.Column("date_added", sa.Date, nullable=False),
+        sa.Column("date_completed", sa.Date, nullable=True),
+        sa.Column("days", sa.Integer, nullable=True),
+        sa.Column("description", sa.Text, nullable=False),
+        sa.Column("month", sa.Integer, nullable=True),
+        sa.Column("month_day", sa.Integer, nullable=True),
+        sa.Column("note", sa.Text, nullable=False),
+        sa.Column("start_date", sa.Date, nullable=True),
+        sa.Column("category", sa.Enum(domain.TodoCategory), nullable=False),
+        sa.Column("week_day", sa.Integer, nullable=True),
+        sa.Column("week_number", sa.Integer, nullable=True),
+        sa.Column("year", sa.Integer, nullable=True),
+        sa.Column("frequency", sa.Enum(domain.FrequencyDbName), nullable=False),
+        schema="todo",
+    )
+    metadata.create_all(con, checkfirst=True)
+
+
+def _add_due_date_columns(con: sa.engine.Connection) -> None:
+    existing = {col["name"] for col in sa.inspect(con).get_columns("todo", schema="todo")}
+    for name in ("next_due_date", "display_from_date", "due_dates_as_of"):
+        if name not in existing:
+            con.execute(sa.text(f"ALTER TABLE todo.todo ADD COLUMN {name} DATE"))
+
+
+def _add_todo_indexes(con: sa.engine.Connection) -> None:
+    table = sa.Table("todo", sa.MetaData(), schema="todo", autoload_with=con)
+    existing = {ix["name"] for ix in sa.inspect(con).get_indexes("todo", schema="todo")}
+    for name, *columns in (
+        ("ix_todo_user_id_category_display_from_date", "user_id", "category", "display_from_date"),
+        ("ix_todo_user_id_date_completed", "user_id", "date_completed"),
+    ):
+        if name not in existing:
+            sa.Index(name, *(table.c[col] for col in columns)).create(con)
+
+
+MIGRATIONS: typing.Tuple[Migration, ...] = (
+    Migration(1, "Create the auth.user and todo.todo tables", _create_tables),
+    Migration(2, "Add the materialized due date columns to todo.todo", _add_due_date_columns),
+    Migration(3, "Add the per-user indexes to todo.todo", _add_todo_indexes),
+)
+
+
+def current_schema_version(con: sa.engine.Connection, /) -> int:
+    if not sa.inspect(con).has_table(_schema_version.name):
+        return 0
+    return con.execute(sa.select(sa.func.max(_schema_version.c.version))).scalar() or 0
+
+
+def migrate(
+    con: sa.engine.Connection,
+    /,
+    *,
+    migrations: typing.Sequence[Migration] = MIGRATIONS,
+    target_version: typing.Optional[int] = None,
+) -> int:
+    """Apply the pending migrations up to target_version (all of them by default) and return the new version
+
+    The caller owns the transaction, e.g. `with engine.begin() as con: migrate(con)`.  On postgres the run holds
+    a transaction-scoped advisory lock, so workers starting together apply each migration once: the ones that
+    wait read the version only after the first commits.  sqlite serializes writers on its own.
+    """
+    if con.dialect.name == "postgresql":
+        con.execute(sa.select(sa.func.pg_advisory_xact_lock(_MIGRATION_LOCK_KEY)))
+    _version_metadata.create_all(con, checkfirst=True)
+    version = current_schema_version(con)
+    for migration in sorted(migrations, key=lambda m: m.version):
+        if migration.version <= version:
+            continue
+        if target_version is not None and migration.version > target_version:
+            break
+        logger.info(f"Migrating the database to version {migration.version}: {migration.description}.")
+        migration.upgrade(con)
+        con.execute(
+            _schema_version.insert().values(
+                version=migration.version,
+                description=migration.description,
+                applied_at=datetime.datetime.utcnow(),
+            )
+        )
+        version = migration.version
+    return version
@@ -0,0 +1,64 @@
+import threading
+import time
+import typing
+
+import sqlalchemy as sa
+
+__all__ = ("PoolMetrics",)
+
+
+class PoolMetrics:
+    """Connection pool counters fed by SQLAlchemy pool events
+
+    checked_out_seconds is the total time connections spent outside the pool, which together with
+    peak_checked_out tells us whether DB_POOL_SIZE + DB_MAX_OVERFLOW fits the workload.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pool: typing.Optional[sa.pool.Pool] = None
+        self.connections_opened = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.checked_out = 0
+        self.peak_checked_out = 0
+        self.checked_out_seconds = 0.0
+
+    def listen(self, /, engine: sa.engine.Engine) -> None:
+        self._pool = engine.pool
+        sa.event.listen(engine, "connect", self._on_connect)
+        sa.event.listen(engine, "checkout", self._on_checkout)
+        sa.event.listen(engine, "checkin", self._on_checkin)
+
+    def as_dict(self) -> typing.Dict[str, typing.Union[int, float, str]]:
+        with self._lock:
+            return {
+                "connections_opened": self.connections_opened,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "checked_out": self.checked_out,
+                "peak_checked_out": self.peak_checked_out,
+                "checked_out_seconds": self.checked_out_seconds,
+                "status": self._pool.status() if self._pool else "",
+            }
+
+    def _on_connect(self, dbapi_connection: typing.Any, connection_record: typing.Any) -> None:
+        with self._lock:
+            self.connections_opened += 1
+
+    def _on_checkout(
+        self, dbapi_connection: typing.Any, connection_record: typing.Any, connection_proxy: typing.Any
+    ) -> None:
+        connection_record.info["checked_out_at"] = time.perf_counter()
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def _on_checkin(self, dbapi_connection: typing.Any, connection_record: typing.Any) -> None:
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        with self._lock:
+            self.checkins += 1
+            self.checked_out = max(self.checked_out - 1, 0)
+            if checked_out_at is not None:
+                self.checked_out_seconds += time.perf_counter() - checked_out_at
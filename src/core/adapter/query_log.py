@@ -0,0 +1,71 @@
+import collections
+import contextlib
+import contextvars
+import time
+import typing
+
+import sqlalchemy as sa
+
+from src.core.adapter.logger import logger as _root_logger
+from src.core.adapter.metrics import current_operation
+
+__all__ = ("Query", "QueryLog", "repeated_statements")
+
+logger = _root_logger.getChild("queries")
+
+
+class Query(typing.NamedTuple):
+    statement: str
+    seconds: float
+    repository: str
+    method: str
+
+
+class QueryLog:
+    """Statements sent by the engines it listens to, logging the ones slower than slow_query_ms
+
+    Inside record() every statement sent from the current context is appended to the list it yields, so a test or
+    the debug middleware can see how many queries a request ran.  A slow_query_ms of 0 turns the slow query log off.
+    """
+
+    def __init__(self, /, slow_query_ms: int = 0):
+        self.slow_query_seconds = slow_query_ms / 1000
+        self._queries: contextvars.ContextVar[typing.Optional[typing.List[Query]]] = contextvars.ContextVar(
+            "queries", default=None
+        )
+
+    def listen(self, /, engine: sa.engine.Engine) -> None:
+        sa.event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        sa.event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    @contextlib.contextmanager
+    def record(self) -> typing.Iterator[typing.List[Query]]:
+        queries: typing.List[Query] = []
+        token = self._queries.set(queries)
+        try:
+            yield queries
+        finally:
+            self._queries.reset(token)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):  # type: ignore
+        if self.slow_query_seconds or self._queries.get() is not None:
+            conn.info.setdefault("query_log_started_at", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):  # type: ignore
+        if not (started := conn.info.get("query_log_started_at")):
+            return
+        elapsed = time.perf_counter() - started.pop()
+        repository, method = current_operation()
+        if (queries := self._queries.get()) is not None:
+            queries.append(Query(statement=statement, seconds=elapsed, repository=repository, method=method))
+        if self.slow_query_seconds and elapsed >= self.slow_query_seconds:
+            logger.warning(
+                f"Slow query ({elapsed * 1000:.0f} ms) in {repository or 'unknown'}.{method or 'unknown'}: "
+                f"{' '.join(statement.split())}"
+            )
+
+
+def repeated_statements(queries: typing.Iterable[Query], /, *, at_least: int) -> typing.Dict[str, int]:
+    """Statements that ran at least at_least times, the usual sign of a query per row instead of one per request"""
+    counts = collections.Counter(query.statement for query in queries)
+    return {statement: count for statement, count in counts.items() if count >= at_least}
@@ -0,0 +1,30 @@
+import typing
+
+import sqlalchemy as sa
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import expression
+
+__all__ = ("days_between",)
+
+
+class days_between(expression.FunctionElement):
+    """Whole days from start to end, i.e. (end - start).days"""
+
+    type = sa.Integer()
+    name = "days_between"
+    inherit_cache = True
+
+
+@compiles(days_between)
+def _compile_days_between(element: days_between, compiler: typing.Any, **kw: typing.Any) -> str:
+    end, start = list(element.clauses)
+    return f"({compiler.process(end, **kw)} - {compiler.process(start, **kw)})"
+
+
+@compiles(days_between, "sqlite")
+def _compile_days_between_sqlite(element: days_between, compiler: typing.Any, **kw: typing.Any) -> str:
+    end, start = list(element.clauses)
+    return (
+        f"CAST(julianday({compiler.process(end, **kw)}) - "
+        f"julianday({compiler.process(start, **kw)}) AS INTEGER)"
+    )
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import types
+import typing
+
+from sqlalchemy import orm
+from sqlalchemy.ext import asyncio as sa_asyncio
+
+from src.core import domain
+
+__all__ = ("SqlAlchemyAsyncUnitOfWork",)
+
+T = typing.TypeVar("T")
+
+
+class SqlAlchemyAsyncUnitOfWork(domain.AsyncUnitOfWork):
+    def __init__(
+        self,
+        /,
+        session_factory: orm.sessionmaker,
+        *,
+        read_only_session_factory: typing.Optional[orm.sessionmaker] = None,
+    ):
+        self._session_factory = session_factory
+        self._read_only_session_factory = read_only_session_factory or session_factory
+        self._read_only = False
+        self._session: typing.Optional[sa_asyncio.AsyncSession] = None
+
+    def read_only(self) -> SqlAlchemyAsyncUnitOfWork:
+        self._read_only = True
+        return self
+
+    async def __aenter__(self) -> domain.AsyncUnitOfWork:
+        if self._read_only:
+            self._session = self._read_only_session_factory()
+        else:
+            self._session = self._session_factory()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: typing.Optional[typing.Type[BaseException]],
+        exc_val: typing.Optional[BaseException],
+        exc_tb: typing.Optional[types.TracebackType],
+    ) -> typing.Literal[False]:
+        self._read_only = False
+        await self.session.rollback()
+        await self.session.close()
+        return False
+
+    async def commit(self) -> None:
+        await self.session.commit()
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
+
+    async def run_sync(self, fn: typing.Callable[[orm.Session], T], /) -> T:
+        # The synchronous repositories run unchanged against the async driver.
+        return await self.session.run_sync(fn)
+
+    @property
+    def session(self) -> sa_asyncio.AsyncSession:
+        assert self._session is not None
+        return self._session
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import types
 import typing
 
@@ -9,11 +11,27 @@ __all__ = ("SqlAlchemyUnitOfWork",)
 
 
 class SqlAlchemyUnitOfWork(domain.UnitOfWork):
-    def __init__(self, /, session_factory: orm.sessionmaker):
+    def __init__(
+        self,
+        /,
+        session_factory: orm.sessionmaker,
+        *,
+        read_only_session_factory: typing.Optional[orm.sessionmaker] = None,
+    ):
         self._session_factory = session_factory
+        self._read_only_session_factory = read_only_session_factory or session_factory
+        self._read_only = False
+        self._session: typing.Optional[orm.Session] = None
+
+    def read_only(self) -> SqlAlchemyUnitOfWork:
+        self._read_only = True
+        return self
 
     def __enter__(self) -> domain.UnitOfWork:
-        self._session = self._session_factory()
+        if self._read_only:
+            self._session = self._read_only_session_factory()
+        else:
+            self._session = self._session_factory()
         return self
 
     def __exit__(
@@ -22,6 +40,7 @@ class SqlAlchemyUnitOfWork(domain.UnitOfWork):
         exc_val: typing.Optional[BaseException],
         exc_tb: typing.Optional[types.TracebackType],
     ) -> typing.Literal[False]:
+        self._read_only = False
         self.session.rollback()
         self.session.close()
         return False
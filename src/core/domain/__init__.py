@@ -1,6 +1,8 @@
 from src.core.domain import exception
+from src.core.domain.async_unit_of_work import *
 from src.core.domain.config import *
 from src.core.domain.frequency_db_name import *
+from src.core.domain.key_value_store import *
 from src.core.domain.todo_category import *
 from src.core.domain.unit_of_work import *
 from src.core.domain.value_object import *
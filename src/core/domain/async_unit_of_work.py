@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import abc
+import types
+import typing
+
+__all__ = ("AsyncUnitOfWork",)
+
+
+class AsyncUnitOfWork(abc.ABC):
+    @abc.abstractmethod
+    def read_only(self) -> AsyncUnitOfWork:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def __aenter__(self) -> AsyncUnitOfWork:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def __aexit__(
+        self,
+        exc_type: typing.Optional[typing.Type[BaseException]],
+        exc_val: typing.Optional[BaseException],
+        exc_tb: typing.Optional[types.TracebackType],
+    ) -> typing.Literal[False]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def commit(self) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def rollback(self) -> None:
+        raise NotImplementedError
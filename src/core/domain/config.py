@@ -28,6 +28,11 @@ __all__ = ("Config",)
 
 
 class Config(abc.ABC):
+    @property
+    @abc.abstractmethod
+    def async_db(self) -> bool:
+        raise NotImplementedError
+
     @property
     @abc.abstractmethod
     def allowed_hosts(self) -> typing.List[str]:
@@ -38,11 +43,91 @@ class Config(abc.ABC):
     def debug(self) -> bool:
         raise NotImplementedError
 
+    @property
+    @abc.abstractmethod
+    def bcrypt_rounds(self) -> int:
+        raise NotImplementedError
+
     @property
     @abc.abstractmethod
     def db_url(self) -> URL:
         raise NotImplementedError
 
+    @property
+    @abc.abstractmethod
+    def db_isolation_level(self) -> str:
+        raise NotImplementedError
+
+    @property
+    @abc.abstractmethod
+    def db_read_isolation_level(self) -> str:
+        raise NotImplementedError
+
+    @property
+    @abc.abstractmethod
+    def db_max_overflow(self) -> int:
+        raise NotImplementedError
+
+    @property
+    @abc.abstractmethod
+    def db_pool_class(self) -> typing.Literal["queue", "null"]:
+        raise NotImplementedError
+
+    @property
+    @abc.abstractmethod
+    def db_pool_pre_ping(self) -> bool:
+        raise NotImplementedError
+
+    @property
+    @abc.abstractmethod
+    def db_pool_recycle_seconds(self) -> int:
+        raise NotImplementedError
+
+    @property
+    @abc.abstractmethod
+    def db_pool_size(self) -> int:
+        raise NotImplementedError
+
+    @property
+    @abc.abstractmethod
+    def db_pool_timeout_seconds(self) -> int:
+        raise NotImplementedError
+
+    @property
+    @abc.abstractmethod
+    def db_statement_timeout_ms(self) -> int:
+        raise NotImplementedError
+
+    @property
+    @abc.abstractmethod
+    def holiday_calendar_years(self) -> int:
+        raise NotImplementedError
+
+    @property
+    @abc.abstractmethod
+    def jwt_decode_cache_size(self) -> int:
+        raise NotImplementedError
+
+    @property
+    @abc.abstractmethod
+    def metrics_enabled(self) -> bool:
+        raise NotImplementedError
+
+    @property
+    @abc.abstractmethod
+    def password_hash_max_pending(self) -> int:
+        raise NotImplementedError
+
+    @property
+    @abc.abstractmethod
+    def password_hash_workers(self) -> int:
+        raise NotImplementedError
+
+    @property
+    @abc.abstractmethod
+    def redis_url(self) -> typing.Optional[str]:
+        raise NotImplementedError
+
     @property
     @abc.abstractmethod
     def secret_key(self) -> Secret:
@@ -53,6 +138,46 @@ class Config(abc.ABC):
     def access_token_expire_minutes(self) -> int:
         raise NotImplementedError
 
+    @property
+    @abc.abstractmethod
+    def slow_query_ms(self) -> int:
+        raise NotImplementedError
+
+    @property
+    @abc.abstractmethod
+    def timezone(self) -> typing.Optional[str]:
+        raise NotImplementedError
+
+    @property
+    @abc.abstractmethod
+    def todo_list_cache(self) -> typing.Literal["memory", "redis", "none"]:
+        raise NotImplementedError
+
+    @property
+    @abc.abstractmethod
+    def todo_list_cache_max_size(self) -> int:
+        raise NotImplementedError
+
+    @property
+    @abc.abstractmethod
+    def todo_list_cache_ttl_seconds(self) -> int:
+        raise NotImplementedError
+
+    @property
+    @abc.abstractmethod
+    def user_cache(self) -> typing.Literal["memory", "redis", "none"]:
+        raise NotImplementedError
+
+    @property
+    @abc.abstractmethod
+    def user_cache_max_size(self) -> int:
+        raise NotImplementedError
+
+    @property
+    @abc.abstractmethod
+    def user_cache_ttl_seconds(self) -> int:
+        raise NotImplementedError
+
     @property
     def hashing_algorithm(self) -> str:
         return "HS256"
@@ -3,6 +3,7 @@ __all__ = (
     "AuthException",
     "CredentialsException",
     "InvalidConfigurationSetting",
+    "ServiceBusy",
     "UserNotFound",
 )
 
@@ -35,6 +36,10 @@ class TokenDecodeException(AuthException):
     ...
 
 
+class ServiceBusy(TodoApiException):
+    ...
+
+
 class UserNotFound(AuthException):
     ...
 
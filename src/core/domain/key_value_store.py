@@ -0,0 +1,16 @@
+import typing
+
+__all__ = ("KeyValueStore",)
+
+
+class KeyValueStore(typing.Protocol):
+    """The subset of the redis-py client that our caches use, so a redis.Redis can be passed in as is"""
+
+    def get(self, name: str) -> typing.Optional[bytes]:
+        ...
+
+    def set(self, name: str, value: bytes, ex: typing.Optional[int] = None) -> typing.Any:
+        ...
+
+    def delete(self, *names: str) -> typing.Any:
+        ...
@@ -8,6 +8,10 @@ __all__ = ("UnitOfWork",)
 
 
 class UnitOfWork(abc.ABC):
+    @abc.abstractmethod
+    def read_only(self) -> UnitOfWork:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def __enter__(self) -> UnitOfWork:
         raise NotImplementedError
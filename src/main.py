@@ -3,7 +3,7 @@ import uvicorn
 from fastapi import HTTPException
 from starlette.middleware.cors import CORSMiddleware
 
-from src import core, api
+from src import core, api, service_locator
 
 
 logger = core.logger.getChild("main")
@@ -19,11 +19,17 @@ def create_app() -> fastapi.FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
-    # app.add_event_handler("startup", create_start_app_handler(app))
-    # app.add_event_handler("shutdown", create_stop_app_handler(app))
+    app.add_event_handler("startup", service_locator.default().startup)
+    app.add_event_handler("shutdown", service_locator.default().shutdown)
     app.add_exception_handler(HTTPException, api.http_error_handler)
     # app.add_exception_handler(RequestValidationError, http422_error_handler)
     app.include_router(api.router, prefix="/api")
+    if config.debug:
+        app.add_middleware(api.QueryLogMiddleware, query_log=service_locator.default().query_log())
+    if config.metrics_enabled:
+        core.metrics.enable()
+        app.add_middleware(api.MetricsMiddleware)
+        app.include_router(api.routes.metrics.router)
     return app
 
 
@@ -0,0 +1,33 @@
+"""Nightly job that rolls the materialized todo due dates forward
+
+Run it shortly after midnight, e.g. from cron: python -m src.refresh_due_dates
+"""
+import asyncio
+import datetime
+
+from src import core, service_locator
+
+
+logger = core.logger.getChild("refresh_due_dates")
+
+
+async def refresh_due_dates(today: datetime.date, /) -> int:
+    locator = service_locator.default()
+    await locator.startup()
+    try:
+        return await locator.todo_service().refresh_due_dates(today=today)
+    finally:
+        await locator.shutdown()
+
+
+if __name__ == "__main__":
+    import logging
+
+    import dotenv
+
+    logging.basicConfig(level=logging.INFO)
+    dotenv.load_dotenv(dotenv.find_dotenv())
+
+    today = datetime.date.today()
+    updated = asyncio.run(refresh_due_dates(today))
+    logger.info(f"Refreshed the due dates of {updated} todos as of {today}.")
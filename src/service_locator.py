@@ -1,22 +1,41 @@
 import abc
 import datetime
 import functools
+import typing
+import zoneinfo
 
 import sqlalchemy as sa
-from sqlalchemy import orm
+from sqlalchemy import orm, pool
+from sqlalchemy.ext import asyncio as sa_asyncio
 
 from src import auth, todo, core
 
-__all__ = ("ServiceLocator", "default")
+__all__ = ("ServiceLocator", "default", "statement_timeout_connect_args")
 
 
 class ServiceLocator:
+    @abc.abstractmethod
+    def default_timezone(self) -> typing.Optional[datetime.tzinfo]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def holiday_calendar(self) -> todo.HolidayCalendar:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def password_hasher(self) -> auth.PasswordHashService:
         raise NotImplementedError
 
     @abc.abstractmethod
-    def todo_service(self) -> todo.SqlAlchemyTodoService:
+    def query_log(self) -> core.QueryLog:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def todo_list_cache(self) -> typing.Optional[todo.TodoListCache]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def todo_service(self) -> todo.TodoService:
         raise NotImplementedError
 
     @abc.abstractmethod
@@ -27,40 +46,320 @@ class ServiceLocator:
     def user_service(self) -> auth.UserService:
         raise NotImplementedError
 
+    async def startup(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
 
 class SqlAlchemyServiceLocator(ServiceLocator):
     def __init__(self, /, config: core.Config):
         self._config = config
 
     def token_service(self) -> auth.TokenService:
+        return self._token_service
+
+    @functools.cached_property
+    def _token_service(self) -> auth.JwtTokenService:
+        # shared by every request so that its decode cache is too
         expires_delta = datetime.timedelta(
             minutes=int(self._config.access_token_expire_minutes)
         )
-        return auth.JwtTokenService(
+        token_service = auth.JwtTokenService(
             secret_key=self._config.secret_key,
             expires_delta=expires_delta,
             algorithm=self._config.hashing_algorithm,
+            decode_cache_size=self._config.jwt_decode_cache_size,
+        )
+        core.metrics.gauge(
+            "todo_api_jwt_decode_cache_hits_total",
+            "Bearer tokens whose claims were served from the decode cache",
+            lambda: token_service.cache_hits,
+            kind="counter",
+        )
+        core.metrics.gauge(
+            "todo_api_jwt_decode_cache_misses_total",
+            "Bearer tokens that had to be decoded",
+            lambda: token_service.cache_misses,
+            kind="counter",
+        )
+        return token_service
+
+    def default_timezone(self) -> typing.Optional[datetime.tzinfo]:
+        return self._default_timezone
+
+    @functools.cached_property
+    def _default_timezone(self) -> typing.Optional[datetime.tzinfo]:
+        if timezone := self._config.timezone:
+            return zoneinfo.ZoneInfo(timezone)
+        return None
+
+    def holiday_calendar(self) -> todo.HolidayCalendar:
+        return self._holiday_calendar
+
+    @functools.cached_property
+    def _holiday_calendar(self) -> todo.HolidayCalendar:
+        this_year = datetime.date.today().year
+        return todo.HolidayCalendar(
+            first_year=this_year - 1, last_year=this_year + self._config.holiday_calendar_years
         )
 
     def password_hasher(self) -> auth.PasswordHashService:
-        return auth.BcryptPasswordHashService()
+        return self._password_hasher
 
-    def todo_service(self) -> todo.SqlAlchemyTodoService:
-        return todo.SqlAlchemyTodoService(self._uow)
+    async def shutdown(self) -> None:
+        if "_password_hasher" in self.__dict__:
+            self._password_hasher.close()
+
+    @functools.cached_property
+    def _password_hasher(self) -> auth.PasswordHashService:
+        return auth.BcryptPasswordHashService(
+            rounds=self._config.bcrypt_rounds,
+            max_workers=self._config.password_hash_workers,
+            max_pending=self._config.password_hash_max_pending,
+        )
+
+    def query_log(self) -> core.QueryLog:
+        return self._query_log
+
+    @functools.cached_property
+    def _query_log(self) -> core.QueryLog:
+        return core.QueryLog(slow_query_ms=self._config.slow_query_ms)
+
+    def todo_list_cache(self) -> typing.Optional[todo.TodoListCache]:
+        return self._todo_list_cache
+
+    def todo_service(self) -> todo.TodoService:
+        return self._cached_todos(todo.SqlAlchemyTodoService(self._uow()))
 
     def user_service(self) -> auth.UserService:
-        return auth.SqlalchemyUserService(self._uow)
+        return self._cached(auth.SqlalchemyUserService(self._uow()))
 
     @functools.cached_property
+    def user_cache(self) -> typing.Optional[auth.UserCache]:
+        if self._config.user_cache == "none":
+            return None
+        elif self._config.user_cache == "redis":
+            if not self._config.redis_url:
+                raise core.exception.InvalidConfigurationSetting(
+                    "REDIS_URL", "REDIS_URL is required when USER_CACHE is 'redis'."
+                )
+            return auth.KeyValueUserCache(
+                core.key_value_store(self._config.redis_url),
+                ttl_seconds=self._config.user_cache_ttl_seconds,
+                metrics=self._cache_metrics("user"),
+            )
+        else:
+            return auth.InMemoryUserCache(
+                max_size=self._config.user_cache_max_size,
+                ttl_seconds=self._config.user_cache_ttl_seconds,
+                metrics=self._cache_metrics("user"),
+            )
+
+    def _cached(self, user_service: auth.UserService, /) -> auth.UserService:
+        if self.user_cache is None:
+            return user_service
+        return auth.CachedUserService(user_service, cache=self.user_cache)
+
+    @functools.cached_property
+    def _todo_list_cache(self) -> typing.Optional[todo.TodoListCache]:
+        if self._config.todo_list_cache == "none":
+            return None
+        elif self._config.todo_list_cache == "redis":
+            if not self._config.redis_url:
+                raise core.exception.InvalidConfigurationSetting(
+                    "REDIS_URL", "REDIS_URL is required when TODO_LIST_CACHE is 'redis'."
+                )
+            return todo.KeyValueTodoListCache(
+                core.key_value_store(self._config.redis_url),
+                ttl_seconds=self._config.todo_list_cache_ttl_seconds,
+                metrics=self._cache_metrics("todo_list"),
+            )
+        else:
+            return todo.InMemoryTodoListCache(
+                max_size=self._config.todo_list_cache_max_size,
+                ttl_seconds=self._config.todo_list_cache_ttl_seconds,
+                metrics=self._cache_metrics("todo_list"),
+            )
+
+    def _cached_todos(self, todo_service: todo.TodoService, /) -> todo.TodoService:
+        if self._todo_list_cache is None:
+            return todo_service
+        return todo.CachedTodoService(todo_service, cache=self._todo_list_cache)
+
+    @staticmethod
+    def _cache_metrics(cache: typing.Literal["user", "todo_list"], /) -> core.CacheMetrics:
+        cache_metrics = core.CacheMetrics()
+        core.metrics.gauge(
+            f"todo_api_{cache}_cache_hits_total",
+            f"Lookups served from the {cache.replace('_', ' ')} cache",
+            lambda: cache_metrics.hits,
+            kind="counter",
+        )
+        core.metrics.gauge(
+            f"todo_api_{cache}_cache_misses_total",
+            f"Lookups the {cache.replace('_', ' ')} cache could not serve",
+            lambda: cache_metrics.misses,
+            kind="counter",
+        )
+        return cache_metrics
+
     def _uow(self) -> core.SqlAlchemyUnitOfWork:
+        # FastAPI resolves each service once per request, so every request gets its own unit of work.
+        return core.SqlAlchemyUnitOfWork(
+            self._session_factory,
+            read_only_session_factory=self._read_only_session_factory,
+        )
+
+    @functools.cached_property
+    def pool_metrics(self) -> core.PoolMetrics:
+        pool_metrics = core.PoolMetrics()
+        core.metrics.gauge(
+            "todo_api_db_pool_checked_out",
+            "Connections currently checked out of the pool",
+            lambda: pool_metrics.checked_out,
+        )
+        core.metrics.gauge(
+            "todo_api_db_pool_peak_checked_out",
+            "Most connections checked out of the pool at once",
+            lambda: pool_metrics.peak_checked_out,
+        )
+        core.metrics.gauge(
+            "todo_api_db_pool_checkouts_total",
+            "Connections checked out of the pool",
+            lambda: pool_metrics.checkouts,
+            kind="counter",
+        )
+        core.metrics.gauge(
+            "todo_api_db_pool_connections_opened_total",
+            "Connections the pool opened to the database",
+            lambda: pool_metrics.connections_opened,
+            kind="counter",
+        )
+        core.metrics.gauge(
+            "todo_api_db_pool_checked_out_seconds_total",
+            "Time connections spent checked out of the pool",
+            lambda: pool_metrics.checked_out_seconds,
+            kind="counter",
+        )
+        return pool_metrics
+
+    @functools.cached_property
+    def _engine(self) -> sa.engine.Engine:
         engine = sa.create_engine(
-            str(self._config.db_url), isolation_level="REPEATABLE READ"
+            str(self._config.db_url), **self._engine_options(queue_pool_class=pool.QueuePool)
+        )
+        self.pool_metrics.listen(engine)
+        core.metrics.listen(engine)
+        self._query_log.listen(engine)
+        with engine.begin() as con:
+            core.migrate(con)
+        return engine
+
+    @functools.cached_property
+    def _session_factory(self) -> orm.sessionmaker:
+        return orm.sessionmaker(bind=self._engine)
+
+    @functools.cached_property
+    def _read_only_session_factory(self) -> orm.sessionmaker:
+        return orm.sessionmaker(
+            bind=self._engine.execution_options(
+                isolation_level=self._config.db_read_isolation_level
+            )
+        )
+
+    def _engine_options(
+        self, *, queue_pool_class: typing.Type[pool.Pool]
+    ) -> typing.Dict[str, typing.Any]:
+        options: typing.Dict[str, typing.Any] = {
+            "isolation_level": self._config.db_isolation_level,
+            "pool_pre_ping": self._config.db_pool_pre_ping,
+            "pool_recycle": self._config.db_pool_recycle_seconds,
+        }
+        if self._config.db_pool_class == "null":
+            # pgbouncer does the pooling, so each checkout opens a fresh connection to it
+            options["poolclass"] = pool.NullPool
+        else:
+            options["poolclass"] = queue_pool_class
+            options["pool_size"] = self._config.db_pool_size
+            options["max_overflow"] = self._config.db_max_overflow
+            options["pool_timeout"] = self._config.db_pool_timeout_seconds
+        if statement_timeout_ms := self._config.db_statement_timeout_ms:
+            options["connect_args"] = statement_timeout_connect_args(
+                db_url=str(self._config.db_url), statement_timeout_ms=statement_timeout_ms
+            )
+        return options
+
+
+class AsyncSqlAlchemyServiceLocator(SqlAlchemyServiceLocator):
+    def todo_service(self) -> todo.TodoService:
+        return self._cached_todos(todo.SqlAlchemyAsyncTodoService(self._async_uow()))
+
+    def user_service(self) -> auth.UserService:
+        return self._cached(auth.SqlalchemyAsyncUserService(self._async_uow()))
+
+    async def startup(self) -> None:
+        async with self._async_engine.begin() as con:
+            await con.run_sync(core.migrate)
+
+    async def shutdown(self) -> None:
+        await super().shutdown()
+        await self._async_engine.dispose()
+
+    def _async_uow(self) -> core.SqlAlchemyAsyncUnitOfWork:
+        return core.SqlAlchemyAsyncUnitOfWork(
+            self._async_session_factory,
+            read_only_session_factory=self._async_read_only_session_factory,
+        )
+
+    @functools.cached_property
+    def _async_engine(self) -> sa_asyncio.AsyncEngine:
+        engine = sa_asyncio.create_async_engine(
+            str(self._config.db_url),
+            **self._engine_options(queue_pool_class=pool.AsyncAdaptedQueuePool),
+        )
+        self.pool_metrics.listen(engine.sync_engine)
+        core.metrics.listen(engine.sync_engine)
+        self._query_log.listen(engine.sync_engine)
+        return engine
+
+    @functools.cached_property
+    def _async_session_factory(self) -> orm.sessionmaker:
+        return orm.sessionmaker(
+            bind=self._async_engine,
+            class_=sa_asyncio.AsyncSession,
+            expire_on_commit=False,
+        )
+
+    @functools.cached_property
+    def _async_read_only_session_factory(self) -> orm.sessionmaker:
+        return orm.sessionmaker(
+            bind=self._async_engine.execution_options(
+                isolation_level=self._config.db_read_isolation_level
+            ),
+            class_=sa_asyncio.AsyncSession,
+            expire_on_commit=False,
+        )
+
+
+def statement_timeout_connect_args(
+    *, db_url: str, statement_timeout_ms: int
+) -> typing.Dict[str, typing.Any]:
+    url = sa.engine.make_url(db_url)
+    if url.get_backend_name() != "postgresql":
+        raise core.exception.InvalidConfigurationSetting(
+            "DB_STATEMENT_TIMEOUT_MS",
+            f"A statement timeout is only supported for postgresql, but the database is {url.get_backend_name()!r}.",
         )
-        core.adapter.db_schema.Base.metadata.create_all(bind=engine)
-        session_factory = orm.sessionmaker(bind=engine)
-        return core.SqlAlchemyUnitOfWork(session_factory)
+    if url.get_driver_name() == "asyncpg":
+        return {"server_settings": {"statement_timeout": str(statement_timeout_ms)}}
+    return {"options": f"-c statement_timeout={statement_timeout_ms}"}
 
 
 @functools.lru_cache()
 def default() -> ServiceLocator:
-    return SqlAlchemyServiceLocator(core.EnvironConfig())
+    config = core.EnvironConfig()
+    if config.async_db:
+        return AsyncSqlAlchemyServiceLocator(config)
+    return SqlAlchemyServiceLocator(config)
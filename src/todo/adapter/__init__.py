@@ -1,2 +1,3 @@
+from src.todo.adapter.in_memory_todo_list_cache import *
+from src.todo.adapter.key_value_todo_list_cache import *
 from src.todo.adapter.sqlalchemy_todo_repository import *
-
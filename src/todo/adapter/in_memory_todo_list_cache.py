@@ -0,0 +1,93 @@
+import collections
+import datetime
+import itertools
+import threading
+import time
+import typing
+
+from src import core
+from src.todo import domain
+
+__all__ = ("InMemoryTodoListCache",)
+
+_ListKey = typing.Tuple[datetime.date, typing.Optional[str]]
+
+
+class _UserLists(typing.NamedTuple):
+    version: str
+    lists: typing.Dict[_ListKey, typing.Tuple[float, domain.CachedTodoList]]
+
+
+class InMemoryTodoListCache(domain.TodoListCache):
+    """Todo lists of the max_size most recently seen users, each forgotten ttl_seconds after it was set
+
+    Each worker process has its own copy, so with more than one worker a write only invalidates the lists held by
+    the worker that served it, and the other workers can serve the old lists for up to ttl_seconds.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int,
+        ttl_seconds: float,
+        clock: typing.Callable[[], float] = time.monotonic,
+        metrics: typing.Optional[core.CacheMetrics] = None,
+    ):
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._versions = itertools.count()
+        self._users: typing.OrderedDict[int, _UserLists] = collections.OrderedDict()
+        self.metrics = metrics or core.CacheMetrics()
+
+    async def get(
+        self, *, user_id: int, today: datetime.date, category: typing.Optional[str] = None
+    ) -> typing.Optional[domain.CachedTodoList]:
+        with self._lock:
+            user = self._users.get(user_id)
+            if user is None or (entry := user.lists.get((today, category))) is None:
+                self.metrics.miss()
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del user.lists[(today, category)]
+                self.metrics.miss()
+                return None
+            self._users.move_to_end(user_id)
+            self.metrics.hit()
+            return value
+
+    async def version(self, /, user_id: int) -> str:
+        with self._lock:
+            return self._user(user_id).version
+
+    async def set(
+        self,
+        *,
+        user_id: int,
+        version: str,
+        today: datetime.date,
+        category: typing.Optional[str] = None,
+        value: domain.CachedTodoList,
+    ) -> None:
+        with self._lock:
+            user = self._user(user_id)
+            if user.version != version:
+                return
+            if any(day != today for day, _ in user.lists):
+                # the date rolled over, and the lists of earlier days won't be asked for again
+                user.lists.clear()
+            user.lists[(today, category)] = (self._clock() + self._ttl_seconds, value)
+
+    async def invalidate(self, /, user_id: int) -> None:
+        with self._lock:
+            self._users.pop(user_id, None)
+
+    def _user(self, user_id: int, /) -> _UserLists:
+        if (user := self._users.get(user_id)) is None:
+            user = self._users[user_id] = _UserLists(version=str(next(self._versions)), lists={})
+            while len(self._users) > self._max_size:
+                self._users.popitem(last=False)
+        self._users.move_to_end(user_id)
+        return user
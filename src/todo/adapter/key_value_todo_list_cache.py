@@ -0,0 +1,87 @@
+import datetime
+import typing
+import uuid
+
+from starlette.concurrency import run_in_threadpool
+
+from src import core
+from src.todo import domain
+
+__all__ = ("KeyValueTodoListCache",)
+
+
+class KeyValueTodoListCache(domain.TodoListCache):
+    """Todo lists stored in a redis-compatible store, shared by every worker that uses the same store
+
+    The lists are stored under the user's current version, a random token kept under its own key.  Invalidating
+    a user deletes that token, so the lists stored under it are never read again and expire after ttl_seconds.
+    The store's client is synchronous, so each method runs its round trips in the threadpool.
+    """
+
+    def __init__(
+        self,
+        /,
+        store: core.KeyValueStore,
+        *,
+        ttl_seconds: int,
+        key_prefix: str = "todo-api:todos:",
+        metrics: typing.Optional[core.CacheMetrics] = None,
+    ):
+        self._store = store
+        self._ttl_seconds = ttl_seconds
+        self._key_prefix = key_prefix
+        self.metrics = metrics or core.CacheMetrics()
+
+    async def get(
+        self, *, user_id: int, today: datetime.date, category: typing.Optional[str] = None
+    ) -> typing.Optional[domain.CachedTodoList]:
+        return await run_in_threadpool(self._get, user_id, today, category)
+
+    async def version(self, /, user_id: int) -> str:
+        return await run_in_threadpool(self._version, user_id)
+
+    async def set(
+        self,
+        *,
+        user_id: int,
+        version: str,
+        today: datetime.date,
+        category: typing.Optional[str] = None,
+        value: domain.CachedTodoList,
+    ) -> None:
+        await run_in_threadpool(
+            self._store.set,
+            self._list_key(user_id, version, today, category),
+            value.etag.encode() + b"\n" + value.body,
+            ex=self._ttl_seconds,
+        )
+
+    async def invalidate(self, /, user_id: int) -> None:
+        await run_in_threadpool(self._store.delete, self._version_key(user_id))
+
+    def _get(
+        self, user_id: int, today: datetime.date, category: typing.Optional[str], /
+    ) -> typing.Optional[domain.CachedTodoList]:
+        if (version := self._store.get(self._version_key(user_id))) is None or (
+            value := self._store.get(self._list_key(user_id, version.decode(), today, category))
+        ) is None:
+            self.metrics.miss()
+            return None
+        self.metrics.hit()
+        etag, _, body = value.partition(b"\n")
+        return domain.CachedTodoList(etag=etag.decode(), body=body)
+
+    def _version(self, user_id: int, /) -> str:
+        if (version := self._store.get(self._version_key(user_id))) is not None:
+            return version.decode()
+        new_version = uuid.uuid4().hex
+        self._store.set(self._version_key(user_id), new_version.encode(), ex=self._ttl_seconds)
+        return new_version
+
+    def _version_key(self, user_id: int, /) -> str:
+        return f"{self._key_prefix}{user_id}:version"
+
+    def _list_key(
+        self, user_id: int, version: str, today: datetime.date, category: typing.Optional[str], /
+    ) -> str:
+        return f"{self._key_prefix}{user_id}:{version}:{today.isoformat()}:{category or ''}"
@@ -1,29 +1,99 @@
+import calendar
 import datetime
+import enum
 import typing
 
+import sqlalchemy as sa
 from sqlalchemy import orm
 
 from src import core
 from src.todo import domain
+from src.todo.domain.todos import easter
 
 __all__ = ("SqlAlchemyTodoRepository",)
 
+logger = core.logger.getChild("todo_repository")
 
+# sqlite versions before 3.32 allow at most 999 bound parameters in a statement
+IN_CLAUSE_CHUNK_SIZE = 500
+
+UPDATABLE_COLUMNS = (
+    "advance_days",
+    "date_completed",
+    "days",
+    "description",
+    "month",
+    "month_day",
+    "note",
+    "start_date",
+    "category",
+    "week_day",
+    "week_number",
+    "year",
+    "frequency",
+    "next_due_date",
+    "display_from_date",
+    "due_dates_as_of",
+)
+
+# fields every todo type has, any other field can only be written to a todo of the type that has it
+COMMON_FIELDS = frozenset(domain.Todo.__fields__)
+
+# fields stored under another column's name, see from_domain
+FIELD_COLUMNS = {"day": "month_day", "once_date": "start_date"}
+
+# changing any other field can move the due date, which clears the materialized due dates
+DUE_DATE_INDEPENDENT_FIELDS = frozenset(("category", "date_completed", "description", "note"))
+
+
+@core.metered
 class SqlAlchemyTodoRepository(domain.TodoRepository):
     def __init__(self, /, session: orm.Session):
         self._session = session
 
-    def add(self, *, user_id: int, item: domain.Todo) -> domain.Todo:
-        dto = from_domain(item)
+    def add(self, *, user_id: int, item: domain.Todo, today: datetime.date) -> domain.Todo:
+        dto = from_domain(item, today=today)
         dto.user_id = user_id
         self._session.add(dto)
         self._session.flush()
         return to_domain(dto)
 
+    def add_many(
+        self, *, user_id: int, items: typing.List[domain.Todo], today: datetime.date
+    ) -> typing.List[domain.Todo]:
+        dtos = [from_domain(item, today=today) for item in items]
+        for dto in dtos:
+            dto.user_id = user_id
+        # the ORM batches the inserts into executemany calls where the driver can return the new ids
+        self._session.add_all(dtos)
+        self._session.flush()
+        return [to_domain(dto) for dto in dtos]
+
     def all(self, /, user_id: int) -> typing.List[domain.Todo]:
+        return [to_domain(row) for row in self._session.execute(select_todos(user_id=user_id))]
+
+    def current_candidates(
+        self, *, user_id: int, category: str, today: datetime.date
+    ) -> typing.List[domain.Todo]:
+        table = core.TodoDTO.__table__
         return [
-            to_domain(dto)
-            for dto in self._session.query(core.TodoDTO).filter_by(user_id=user_id)
+            to_domain(row)
+            for row in self._session.execute(
+                sa.select(*table.c)
+                .where(table.c.user_id == user_id, table.c.category == core.TodoCategory(category))
+                .where(sa.or_(table.c.date_completed.is_(None), table.c.date_completed < today))
+                .where(
+                    sa.or_(
+                        table.c.display_from_date <= today,
+                        # computed ahead of today, e.g. by a worker in a later timezone
+                        table.c.due_dates_as_of > today,
+                        sa.and_(
+                            table.c.due_dates_as_of.is_(None),
+                            current_candidates_filter(today),
+                        ),
+                    )
+                )
+            )
         ]
 
     def get_by_id(self, *, user_id: int, todo_id: int) -> typing.Optional[domain.Todo]:
@@ -33,40 +103,267 @@ class SqlAlchemyTodoRepository(domain.TodoRepository):
         else:
             return None
 
+    def get_by_ids(self, *, user_id: int, todo_ids: typing.List[int]) -> typing.List[domain.Todo]:
+        table = core.TodoDTO.__table__
+        return [
+            to_domain(row)
+            for chunk in _chunks(todo_ids)
+            for row in self._session.execute(
+                sa.select(*table.c).where(table.c.user_id == user_id, table.c.todo_id.in_(chunk))
+            )
+        ]
+
     def mark_completed(
-        self, *, user_id: int, item_id: int, today: datetime.date = datetime.date.today()
-    ) -> None:
-        self._session.query(core.TodoDTO).filter_by(user_id=user_id, todo_id=item_id).update(
-            {core.TodoDTO.date_completed: today}
+        self, *, user_id: int, item_id: int, today: datetime.date
+    ) -> typing.Optional[domain.Todo]:
+        table = core.TodoDTO.__table__
+        todos = self._update_returning(
+            table.update()
+            .where(table.c.user_id == user_id, table.c.todo_id == item_id)
+            .values(date_completed=today)
         )
+        return todos[0] if todos else None
+
+    def mark_many_completed(
+        self, *, user_id: int, item_ids: typing.List[int], today: datetime.date
+    ) -> typing.List[domain.Todo]:
+        table = core.TodoDTO.__table__
+        return [
+            t
+            for chunk in _chunks(item_ids)
+            for t in self._update_returning(
+                table.update()
+                .where(table.c.user_id == user_id, table.c.todo_id.in_(chunk))
+                .values(date_completed=today)
+            )
+        ]
+
+    def page(self, *, user_id: int, after_id: typing.Optional[int], limit: int) -> typing.List[domain.Todo]:
+        return [
+            to_domain(row)
+            for row in self._session.execute(select_todos(user_id=user_id, after_id=after_id).limit(limit))
+        ]
+
+    def patch(
+        self,
+        *,
+        user_id: int,
+        item_id: int,
+        todo_type: typing.Type[domain.Todo],
+        updates: typing.Dict[str, typing.Any],
+    ) -> typing.Optional[domain.Todo]:
+        table = core.TodoDTO.__table__
+        where = [table.c.user_id == user_id, table.c.todo_id == item_id]
+        if not COMMON_FIELDS.issuperset(updates):
+            where.append(table.c.frequency == _FREQUENCIES[todo_type].value)
+        if not updates:
+            row = self._session.execute(sa.select(*table.c).where(*where)).first()
+            return None if row is None else to_domain(row)
+
+        values = {
+            FIELD_COLUMNS.get(name, name): value.value if isinstance(value, enum.Enum) else value
+            for name, value in updates.items()
+        }
+        if not DUE_DATE_INDEPENDENT_FIELDS.issuperset(updates):
+            # left for refresh_due_dates, meanwhile reads compute the due dates from the rule
+            values |= {"next_due_date": None, "display_from_date": None, "due_dates_as_of": None}
+        todos = self._update_returning(table.update().where(*where).values(values))
+        return todos[0] if todos else None
+
+    def refresh_due_dates(
+        self, /, today: datetime.date, *, after_id: typing.Optional[int], limit: int
+    ) -> typing.Tuple[int, typing.Optional[int]]:
+        query = self._session.query(core.TodoDTO).filter(
+            sa.or_(
+                core.TodoDTO.due_dates_as_of.is_(None),
+                core.TodoDTO.due_dates_as_of > today,
+                sa.and_(
+                    core.TodoDTO.due_dates_as_of < today,
+                    core.TodoDTO.display_from_date <= today,
+                ),
+            )
+        )
+        if after_id is not None:
+            query = query.filter(core.TodoDTO.todo_id > after_id)
+        dtos = query.order_by(core.TodoDTO.todo_id).limit(limit).all()
+        updated = 0
+        for dto in dtos:
+            try:
+                set_due_dates(dto, to_domain(dto), today=today)
+            except ValueError as e:
+                # a row the rules can't place, e.g. an impossible day of the month, must not stop everyone else's
+                logger.warning(f"Could not refresh the due dates of todo {dto.todo_id}: {e}")
+            else:
+                updated += 1
+        self._session.flush()
+        return updated, dtos[-1].todo_id if dtos else None
 
     def remove(self, *, user_id: int, item_id: int) -> None:
         self._session.query(core.TodoDTO).filter_by(user_id=user_id, todo_id=item_id).delete()
 
-    def update(self, *, user_id: int, item: domain.Todo) -> domain.Todo:
-        dto = from_domain(item)
+    def remove_many(self, *, user_id: int, item_ids: typing.List[int]) -> typing.List[int]:
+        removed: typing.List[int] = []
+        for chunk in _chunks(item_ids):
+            ids = [
+                todo_id
+                for (todo_id,) in self._session.query(core.TodoDTO.todo_id).filter(
+                    core.TodoDTO.user_id == user_id, core.TodoDTO.todo_id.in_(chunk)
+                )
+            ]
+            if ids:
+                self._session.query(core.TodoDTO).filter(core.TodoDTO.todo_id.in_(ids)).delete(
+                    synchronize_session=False
+                )
+            removed.extend(ids)
+        return removed
+
+    def update(self, *, user_id: int, item: domain.Todo, today: datetime.date) -> domain.Todo:
+        dto = from_domain(item, today=today)
         self._session.query(core.TodoDTO).filter_by(user_id=user_id, todo_id=item.todo_id).update(
-            {
-                core.TodoDTO.advance_days: dto.advance_days,
-                core.TodoDTO.date_completed: dto.date_completed,
-                core.TodoDTO.days: dto.days,
-                core.TodoDTO.description: dto.description,
-                core.TodoDTO.month: dto.month,
-                core.TodoDTO.month_day: dto.month_day,
-                core.TodoDTO.note: dto.note,
-                core.TodoDTO.start_date: dto.start_date,
-                core.TodoDTO.category: dto.category,
-                core.TodoDTO.week_day: dto.week_day,
-                core.TodoDTO.week_number: dto.week_number,
-                core.TodoDTO.year: dto.year,
-                core.TodoDTO.frequency: dto.frequency,
-            }
+            {getattr(core.TodoDTO, column): getattr(dto, column) for column in UPDATABLE_COLUMNS}
         )
         self._session.flush()
         return to_domain(dto)
 
+    def _update_returning(self, statement: sa.sql.Update, /) -> typing.List[domain.Todo]:
+        """Run statement and return the todos it updated, in one round trip where the dialect has RETURNING
+
+        The materialized due dates don't depend on date_completed, so the rows come back with them still valid.
+        """
+        table = core.TodoDTO.__table__
+        if self._session.get_bind().dialect.full_returning:
+            return [to_domain(row) for row in self._session.execute(statement.returning(*table.c))]
+
+        # SQLAlchemy 1.4 can't compile RETURNING for sqlite, so read the rows back in the same transaction
+        self._session.execute(statement)
+        return [
+            to_domain(row)
+            for row in self._session.execute(
+                sa.select(*table.c).where(statement.whereclause).order_by(table.c.todo_id)
+            )
+        ]
+
+    def update_many(
+        self, *, user_id: int, items: typing.List[domain.Todo], today: datetime.date
+    ) -> typing.List[domain.Todo]:
+        dtos = [from_domain(item, today=today) for item in items]
+        if dtos:
+            table = core.TodoDTO.__table__
+            # one executemany round trip for the whole batch
+            self._session.execute(
+                table.update()
+                .where(table.c.user_id == sa.bindparam("b_user_id"))
+                .where(table.c.todo_id == sa.bindparam("b_todo_id"))
+                .values({column: sa.bindparam(column) for column in UPDATABLE_COLUMNS}),
+                [
+                    {"b_user_id": user_id, "b_todo_id": dto.todo_id}
+                    | {column: getattr(dto, column) for column in UPDATABLE_COLUMNS}
+                    for dto in dtos
+                ],
+            )
+        return [to_domain(dto) for dto in dtos]
+
+
+def select_todos(*, user_id: int, after_id: typing.Optional[int] = None) -> sa.sql.Select:
+    """The user's todos in todo_id order, starting after after_id, which the (user_id, ...) indexes serve
+
+    Selects the table's columns rather than TodoDTO, so the rows are plain tuples for to_domain.
+    """
+    table = core.TodoDTO.__table__
+    statement = sa.select(*table.c).where(table.c.user_id == user_id)
+    if after_id is not None:
+        statement = statement.where(table.c.todo_id > after_id)
+    return statement.order_by(table.c.todo_id)
+
+
+def _chunks(ids: typing.List[int], /) -> typing.Iterator[typing.List[int]]:
+    for start in range(0, len(ids), IN_CLAUSE_CHUNK_SIZE):
+        yield ids[start : start + IN_CLAUSE_CHUNK_SIZE]
+
+
+def current_candidates_filter(today: datetime.date, /) -> sa.sql.ClauseElement:
+    """Conservative SQL version of Todo.display(today)
+
+    It may let through rows that display(today) rejects, but never drops a row it accepts.  Recurring dates are
+    compared as day-of-year numbers for today's year, so the filter is plain integer arithmetic on any dialect.
+    """
+    dto = core.TodoDTO
+    today_param = sa.literal(today, sa.Date)
+    today_day_of_year = today.timetuple().tm_yday
+    frequency = core.FrequencyDbName
+    return sa.and_(
+        # If it was completed today or later, it was completed on or after its current advance date.
+        sa.or_(dto.date_completed.is_(None), dto.date_completed < today_param),
+        sa.or_(
+            dto.frequency.in_([frequency.DAILY, frequency.WEEKLY]),
+            sa.and_(
+                dto.frequency == frequency.EASTER,
+                dto.advance_days >= (easter.calculate_easter(today.year) - today).days,
+            ),
+            sa.and_(
+                dto.frequency == frequency.IRREGULAR,
+                _x_weekday_of_month_day_of_year(today.year) - dto.advance_days <= today_day_of_year,
+            ),
+            sa.and_(
+                dto.frequency == frequency.MONTHLY,
+                dto.month_day - dto.advance_days <= today.day,
+            ),
+            sa.and_(
+                dto.frequency == frequency.ONCE,
+                core.days_between(dto.start_date, today_param) <= dto.advance_days,
+            ),
+            sa.and_(
+                dto.frequency == frequency.XDAYS,
+                sa.or_(
+                    dto.start_date > today_param,
+                    dto.days - core.days_between(today_param, dto.start_date) % dto.days <= dto.advance_days,
+                ),
+            ),
+            sa.and_(
+                dto.frequency == frequency.YEARLY,
+                sa.or_(
+                    # outside of leap years the current date is the last leap year's, not today's year's
+                    sa.and_(dto.month == 2, dto.month_day == 29),
+                    _month_offset(today.year) + dto.month_day - dto.advance_days <= today_day_of_year,
+                ),
+            ),
+        ),
+    )
+
+
+def _month_offset(year: int, /) -> sa.sql.ColumnElement:
+    """Days in the year before the 1st of the todo's month"""
+    return sa.case(
+        {m: (datetime.date(year, m, 1) - datetime.date(year, 1, 1)).days for m in range(1, 13)},
+        value=core.TodoDTO.month,
+    )
 
-def from_domain(todo: domain.Todo) -> core.TodoDTO:
+
+def _x_weekday_of_month_day_of_year(year: int, /) -> sa.sql.ColumnElement:
+    """Day of the year of an Irregular todo's date in the given year, matching get_x_weekday_of_month"""
+    dto = core.TodoDTO
+    first_weekday = sa.case(
+        {m: datetime.date(year, m, 1).weekday() for m in range(1, 13)}, value=dto.month
+    )
+    days_in_month = sa.case(
+        {m: calendar.monthrange(year, m)[1] for m in range(1, 13)}, value=dto.month
+    )
+    # Weekday numbers start at Sunday = 1, date.weekday() starts at Monday = 0.
+    py_weekday = (dto.week_day + 5) % 7
+    day = 1 + (py_weekday - first_weekday + 7) % 7 + 7 * (dto.week_number - 1)
+    # get_x_weekday_of_month falls back to the last week_day of the month when the date would land past it, and
+    # week numbers only go up to 5, so that is at most one week back.
+    return _month_offset(year) + sa.case((day > days_in_month, day - 7), else_=day)
+
+
+def set_due_dates(dto: core.TodoDTO, todo: domain.Todo, /, *, today: datetime.date) -> None:
+    dto.next_due_date = todo.current_date(today)
+    dto.display_from_date = dto.next_due_date - datetime.timedelta(days=todo.advance_days)
+    dto.due_dates_as_of = today
+
+
+def from_domain(todo: domain.Todo, /, *, today: datetime.date) -> core.TodoDTO:
+    """The row for todo, with its due dates materialized as of the caller's today"""
     month: typing.Optional[int] = None
     month_day: typing.Optional[int] = None
     week_day: typing.Optional[int] = None
@@ -102,7 +399,7 @@ def from_domain(todo: domain.Todo) -> core.TodoDTO:
         raise ValueError(f"Unrecognized frequency: {todo!r}.")
 
     if todo.todo_id == -1:
-        return core.TodoDTO(
+        dto = core.TodoDTO(
             user_id=todo.user_id,
             description=todo.description,
             frequency=frequency,
@@ -120,7 +417,7 @@ def from_domain(todo: domain.Todo) -> core.TodoDTO:
             category=todo.category.value,
         )
     else:
-        return core.TodoDTO(
+        dto = core.TodoDTO(
             todo_id=todo.todo_id,
             user_id=todo.user_id,
             description=todo.description,
@@ -138,123 +435,106 @@ def from_domain(todo: domain.Todo) -> core.TodoDTO:
             note=todo.note,
             category=todo.category.value,
         )
+    set_due_dates(dto, todo, today=today)
+    return dto
 
 
-def to_domain(dto: core.TodoDTO) -> domain.Todo:
-    if dto.frequency == core.FrequencyDbName.DAILY:
-        return domain.Daily(
-            advance_days=dto.advance_days,
-            category=dto.category,
-            date_added=dto.date_added,
-            date_completed=dto.date_completed,
-            description=dto.description,
-            note=dto.note,
-            start_date=dto.start_date,
-            todo_id=dto.todo_id,
-            user_id=dto.user_id,
-        )
-    elif dto.frequency == core.FrequencyDbName.EASTER:
-        return domain.Easter(
-            advance_days=dto.advance_days,
-            category=dto.category,
-            date_added=dto.date_added,
-            date_completed=dto.date_completed,
-            description=dto.description,
-            note=dto.note,
-            start_date=dto.start_date,
-            todo_id=dto.todo_id,
-            user_id=dto.user_id,
-        )
-    elif dto.frequency == core.FrequencyDbName.IRREGULAR:
-        assert dto.month is not None
-        assert dto.week_number is not None
-        assert dto.week_day is not None
-        return domain.Irregular(
-            month=domain.Month(dto.month),
-            week_number=dto.week_number,
-            week_day=domain.Weekday(dto.week_day),
-            advance_days=dto.advance_days,
-            category=dto.category,
-            date_added=dto.date_added,
-            date_completed=dto.date_completed,
-            description=dto.description,
-            note=dto.note,
-            start_date=dto.start_date,
-            todo_id=dto.todo_id,
-            user_id=dto.user_id,
-        )
-    elif dto.frequency == core.FrequencyDbName.MONTHLY:
-        assert dto.month_day is not None
-        return domain.Monthly(
-            advance_days=dto.advance_days,
-            category=dto.category,
-            date_added=dto.date_added,
-            date_completed=dto.date_completed,
-            description=dto.description,
-            note=dto.note,
-            start_date=dto.start_date,
-            todo_id=dto.todo_id,
-            user_id=dto.user_id,
-            month_day=dto.month_day,
-        )
-    elif dto.frequency == core.FrequencyDbName.ONCE:
-        assert dto.start_date is not None
-        return domain.Once(
-            advance_days=dto.advance_days,
-            category=dto.category,
-            date_added=dto.date_added,
-            date_completed=dto.date_completed,
-            description=dto.description,
-            note=dto.note,
-            start_date=dto.start_date,
-            todo_id=dto.todo_id,
-            user_id=dto.user_id,
-            once_date=dto.start_date,
-        )
-    elif dto.frequency == core.FrequencyDbName.WEEKLY:
-        assert dto.week_day is not None
-        return domain.Weekly(
-            advance_days=dto.advance_days,
-            category=dto.category,
-            date_added=dto.date_added,
-            date_completed=dto.date_completed,
-            description=dto.description,
-            note=dto.note,
-            start_date=dto.start_date,
-            todo_id=dto.todo_id,
-            user_id=dto.user_id,
-            week_day=domain.Weekday(dto.week_day),
-        )
-    elif dto.frequency == core.FrequencyDbName.XDAYS:
-        assert dto.days is not None
-        assert dto.start_date is not None
-        return domain.XDays(
-            advance_days=dto.advance_days,
-            category=dto.category,
-            date_added=dto.date_added,
-            date_completed=dto.date_completed,
-            description=dto.description,
-            note=dto.note,
-            start_date=dto.start_date,
-            todo_id=dto.todo_id,
-            user_id=dto.user_id,
-            days=dto.days,
-        )
-    elif dto.frequency == core.FrequencyDbName.YEARLY:
-        assert dto.month_day is not None
-        assert dto.month is not None
-        return domain.Yearly(
-            advance_days=dto.advance_days,
-            category=dto.category,
-            date_added=dto.date_added,
-            date_completed=dto.date_completed,
-            description=dto.description,
-            note=dto.note,
-            start_date=dto.start_date,
-            todo_id=dto.todo_id,
-            user_id=dto.user_id,
-            day=dto.month_day,
-            month=domain.Month(dto.month),
-        )
-    else:
-        raise ValueError(f"Unrecognized frequency: {dto.frequency!r}.")
\ No newline at end of file
+_FREQUENCIES: typing.Dict[typing.Type[domain.Todo], core.FrequencyDbName] = {
+    domain.Daily: core.FrequencyDbName.DAILY,
+    domain.Easter: core.FrequencyDbName.EASTER,
+    domain.Irregular: core.FrequencyDbName.IRREGULAR,
+    domain.Monthly: core.FrequencyDbName.MONTHLY,
+    domain.Once: core.FrequencyDbName.ONCE,
+    domain.Weekly: core.FrequencyDbName.WEEKLY,
+    domain.XDays: core.FrequencyDbName.XDAYS,
+    domain.Yearly: core.FrequencyDbName.YEARLY,
+}
+
+TodoRow = typing.Union[core.TodoDTO, sa.engine.Row]
+
+
+def to_domain(row: TodoRow, /) -> domain.Todo:
+    """Build the domain todo for a row without pydantic validation
+
+    row is either a TodoDTO or a plain Core row of the todo table, both expose the columns as attributes.  Rows
+    were validated as domain todos on the way in, and the column types already match the fields, so validating
+    them again on every read only costs time and allocations.
+    """
+    # like category, frequency is a plain string on rows added in the same session
+    return _TO_DOMAIN[core.FrequencyDbName(row.frequency)](row)
+
+
+def _common_fields(row: TodoRow, /) -> typing.Dict[str, typing.Any]:
+    return {
+        "advance_days": row.advance_days,
+        "category": core.TodoCategory(row.category),
+        "date_added": row.date_added,
+        "date_completed": row.date_completed,
+        "description": row.description,
+        "note": row.note,
+        "start_date": row.start_date,
+        "todo_id": row.todo_id,
+        "user_id": row.user_id,
+        "next_due_date": row.next_due_date,
+        "display_from_date": row.display_from_date,
+        "due_dates_as_of": row.due_dates_as_of,
+    }
+
+
+def _daily(row: TodoRow, /) -> domain.Todo:
+    return domain.Daily.construct(**_common_fields(row))
+
+
+def _easter(row: TodoRow, /) -> domain.Todo:
+    return domain.Easter.construct(**_common_fields(row))
+
+
+def _irregular(row: TodoRow, /) -> domain.Todo:
+    assert row.month is not None
+    assert row.week_number is not None
+    assert row.week_day is not None
+    return domain.Irregular.construct(
+        **_common_fields(row),
+        month=domain.Month(row.month),
+        week_number=row.week_number,
+        week_day=domain.Weekday(row.week_day),
+    )
+
+
+def _monthly(row: TodoRow, /) -> domain.Todo:
+    assert row.month_day is not None
+    return domain.Monthly.construct(**_common_fields(row), month_day=row.month_day)
+
+
+def _once(row: TodoRow, /) -> domain.Todo:
+    assert row.start_date is not None
+    return domain.Once.construct(**_common_fields(row), once_date=row.start_date)
+
+
+def _weekly(row: TodoRow, /) -> domain.Todo:
+    assert row.week_day is not None
+    return domain.Weekly.construct(**_common_fields(row), week_day=domain.Weekday(row.week_day))
+
+
+def _xdays(row: TodoRow, /) -> domain.Todo:
+    assert row.days is not None
+    assert row.start_date is not None
+    return domain.XDays.construct(**_common_fields(row), days=row.days)
+
+
+def _yearly(row: TodoRow, /) -> domain.Todo:
+    assert row.month_day is not None
+    assert row.month is not None
+    return domain.Yearly.construct(**_common_fields(row), day=row.month_day, month=domain.Month(row.month))
+
+
+_TO_DOMAIN: typing.Dict[core.FrequencyDbName, typing.Callable[[TodoRow], domain.Todo]] = {
+    core.FrequencyDbName.DAILY: _daily,
+    core.FrequencyDbName.EASTER: _easter,
+    core.FrequencyDbName.IRREGULAR: _irregular,
+    core.FrequencyDbName.MONTHLY: _monthly,
+    core.FrequencyDbName.ONCE: _once,
+    core.FrequencyDbName.WEEKLY: _weekly,
+    core.FrequencyDbName.XDAYS: _xdays,
+    core.FrequencyDbName.YEARLY: _yearly,
+}
@@ -1,8 +1,11 @@
 from src.todo.domain.todos import *
+from src.todo.domain.due_dates import *
 from src.todo.domain.frequency import *
 from src.todo.domain.holidays import *
 from src.todo.domain.month import *
+from src.todo.domain.occurrences import *
 from src.todo.domain.todo import *
+from src.todo.domain.todo_list_cache import *
 from src.todo.domain.todo_repository import *
 from src.todo.domain.todo_service import *
 from src.todo.domain.weekday import *
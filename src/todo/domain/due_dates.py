@@ -0,0 +1,168 @@
+"""Batch evaluation of current_date, display and days_until
+
+Todos are split into columns of date ordinals per frequency, and each distinct monthly, yearly or irregular rule is
+turned into dates once per batch rather than once per todo.  The results match the per-object methods exactly.
+"""
+from __future__ import annotations
+
+import calendar
+import collections
+import datetime
+import typing
+
+from src import core
+from src.todo.domain import todo, weekday
+from src.todo.domain.todos import daily, easter, irregular, monthly, once, weekly, xdays, yearly
+
+__all__ = ("DueDates", "evaluate_due_dates")
+
+
+class DueDates(typing.NamedTuple):
+    current_dates: typing.List[datetime.date]
+    display: typing.List[bool]
+    days_until: typing.List[int]
+
+
+def evaluate_due_dates(todos: typing.Sequence[todo.Todo], /, today: datetime.date) -> DueDates:
+    with core.metrics.due_dates_seconds.time():
+        return _evaluate_due_dates(todos, today)
+
+
+def _evaluate_due_dates(todos: typing.Sequence[todo.Todo], /, today: datetime.date) -> DueDates:
+    today_ordinal = today.toordinal()
+    current_ordinals = [0] * len(todos)
+    indices_by_type: typing.DefaultDict[typing.Type[todo.Todo], typing.List[int]] = collections.defaultdict(list)
+    for index, t in enumerate(todos):
+        indices_by_type[type(t)].append(index)
+    for todo_type, indices in indices_by_type.items():
+        members = [todos[index] for index in indices]
+        if evaluator := _EVALUATORS.get(todo_type):
+            ordinals = evaluator(members, today)
+        else:
+            ordinals = [t.current_date(today).toordinal() for t in members]
+        for index, ordinal in zip(indices, ordinals):
+            current_ordinals[index] = ordinal
+
+    display: typing.List[bool] = []
+    days_until: typing.List[int] = []
+    for t, current_ordinal in zip(todos, current_ordinals):
+        # inlined Todo.due_dates_valid, the materialized dates win while they hold, as in display and due_date
+        as_of, display_from = t.due_dates_as_of, t.display_from_date
+        if as_of is not None and display_from is not None and (as_of == today or as_of <= today < display_from):
+            due_ordinal = t.next_due_date.toordinal()  # type: ignore
+            advance_ordinal = display_from.toordinal()
+        else:
+            due_ordinal = current_ordinal
+            advance_ordinal = current_ordinal - t.advance_days
+        completed = t.date_completed
+        display.append(
+            today_ordinal >= advance_ordinal
+            and (completed is None or completed.toordinal() < advance_ordinal)
+        )
+        days_until.append(due_ordinal - today_ordinal)
+
+    return DueDates(
+        current_dates=[datetime.date.fromordinal(ordinal) for ordinal in current_ordinals],
+        display=display,
+        days_until=days_until,
+    )
+
+
+def _daily(todos: typing.List[daily.Daily], today: datetime.date, /) -> typing.List[int]:
+    return [today.toordinal()] * len(todos)
+
+
+def _easter(todos: typing.List[easter.Easter], today: datetime.date, /) -> typing.List[int]:
+    today_ordinal = today.toordinal()
+    this_year = easter.calculate_easter(today.year).toordinal()
+    next_year = easter.calculate_easter(today.year + 1).toordinal()
+    assert all(t.advance_days < 365 for t in todos)
+    return [next_year if today_ordinal >= next_year - t.advance_days else this_year for t in todos]
+
+
+def _irregular(todos: typing.List[irregular.Irregular], today: datetime.date, /) -> typing.List[int]:
+    today_ordinal = today.toordinal()
+    assert all(t.advance_days < 365 for t in todos)
+    this_year_table = irregular.x_weekday_table(today.year)
+    next_year_table = irregular.x_weekday_table(today.year + 1)
+    result = []
+    for t in todos:
+        this_year_dates = this_year_table[(t.month, t.week_day)]
+        next_year_dates = next_year_table[(t.month, t.week_day)]
+        # past the last week of the month means the last one, as in get_x_weekday_of_month
+        next_year = next_year_dates[min(t.week_number, len(next_year_dates)) - 1].toordinal()
+        if today_ordinal > next_year - t.advance_days:
+            result.append(next_year)
+        else:
+            result.append(this_year_dates[min(t.week_number, len(this_year_dates)) - 1].toordinal())
+    return result
+
+
+def _monthly(todos: typing.List[monthly.Monthly], today: datetime.date, /) -> typing.List[int]:
+    today_ordinal = today.toordinal()
+    days_in_month = calendar.monthrange(today.year, today.month)[1]
+    next_month = today + datetime.timedelta(days=days_in_month - today.day + 1)
+    rules: typing.Dict[int, typing.Tuple[int, int]] = {}
+    for t in todos:
+        if t.month_day not in rules:
+            rules[t.month_day] = (
+                datetime.date(today.year, today.month, t.month_day).toordinal(),
+                datetime.date(next_month.year, next_month.month, t.month_day).toordinal(),
+            )
+    result = []
+    for t in todos:
+        this_month, following_month = rules[t.month_day]
+        result.append(following_month if today_ordinal > following_month - t.advance_days else this_month)
+    return result
+
+
+def _once(todos: typing.List[once.Once], today: datetime.date, /) -> typing.List[int]:
+    return [t.once_date.toordinal() for t in todos]
+
+
+def _weekly(todos: typing.List[weekly.Weekly], today: datetime.date, /) -> typing.List[int]:
+    today_ordinal = today.toordinal()
+    today_weekday = weekday.Weekday.from_date(today).value
+    result = []
+    for t in todos:
+        next_date = today_ordinal + (t.week_day - today_weekday) % 7
+        result.append(next_date if today_ordinal >= next_date - t.advance_days else next_date - 7)
+    return result
+
+
+def _xdays(todos: typing.List[xdays.XDays], today: datetime.date, /) -> typing.List[int]:
+    today_ordinal = today.toordinal()
+    return [
+        today_ordinal - (today_ordinal - t.start_date.toordinal()) % t.days + t.days
+        for t in todos
+    ]
+
+
+def _yearly(todos: typing.List[yearly.Yearly], today: datetime.date, /) -> typing.List[int]:
+    today_ordinal = today.toordinal()
+    rules: typing.Dict[typing.Tuple[int, int], typing.Tuple[int, int]] = {}
+    for t in todos:
+        if (t.month, t.day) not in rules:
+            rules[(t.month, t.day)] = (
+                yearly.date_in_or_before(today.year, month=t.month, day=t.day).toordinal(),
+                yearly.date_after(today.year, month=t.month, day=t.day).toordinal(),
+            )
+    result = []
+    for t in todos:
+        this_year, next_year = rules[(t.month, t.day)]
+        result.append(next_year if today_ordinal > next_year - t.advance_days else this_year)
+    return result
+
+
+_EVALUATORS: typing.Dict[
+    typing.Type[todo.Todo], typing.Callable[[typing.Any, datetime.date], typing.List[int]]
+] = {
+    daily.Daily: _daily,
+    easter.Easter: _easter,
+    irregular.Irregular: _irregular,
+    monthly.Monthly: _monthly,
+    once.Once: _once,
+    weekly.Weekly: _weekly,
+    xdays.XDays: _xdays,
+    yearly.Yearly: _yearly,
+}
@@ -15,8 +15,10 @@ class Frequency(abc.ABC):
         self,
         advance_days: int,
         date_completed: typing.Optional[datetime.date],
-        today: datetime.date = datetime.date.today(),
+        today: typing.Optional[datetime.date] = None,
     ) -> bool:
+        if today is None:
+            today = datetime.date.today()
         current_date = self.current_date(advance_days=advance_days, today=today)
         current_advance_date = current_date - datetime.timedelta(days=advance_days)
         if date_completed and date_completed >= current_advance_date:  # noqa
@@ -28,7 +30,7 @@ class Frequency(abc.ABC):
 
     @abc.abstractmethod
     def current_date(
-        self, *, advance_days: int, today: datetime.date = datetime.date.today()
+        self, *, advance_days: int, today: typing.Optional[datetime.date] = None
     ) -> datetime.date:
         raise NotImplementedError
 
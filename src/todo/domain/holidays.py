@@ -1,147 +1,189 @@
+import bisect
 import datetime
 import typing
 
 from src import core
 from src.todo.domain import todo, weekday, todos, month
+from src.todo.domain.occurrences import merge_occurrences
 
-__all__ = ("generate_holidays",)
+__all__ = ("HOLIDAYS", "HolidayCalendar", "generate_holidays")
+
+# One shared instance of each rule, every user sees the same holidays.
+
+HOLIDAYS: typing.Tuple[todo.Todo, ...] = (
+    todos.Irregular(
+        user_id=0,
+        todo_id=-1,
+        advance_days=30,
+        category=core.TodoCategory.Reminder,
+        date_added=datetime.date(1970, 1, 1),
+        date_completed=None,
+        description="Thanksgiving",
+        month=month.Month.November,
+        week_day=weekday.Weekday.Thursday,
+        week_number=4,
+        note="",
+        start_date=datetime.date(1900, 1, 1),
+    ),
+    todos.Irregular(
+        user_id=0,
+        todo_id=-1,
+        advance_days=30,
+        category=core.TodoCategory.Reminder,
+        date_added=datetime.date(1970, 1, 1),
+        date_completed=None,
+        description="Thanksgiving",
+        month=month.Month.November,
+        week_day=weekday.Weekday.Friday,
+        week_number=4,
+        note="",
+        start_date=datetime.date(1900, 1, 1),
+    ),
+    todos.Yearly(
+        user_id=0,
+        todo_id=-1,
+        advance_days=30,
+        category=core.TodoCategory.Reminder,
+        date_added=datetime.date(1970, 1, 1),
+        date_completed=None,
+        description="Christmas",
+        month=month.Month.December,
+        day=25,
+        note="",
+        start_date=datetime.date(1900, 1, 1),
+    ),
+    todos.Irregular(
+        user_id=0,
+        todo_id=-1,
+        advance_days=30,
+        category=core.TodoCategory.Reminder,
+        date_added=datetime.date(1970, 1, 1),
+        date_completed=None,
+        description="Fathers Day",
+        month=month.Month.June,
+        week_day=weekday.Weekday.Sunday,
+        week_number=3,
+        note="",
+        start_date=datetime.date(1900, 1, 1),
+    ),
+    todos.Irregular(
+        user_id=0,
+        todo_id=-1,
+        advance_days=30,
+        category=core.TodoCategory.Reminder,
+        date_added=datetime.date(1970, 1, 1),
+        date_completed=None,
+        description="Mothers Day",
+        month=month.Month.May,
+        week_day=weekday.Weekday.Sunday,
+        week_number=2,
+        note="",
+        start_date=datetime.date(1900, 1, 1),
+    ),
+    todos.Irregular(
+        user_id=0,
+        todo_id=-1,
+        advance_days=30,
+        category=core.TodoCategory.Reminder,
+        date_added=datetime.date(1970, 1, 1),
+        date_completed=None,
+        description="Labor Day",
+        month=month.Month.September,
+        week_day=weekday.Weekday.Monday,
+        week_number=1,
+        note="",
+        start_date=datetime.date(1900, 1, 1),
+    ),
+    todos.Irregular(
+        user_id=0,
+        todo_id=-1,
+        advance_days=30,
+        category=core.TodoCategory.Reminder,
+        date_added=datetime.date(1970, 1, 1),
+        date_completed=None,
+        description="Martin Luther King Jr. Day",
+        month=month.Month.January,
+        week_day=weekday.Weekday.Monday,
+        week_number=3,
+        note="",
+        start_date=datetime.date(1900, 1, 1),
+    ),
+    todos.Yearly(
+        user_id=0,
+        todo_id=-1,
+        advance_days=30,
+        category=core.TodoCategory.Reminder,
+        date_added=datetime.date(1970, 1, 1),
+        date_completed=None,
+        description="New Year's Day",
+        month=month.Month.January,
+        day=1,
+        note="",
+        start_date=datetime.date(1900, 1, 1),
+    ),
+    todos.Irregular(
+        user_id=0,
+        todo_id=-1,
+        advance_days=30,
+        category=core.TodoCategory.Reminder,
+        date_added=datetime.date(1970, 1, 1),
+        date_completed=None,
+        description="Presidents' Day",
+        month=month.Month.February,
+        week_day=weekday.Weekday.Monday,
+        week_number=3,
+        note="",
+        start_date=datetime.date(1900, 1, 1),
+    ),
+    todos.Easter(
+        user_id=0,
+        todo_id=-1,
+        advance_days=30,
+        category=core.TodoCategory.Reminder,
+        date_added=datetime.date(1970, 1, 1),
+        date_completed=None,
+        description="Easter",
+        note="",
+        start_date=datetime.date(1900, 1, 1),
+    ),
+)
 
 
 def generate_holidays(user_id: int) -> typing.List[todo.Todo]:
-    return [
-        todos.Irregular(
-            user_id=user_id,
-            todo_id=-1,
-            advance_days=30,
-            category=core.TodoCategory.Reminder,
-            date_added=datetime.date(1970, 1, 1),
-            date_completed=None,
-            description="Thanksgiving",
-            month=month.Month.November,
-            week_day=weekday.Weekday.Thursday,
-            week_number=4,
-            note="",
-            start_date=datetime.date(1900, 1, 1),
-        ),
-        todos.Irregular(
-            user_id=user_id,
-            todo_id=-1,
-            advance_days=30,
-            category=core.TodoCategory.Reminder,
-            date_added=datetime.date(1970, 1, 1),
-            date_completed=None,
-            description="Thanksgiving",
-            month=month.Month.November,
-            week_day=weekday.Weekday.Friday,
-            week_number=4,
-            note="",
-            start_date=datetime.date(1900, 1, 1),
-        ),
-        todos.Yearly(
-            user_id=user_id,
-            todo_id=-1,
-            advance_days=30,
-            category=core.TodoCategory.Reminder,
-            date_added=datetime.date(1970, 1, 1),
-            date_completed=None,
-            description="Christmas",
-            month=month.Month.November,
-            day=25,
-            note="",
-            start_date=datetime.date(1900, 1, 1),
-        ),
-        todos.Irregular(
-            user_id=user_id,
-            todo_id=-1,
-            advance_days=30,
-            category=core.TodoCategory.Reminder,
-            date_added=datetime.date(1970, 1, 1),
-            date_completed=None,
-            description="Fathers Day",
-            month=month.Month.June,
-            week_day=weekday.Weekday.Sunday,
-            week_number=3,
-            note="",
-            start_date=datetime.date(1900, 1, 1),
-        ),
-        todos.Irregular(
-            user_id=user_id,
-            todo_id=-1,
-            advance_days=30,
-            category=core.TodoCategory.Reminder,
-            date_added=datetime.date(1970, 1, 1),
-            date_completed=None,
-            description="Mothers Day",
-            month=month.Month.May,
-            week_day=weekday.Weekday.Sunday,
-            week_number=2,
-            note="",
-            start_date=datetime.date(1900, 1, 1),
-        ),
-        todos.Irregular(
-            user_id=user_id,
-            todo_id=-1,
-            advance_days=30,
-            category=core.TodoCategory.Reminder,
-            date_added=datetime.date(1970, 1, 1),
-            date_completed=None,
-            description="Labor Day",
-            month=month.Month.September,
-            week_day=weekday.Weekday.Monday,
-            week_number=1,
-            note="",
-            start_date=datetime.date(1900, 1, 1),
-        ),
-        todos.Irregular(
-            user_id=user_id,
-            todo_id=-1,
-            advance_days=30,
-            category=core.TodoCategory.Reminder,
-            date_added=datetime.date(1970, 1, 1),
-            date_completed=None,
-            description="Martin Luther King Jr. Day",
-            month=month.Month.January,
-            week_day=weekday.Weekday.Monday,
-            week_number=3,
-            note="",
-            start_date=datetime.date(1900, 1, 1),
-        ),
-        todos.Yearly(
-            user_id=user_id,
-            todo_id=-1,
-            advance_days=30,
-            category=core.TodoCategory.Reminder,
-            date_added=datetime.date(1970, 1, 1),
-            date_completed=None,
-            description="New Year's Day",
-            month=month.Month.January,
-            day=1,
-            note="",
-            start_date=datetime.date(1900, 1, 1),
-        ),
-        todos.Irregular(
-            user_id=user_id,
-            todo_id=-1,
-            advance_days=30,
-            category=core.TodoCategory.Reminder,
-            date_added=datetime.date(1970, 1, 1),
-            date_completed=None,
-            description="Presidents' Day",
-            month=month.Month.February,
-            week_day=weekday.Weekday.Monday,
-            week_number=3,
-            note="",
-            start_date=datetime.date(1900, 1, 1),
-        ),
-        todos.Easter(
-            user_id=user_id,
-            todo_id=-1,
-            advance_days=30,
-            category=core.TodoCategory.Reminder,
-            date_added=datetime.date(1970, 1, 1),
-            date_completed=None,
-            description="Easter",
-            note="",
-            start_date=datetime.date(1900, 1, 1),
-        ),
-    ]
+    return [holiday.copy(update={"user_id": user_id}) for holiday in HOLIDAYS]
+
+
+class HolidayCalendar:
+    """The dates of the holiday rules from first_year through last_year, worked out once and indexed by date
+
+    Meant to be built once per process and shared by every user.  Ranges outside of the years are computed from
+    the rules on demand.
+    """
+
+    def __init__(
+        self,
+        *,
+        first_year: int,
+        last_year: int,
+        holidays: typing.Iterable[todo.Todo] = HOLIDAYS,
+    ):
+        self._holidays = tuple(holidays)
+        self._first_day = datetime.date(first_year, 1, 1)
+        self._last_day = datetime.date(last_year, 12, 31)
+        self._occurrences = list(
+            merge_occurrences(self._holidays, start=self._first_day, end=self._last_day)
+        )
+        self._dates = [dt for dt, _ in self._occurrences]
+
+    def between(
+        self, /, start: datetime.date, end: datetime.date
+    ) -> typing.Iterator[typing.Tuple[datetime.date, todo.Todo]]:
+        """Every holiday from start through end in date order, paired with its rule"""
+        if start < self._first_day or end > self._last_day:
+            yield from merge_occurrences(self._holidays, start=start, end=end)
+            return
+        for index in range(bisect.bisect_left(self._dates, start), bisect.bisect_right(self._dates, end)):
+            yield self._occurrences[index]
+
+    def on(self, /, day: datetime.date) -> typing.List[todo.Todo]:
+        return [holiday for _, holiday in self.between(day, day)]
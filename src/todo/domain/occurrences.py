@@ -0,0 +1,21 @@
+import datetime
+import heapq
+import typing
+
+from src.todo.domain import todo
+
+__all__ = ("merge_occurrences",)
+
+
+def merge_occurrences(
+    todos: typing.Iterable[todo.Todo], /, *, start: datetime.date, end: datetime.date
+) -> typing.Iterator[typing.Tuple[datetime.date, todo.Todo]]:
+    """Every due date of every todo from start through end in date order, holding one pending date per todo"""
+    return heapq.merge(*(_tagged(t, start=start, end=end) for t in todos), key=lambda pair: pair[0])
+
+
+def _tagged(
+    t: todo.Todo, /, *, start: datetime.date, end: datetime.date
+) -> typing.Iterator[typing.Tuple[datetime.date, todo.Todo]]:
+    for dt in t.occurrences(start, end):
+        yield dt, t
@@ -5,11 +5,27 @@ import datetime
 import typing
 
 import pydantic
+from pydantic import error_wrappers, fields
 
 from src import core
 
 __all__ = ("Todo",)
 
+# Set when a todo is added or materialized by the repository, a partial update can't change them
+READ_ONLY_FIELDS = frozenset(
+    ("date_added", "todo_id", "user_id", "next_due_date", "display_from_date", "due_dates_as_of")
+)
+
+# The lowest and highest value of the frequency fields, None for no limit.  Each field belongs to the todo types
+# that have it, and month_day stops at 28 since every month has to have the day.
+FIELD_RANGES: typing.Dict[str, typing.Tuple[int, typing.Optional[int]]] = {
+    "advance_days": (0, 364),
+    "day": (1, 31),
+    "days": (1, None),
+    "month_day": (1, 28),
+    "week_number": (1, 5),
+}
+
 
 class Todo(pydantic.BaseModel, abc.ABC):
     advance_days: int
@@ -21,16 +37,33 @@ class Todo(pydantic.BaseModel, abc.ABC):
     start_date: typing.Optional[datetime.date]
     todo_id: int
     user_id: int
+    # Materialized by the repository from current_date(due_dates_as_of)
+    next_due_date: typing.Optional[datetime.date] = None
+    display_from_date: typing.Optional[datetime.date] = None
+    due_dates_as_of: typing.Optional[datetime.date] = None
 
     class Config:
         allow_mutation = False
         anystr_strip_whitespace = True
 
+    @pydantic.validator(*FIELD_RANGES, check_fields=False)
+    def _in_range(cls, value: int, field: fields.ModelField) -> int:
+        low, high = FIELD_RANGES[field.name]
+        if high is None and value < low:
+            raise ValueError(f"{field.name} must be at least {low}")
+        if high is not None and not low <= value <= high:
+            raise ValueError(f"{field.name} must be between {low} and {high}")
+        return value
+
     def display(self, /, today: typing.Optional[datetime.date] = None) -> bool:
         if today is None:
             today = datetime.date.today()
-        current_date = self.current_date(today)
-        current_advance_date = current_date - datetime.timedelta(days=self.advance_days)
+        if self.due_dates_valid(today):
+            assert self.display_from_date is not None
+            current_advance_date = self.display_from_date
+        else:
+            current_date = self.current_date(today)
+            current_advance_date = current_date - datetime.timedelta(days=self.advance_days)
         if self.date_completed and self.date_completed >= current_advance_date:  # noqa
             return False
         elif today >= current_advance_date:
@@ -40,11 +73,63 @@ class Todo(pydantic.BaseModel, abc.ABC):
 
     @abc.abstractmethod
     def current_date(
-        self, /, today: datetime.date = datetime.date.today()
+        self, /, today: typing.Optional[datetime.date] = None
     ) -> datetime.date:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def occurrences(
+        self, /, start: datetime.date, end: datetime.date
+    ) -> typing.Iterator[datetime.date]:
+        """Lazily yield the due dates from start through end, in order"""
+        raise NotImplementedError
+
     def days_until(self, /, today: typing.Optional[datetime.date] = None) -> int:
         if today is None:
             today = datetime.date.today()
-        return (self.current_date(today) - today).days
+        return (self.due_date(today) - today).days
+
+    def due_date(self, /, today: typing.Optional[datetime.date] = None) -> datetime.date:
+        """current_date(today), skipping the recurrence math while the materialized next_due_date still holds"""
+        if today is None:
+            today = datetime.date.today()
+        if self.due_dates_valid(today):
+            assert self.next_due_date is not None
+            return self.next_due_date
+        return self.current_date(today)
+
+    def due_dates_valid(self, /, today: datetime.date) -> bool:
+        # A todo's current date can only move once its display window opens, so the materialized dates stay
+        # correct from the day they were computed until display_from_date.
+        if self.due_dates_as_of is None or self.display_from_date is None:
+            return False
+        return self.due_dates_as_of == today or self.due_dates_as_of <= today < self.display_from_date
+
+    @classmethod
+    def validate_updates(cls, updates: typing.Dict[str, typing.Any], /) -> typing.Dict[str, typing.Any]:
+        """Validate just the fields in updates against this todo type, without the rest of the todo
+
+        Raises a pydantic.ValidationError listing every invalid, unknown or read-only field.
+        """
+        values: typing.Dict[str, typing.Any] = {}
+        errors: typing.List[error_wrappers.ErrorWrapper] = []
+        for name, value in updates.items():
+            field = cls.__fields__.get(name)
+            if field is None or name in READ_ONLY_FIELDS:
+                errors.append(error_wrappers.ErrorWrapper(ValueError(f"{name} can't be updated"), loc=name))
+                continue
+            value, error = field.validate(value, values, loc=name, cls=cls)  # type: ignore
+            if error:
+                errors.append(error)  # type: ignore
+            else:
+                values[name] = value
+        if errors:
+            raise pydantic.ValidationError(errors, cls)
+        return values
+
+    def validate_current_date(self, /, today: datetime.date) -> None:
+        """Raise a pydantic.ValidationError if the fields pass but make no date, e.g. a yearly todo on February 30"""
+        try:
+            self.current_date(today)
+        except ValueError as e:
+            raise pydantic.ValidationError([error_wrappers.ErrorWrapper(e, loc="__root__")], type(self))
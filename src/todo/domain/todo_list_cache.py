@@ -0,0 +1,44 @@
+import abc
+import datetime
+import typing
+
+__all__ = ("CachedTodoList", "TodoListCache")
+
+
+class CachedTodoList(typing.NamedTuple):
+    etag: str
+    body: bytes
+
+
+class TodoListCache(abc.ABC):
+    """Serialized todo list responses per user, as of a day and optionally for a single category
+
+    Readers take the user's version before they read the todos and hand it to set, so a list read before a
+    write can't be stored after the write invalidated the user.  The methods are coroutines, as with UserCache.
+    """
+
+    @abc.abstractmethod
+    async def get(
+        self, *, user_id: int, today: datetime.date, category: typing.Optional[str] = None
+    ) -> typing.Optional[CachedTodoList]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def version(self, /, user_id: int) -> str:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def set(
+        self,
+        *,
+        user_id: int,
+        version: str,
+        today: datetime.date,
+        category: typing.Optional[str] = None,
+        value: CachedTodoList,
+    ) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def invalidate(self, /, user_id: int) -> None:
+        raise NotImplementedError
@@ -10,21 +10,79 @@ __all__ = ("TodoRepository",)
 
 class TodoRepository(abc.ABC):
     @abc.abstractmethod
-    def add(self, *, user_id: int, item: todo.Todo) -> todo.Todo:
+    def add(self, *, user_id: int, item: todo.Todo, today: datetime.date) -> todo.Todo:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def add_many(
+        self, *, user_id: int, items: typing.List[todo.Todo], today: datetime.date
+    ) -> typing.List[todo.Todo]:
         raise NotImplementedError
 
     @abc.abstractmethod
     def all(self, /, user_id: int) -> typing.List[todo.Todo]:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def current_candidates(
+        self, *, user_id: int, category: str, today: datetime.date
+    ) -> typing.List[todo.Todo]:
+        """Todos in the category that might display today; callers still need to check display(today)"""
+        raise NotImplementedError
+
     @abc.abstractmethod
     def get_by_id(self, *, user_id: int, todo_id: int) -> typing.Optional[todo.Todo]:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def get_by_ids(self, *, user_id: int, todo_ids: typing.List[int]) -> typing.List[todo.Todo]:
+        """The user's todos among todo_ids, ids that don't exist or belong to someone else are left out"""
+        raise NotImplementedError
+
     @abc.abstractmethod
     def mark_completed(
-        self, *, user_id: int, item_id: int, today: datetime.date = datetime.date.today()
-    ) -> None:
+        self, *, user_id: int, item_id: int, today: datetime.date
+    ) -> typing.Optional[todo.Todo]:
+        """The completed todo, or None when the user has no todo with item_id"""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def mark_many_completed(
+        self, *, user_id: int, item_ids: typing.List[int], today: datetime.date
+    ) -> typing.List[todo.Todo]:
+        """Complete the user's todos among item_ids, returning the completed todos"""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def page(self, *, user_id: int, after_id: typing.Optional[int], limit: int) -> typing.List[todo.Todo]:
+        """Up to limit of the user's todos with a todo_id above after_id, in todo_id order"""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def patch(
+        self,
+        *,
+        user_id: int,
+        item_id: int,
+        todo_type: typing.Type[todo.Todo],
+        updates: typing.Dict[str, typing.Any],
+    ) -> typing.Optional[todo.Todo]:
+        """Write only the fields in updates, already checked with todo_type.validate_updates
+
+        Fields all todos share can be written to a todo of any type, others only to a todo of todo_type.  Returns
+        the updated todo, or None when the user has no such todo with item_id.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def refresh_due_dates(
+        self, /, today: datetime.date, *, after_id: typing.Optional[int], limit: int
+    ) -> typing.Tuple[int, typing.Optional[int]]:
+        """Recompute the materialized due dates that may have moved by today, for up to limit todos after after_id
+
+        Returns the number of rows updated and the last todo_id looked at, to pass as after_id for the next batch, or
+        None once no todos are left to look at.
+        """
         raise NotImplementedError
 
     @abc.abstractmethod
@@ -32,5 +90,17 @@ class TodoRepository(abc.ABC):
         raise NotImplementedError
 
     @abc.abstractmethod
-    def update(self, *, user_id: int, item: todo.Todo) -> todo.Todo:
+    def remove_many(self, *, user_id: int, item_ids: typing.List[int]) -> typing.List[int]:
+        """Delete the user's todos among item_ids, returning the ids that were deleted"""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def update(self, *, user_id: int, item: todo.Todo, today: datetime.date) -> todo.Todo:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def update_many(
+        self, *, user_id: int, items: typing.List[todo.Todo], today: datetime.date
+    ) -> typing.List[todo.Todo]:
+        """Overwrite existing todos, callers should check that they belong to the user with get_by_ids first"""
         raise NotImplementedError
@@ -4,46 +4,127 @@ import typing
 
 from src.todo.domain import todo as todo_domain
 
-__all__ = ("TodoService",)
+__all__ = ("TodoPatch", "TodoService")
+
+
+class TodoPatch(typing.NamedTuple):
+    """The fields to write to one todo of a bulk patch, see TodoService.patch_todo"""
+
+    todo_id: int
+    todo_type: typing.Type[todo_domain.Todo]
+    updates: typing.Dict[str, typing.Any]
 
 
 class TodoService(abc.ABC):
     @abc.abstractmethod
-    def all(self, /, user_id: int) -> typing.List[todo_domain.Todo]:
+    async def all(self, /, user_id: int) -> typing.List[todo_domain.Todo]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def add_todo(
+        self, *, user_id: int, todo: todo_domain.Todo, today: datetime.date
+    ) -> todo_domain.Todo:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def add_todos(
+        self, *, user_id: int, todos: typing.List[todo_domain.Todo], today: datetime.date
+    ) -> typing.List[todo_domain.Todo]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def delete_todo(self, *, user_id: int, todo_id: int) -> None:
         raise NotImplementedError
 
     @abc.abstractmethod
-    def add_todo(self, *, user_id: int, todo: todo_domain.Todo) -> todo_domain.Todo:
+    async def delete_todos(self, *, user_id: int, todo_ids: typing.List[int]) -> typing.List[int]:
         raise NotImplementedError
 
     @abc.abstractmethod
-    def delete_todo(self, *, user_id: int, todo_id: int) -> None:
+    async def get_by_id(self, *, user_id: int, todo_id: int) -> typing.Optional[todo_domain.Todo]:
         raise NotImplementedError
 
     @abc.abstractmethod
-    def get_by_id(self, *, user_id: int, todo_id: int) -> typing.Optional[todo_domain.Todo]:
+    async def get_by_ids(
+        self, *, user_id: int, todo_ids: typing.List[int]
+    ) -> typing.List[todo_domain.Todo]:
         raise NotImplementedError
 
     @abc.abstractmethod
-    def get_current_todos(
+    async def get_current_todos(
         self,
         *,
         user_id: int,
         category: str,
-        today: datetime.date = datetime.date.today(),
+        today: datetime.date,
     ) -> typing.List[todo_domain.Todo]:
         raise NotImplementedError
 
     @abc.abstractmethod
-    def get_todos_completed_today(
-        self, *, user_id: int, today: datetime.date = datetime.date.today()
+    async def get_todos_completed_today(
+        self, *, user_id: int, today: datetime.date
     ) -> typing.List[todo_domain.Todo]:
         raise NotImplementedError
 
     @abc.abstractmethod
-    def mark_complete(self, *, user_id: int, todo_id: int) -> None:
+    async def mark_complete(
+        self, *, user_id: int, todo_id: int, today: datetime.date
+    ) -> typing.Optional[todo_domain.Todo]:
+        """The completed todo, or None when the user has no todo with todo_id"""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def mark_many_complete(
+        self, *, user_id: int, todo_ids: typing.List[int], today: datetime.date
+    ) -> typing.List[todo_domain.Todo]:
+        """Complete the user's todos among todo_ids, returning the completed todos"""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def page(
+        self, *, user_id: int, after_id: typing.Optional[int], limit: int
+    ) -> typing.List[todo_domain.Todo]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def patch_todo(
+        self,
+        *,
+        user_id: int,
+        todo_id: int,
+        todo_type: typing.Type[todo_domain.Todo],
+        updates: typing.Dict[str, typing.Any],
+    ) -> typing.Optional[todo_domain.Todo]:
+        """Update only the fields in updates, which are checked with todo_type.validate_updates first
+
+        Fields all todos share can be updated on a todo of any type, others only on a todo of todo_type.  Returns
+        the updated todo, or None when the user has no such todo with todo_id.  Raises a pydantic.ValidationError
+        when an update is invalid.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def patch_todos(
+        self, *, user_id: int, patches: typing.List[TodoPatch]
+    ) -> typing.List[typing.Optional[todo_domain.Todo]]:
+        """patch_todo for each patch in one transaction, returning the results in the order of patches
+
+        Every patch is validated before anything is written, so one invalid patch raises a pydantic.ValidationError
+        and writes none of them.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def refresh_due_dates(self, *, today: datetime.date) -> int:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def stream(self, *, user_id: int) -> typing.AsyncIterator[todo_domain.Todo]:
+        """Every todo of the user in todo_id order, without loading them all into memory first"""
         raise NotImplementedError
 
     @abc.abstractmethod
-    def update_todo(self, *, user_id: int, todo: todo_domain.Todo) -> todo_domain.Todo:
+    async def update_todo(
+        self, *, user_id: int, todo: todo_domain.Todo, today: datetime.date
+    ) -> todo_domain.Todo:
         raise NotImplementedError
@@ -18,6 +18,12 @@ class Daily(todo.Todo):
             today = datetime.date.today()
         return today
 
+    def occurrences(
+        self, /, start: datetime.date, end: datetime.date
+    ) -> typing.Iterator[datetime.date]:
+        for days in range((end - start).days + 1):
+            yield start + datetime.timedelta(days=days)
+
     def __repr__(self) -> str:
         return f"Daily()"
 
@@ -23,6 +23,13 @@ class Easter(todo.Todo):
         else:
             return cy
 
+    def occurrences(
+        self, /, start: datetime.date, end: datetime.date
+    ) -> typing.Iterator[datetime.date]:
+        for year in range(start.year, end.year + 1):
+            if start <= (dt := calculate_easter(year)) <= end:
+                yield dt
+
     def __str__(self) -> str:
         return "Easter"
 
@@ -40,23 +40,46 @@ class Irregular(todo.Todo):
         else:
             return dt1
 
+    def occurrences(
+        self, /, start: datetime.date, end: datetime.date
+    ) -> typing.Iterator[datetime.date]:
+        for year in range(start.year, end.year + 1):
+            dt = get_x_weekday_of_month(
+                year=year,
+                month=self.month,
+                week_num=self.week_number,
+                week_day=self.week_day,
+            )
+            if start <= dt <= end:
+                yield dt
+
     def __str__(self) -> str:
         return f"Irregular"
 
 
-@functools.lru_cache()
 def get_x_weekday_of_month(
     year: int, month: int, week_num: int, week_day: weekday.Weekday
 ) -> datetime.date:
-    days_in_month = calendar.monthrange(year, month)[1]
-    return list(
-        itertools.islice(
-            (
-                dt
-                for day in range(1, days_in_month, 1)
-                if (dt := datetime.date(year, month, day)).weekday()
-                == week_day.py_weekday
-            ),
-            week_num,
+    """The week_num-th week_day of the month, or the last one when the month has fewer than week_num"""
+    first_weekday, days_in_month = calendar.monthrange(year, month)
+    first_day = 1 + (week_day.py_weekday - first_weekday) % 7
+    last_day = first_day + (days_in_month - first_day) // 7 * 7
+    return datetime.date(year, month, min(first_day + 7 * (week_num - 1), last_day))
+
+
+@functools.lru_cache(maxsize=32)
+def x_weekday_table(
+    year: int, /
+) -> typing.Dict[typing.Tuple[int, weekday.Weekday], typing.Tuple[datetime.date, ...]]:
+    """Every (month, week_day) of the year with all the dates it falls on, for evaluating many rules at once
+
+    The last date of each tuple is the last week_day of the month.
+    """
+    table = {}
+    for m, wd in itertools.product(range(1, 13), weekday.Weekday):
+        first = get_x_weekday_of_month(year, m, 1, wd)
+        last = get_x_weekday_of_month(year, m, 5, wd)
+        table[(m, wd)] = tuple(
+            first + datetime.timedelta(days=days) for days in range(0, (last - first).days + 1, 7)
         )
-    )[-1]
+    return table
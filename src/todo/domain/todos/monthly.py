@@ -29,5 +29,16 @@ class Monthly(todo.Todo):
         else:
             return dt1
 
+    def occurrences(
+        self, /, start: datetime.date, end: datetime.date
+    ) -> typing.Iterator[datetime.date]:
+        year, month = start.year, start.month
+        while (year, month) <= (end.year, end.month):
+            # months shorter than month_day have no due date
+            if self.month_day <= calendar.monthrange(year, month)[1]:
+                if start <= (dt := datetime.date(year, month, self.month_day)) <= end:
+                    yield dt
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
     def __str__(self) -> str:
         return f"Monthly, day {self.month_day}"
@@ -17,6 +17,12 @@ class Once(todo.Todo):
     ) -> datetime.date:
         return self.once_date
 
+    def occurrences(
+        self, /, start: datetime.date, end: datetime.date
+    ) -> typing.Iterator[datetime.date]:
+        if start <= self.once_date <= end:
+            yield self.once_date
+
     @staticmethod
     def db_name() -> typing.Literal[core.FrequencyDbName.ONCE]:
         return core.FrequencyDbName.ONCE
@@ -30,5 +30,13 @@ class Weekly(todo.Todo):
         else:
             return next_date - datetime.timedelta(days=7)
 
+    def occurrences(
+        self, /, start: datetime.date, end: datetime.date
+    ) -> typing.Iterator[datetime.date]:
+        dt = start + datetime.timedelta(days=(self.week_day.py_weekday - start.weekday()) % 7)
+        while dt <= end:
+            yield dt
+            dt += datetime.timedelta(days=7)
+
     def __str__(self) -> str:
         return self.week_day.short_name
@@ -23,5 +23,13 @@ class XDays(todo.Todo):
         prior_date = today - datetime.timedelta(days=days_since_last)
         return prior_date + datetime.timedelta(days=self.days)
 
+    def occurrences(
+        self, /, start: datetime.date, end: datetime.date
+    ) -> typing.Iterator[datetime.date]:
+        dt = start + datetime.timedelta(days=(self.start_date - start).days % self.days)
+        while dt <= end:
+            yield dt
+            dt += datetime.timedelta(days=self.days)
+
     def __str__(self) -> str:
         return f"Every {self.days} days"
@@ -17,12 +17,46 @@ class Yearly(todo.Todo):
     ) -> datetime.date:
         if today is None:
             today = datetime.date.today()
-        dt1 = datetime.date(year=today.year, month=self.month, day=self.day)
-        dt2 = datetime.date(year=today.year + 1, month=self.month, day=self.day)
+        dt1 = date_in_or_before(today.year, month=self.month, day=self.day)
+        dt2 = date_after(today.year, month=self.month, day=self.day)
         if today > dt2 - datetime.timedelta(days=self.advance_days):
             return dt2
         else:
             return dt1
 
+    def occurrences(
+        self, /, start: datetime.date, end: datetime.date
+    ) -> typing.Iterator[datetime.date]:
+        for year in range(start.year, end.year + 1):
+            try:
+                dt = datetime.date(year, self.month, self.day)
+            except ValueError:  # Feb 29 outside of leap years
+                continue
+            if start <= dt <= end:
+                yield dt
+
     def __str__(self) -> str:
         return f"{self.month!s} {self.day}"
+
+
+def date_in_or_before(year: int, /, *, month: int, day: int) -> datetime.date:
+    """The date in year, or for Feb 29 outside of leap years in the last leap year before it, as occurrences skips"""
+    while True:
+        try:
+            return datetime.date(year, month, day)
+        except ValueError:
+            if (month, day) != (2, 29):
+                raise
+            year -= 1
+
+
+def date_after(year: int, /, *, month: int, day: int) -> datetime.date:
+    """The first date after year, so for Feb 29 the one in the next leap year"""
+    year += 1
+    while True:
+        try:
+            return datetime.date(year, month, day)
+        except ValueError:
+            if (month, day) != (2, 29):
+                raise
+            year += 1
@@ -1 +1,3 @@
+from src.todo.service.cached_todo_service import *
+from src.todo.service.sqlalchemy_async_todo_service import *
 from src.todo.service.sqlalchemy_todo_service import *
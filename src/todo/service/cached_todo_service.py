@@ -0,0 +1,123 @@
+import datetime
+import typing
+
+from src.todo import domain
+
+__all__ = ("CachedTodoService",)
+
+
+class CachedTodoService(domain.TodoService):
+    """Invalidates the user's cached todo lists after every write and passes everything else through
+
+    The lists themselves are read and stored by the routes, which own their serialization.
+    """
+
+    def __init__(self, /, todo_service: domain.TodoService, *, cache: domain.TodoListCache):
+        self._todo_service = todo_service
+        self._cache = cache
+
+    async def all(self, /, user_id: int) -> typing.List[domain.Todo]:
+        return await self._todo_service.all(user_id)
+
+    async def add_todo(self, *, user_id: int, todo: domain.Todo, today: datetime.date) -> domain.Todo:
+        try:
+            return await self._todo_service.add_todo(user_id=user_id, todo=todo, today=today)
+        finally:
+            await self._cache.invalidate(user_id)
+
+    async def add_todos(
+        self, *, user_id: int, todos: typing.List[domain.Todo], today: datetime.date
+    ) -> typing.List[domain.Todo]:
+        try:
+            return await self._todo_service.add_todos(user_id=user_id, todos=todos, today=today)
+        finally:
+            await self._cache.invalidate(user_id)
+
+    async def delete_todo(self, *, user_id: int, todo_id: int) -> None:
+        try:
+            await self._todo_service.delete_todo(user_id=user_id, todo_id=todo_id)
+        finally:
+            await self._cache.invalidate(user_id)
+
+    async def delete_todos(self, *, user_id: int, todo_ids: typing.List[int]) -> typing.List[int]:
+        try:
+            return await self._todo_service.delete_todos(user_id=user_id, todo_ids=todo_ids)
+        finally:
+            await self._cache.invalidate(user_id)
+
+    async def get_by_id(self, *, user_id: int, todo_id: int) -> typing.Optional[domain.Todo]:
+        return await self._todo_service.get_by_id(user_id=user_id, todo_id=todo_id)
+
+    async def get_by_ids(self, *, user_id: int, todo_ids: typing.List[int]) -> typing.List[domain.Todo]:
+        return await self._todo_service.get_by_ids(user_id=user_id, todo_ids=todo_ids)
+
+    async def get_current_todos(
+        self,
+        *,
+        user_id: int,
+        category: str,
+        today: datetime.date,
+    ) -> typing.List[domain.Todo]:
+        return await self._todo_service.get_current_todos(user_id=user_id, category=category, today=today)
+
+    async def get_todos_completed_today(
+        self, *, user_id: int, today: datetime.date
+    ) -> typing.List[domain.Todo]:
+        return await self._todo_service.get_todos_completed_today(user_id=user_id, today=today)
+
+    async def mark_complete(
+        self, *, user_id: int, todo_id: int, today: datetime.date
+    ) -> typing.Optional[domain.Todo]:
+        try:
+            return await self._todo_service.mark_complete(user_id=user_id, todo_id=todo_id, today=today)
+        finally:
+            await self._cache.invalidate(user_id)
+
+    async def mark_many_complete(
+        self, *, user_id: int, todo_ids: typing.List[int], today: datetime.date
+    ) -> typing.List[domain.Todo]:
+        try:
+            return await self._todo_service.mark_many_complete(user_id=user_id, todo_ids=todo_ids, today=today)
+        finally:
+            await self._cache.invalidate(user_id)
+
+    async def page(
+        self, *, user_id: int, after_id: typing.Optional[int], limit: int
+    ) -> typing.List[domain.Todo]:
+        return await self._todo_service.page(user_id=user_id, after_id=after_id, limit=limit)
+
+    async def patch_todo(
+        self,
+        *,
+        user_id: int,
+        todo_id: int,
+        todo_type: typing.Type[domain.Todo],
+        updates: typing.Dict[str, typing.Any],
+    ) -> typing.Optional[domain.Todo]:
+        try:
+            return await self._todo_service.patch_todo(
+                user_id=user_id, todo_id=todo_id, todo_type=todo_type, updates=updates
+            )
+        finally:
+            await self._cache.invalidate(user_id)
+
+    async def patch_todos(
+        self, *, user_id: int, patches: typing.List[domain.TodoPatch]
+    ) -> typing.List[typing.Optional[domain.Todo]]:
+        try:
+            return await self._todo_service.patch_todos(user_id=user_id, patches=patches)
+        finally:
+            await self._cache.invalidate(user_id)
+
+    async def refresh_due_dates(self, *, today: datetime.date) -> int:
+        # only materializes dates the lists already show, so there is nothing to invalidate
+        return await self._todo_service.refresh_due_dates(today=today)
+
+    def stream(self, *, user_id: int) -> typing.AsyncIterator[domain.Todo]:
+        return self._todo_service.stream(user_id=user_id)
+
+    async def update_todo(self, *, user_id: int, todo: domain.Todo, today: datetime.date) -> domain.Todo:
+        try:
+            return await self._todo_service.update_todo(user_id=user_id, todo=todo, today=today)
+        finally:
+            await self._cache.invalidate(user_id)
@@ -0,0 +1,174 @@
+import datetime
+import typing
+
+from sqlalchemy import orm
+
+from src import core
+from src.todo import domain, adapter
+
+__all__ = ("SqlAlchemyAsyncTodoService",)
+
+T = typing.TypeVar("T")
+
+REFRESH_BATCH_SIZE = 1_000
+
+STREAM_BATCH_SIZE = 500
+
+
+class SqlAlchemyAsyncTodoService(domain.TodoService):
+    def __init__(self, /, uow: core.SqlAlchemyAsyncUnitOfWork):
+        self._uow = uow
+
+    async def all(self, /, user_id: int) -> typing.List[domain.Todo]:
+        async with self._uow.read_only():
+            return await self._run(lambda repo: repo.all(user_id))
+
+    async def add_todo(self, *, user_id: int, todo: domain.Todo, today: datetime.date) -> domain.Todo:
+        async with self._uow:
+            new_todo = await self._run(lambda repo: repo.add(user_id=user_id, item=todo, today=today))
+            await self._uow.commit()
+            return new_todo
+
+    async def add_todos(
+        self, *, user_id: int, todos: typing.List[domain.Todo], today: datetime.date
+    ) -> typing.List[domain.Todo]:
+        async with self._uow:
+            new_todos = await self._run(lambda repo: repo.add_many(user_id=user_id, items=todos, today=today))
+            await self._uow.commit()
+            return new_todos
+
+    async def delete_todo(self, *, user_id: int, todo_id: int) -> None:
+        async with self._uow:
+            await self._run(lambda repo: repo.remove(user_id=user_id, item_id=todo_id))
+            await self._uow.commit()
+
+    async def delete_todos(self, *, user_id: int, todo_ids: typing.List[int]) -> typing.List[int]:
+        async with self._uow:
+            deleted = await self._run(lambda repo: repo.remove_many(user_id=user_id, item_ids=todo_ids))
+            await self._uow.commit()
+            return deleted
+
+    async def get_by_id(self, *, user_id: int, todo_id: int) -> typing.Optional[domain.Todo]:
+        assert todo_id > 0, f"Todo id values should be positive, but got {todo_id!r}."
+        async with self._uow.read_only():
+            todo = await self._run(lambda repo: repo.get_by_id(user_id=user_id, todo_id=todo_id))
+            if todo and todo.user_id == user_id:
+                return todo
+            else:
+                raise core.exception.AuthException("Todo belongs to another user")
+
+    async def get_by_ids(self, *, user_id: int, todo_ids: typing.List[int]) -> typing.List[domain.Todo]:
+        async with self._uow.read_only():
+            return await self._run(lambda repo: repo.get_by_ids(user_id=user_id, todo_ids=todo_ids))
+
+    async def get_current_todos(
+        self,
+        *,
+        user_id: int,
+        category: str,
+        today: datetime.date,
+    ) -> typing.List[domain.Todo]:
+        async with self._uow.read_only():
+            candidates = await self._run(
+                lambda repo: repo.current_candidates(user_id=user_id, category=category, today=today)
+            )
+        display = domain.evaluate_due_dates(candidates, today).display
+        return [todo for todo, shown in zip(candidates, display) if shown]
+
+    async def get_todos_completed_today(
+        self, *, user_id: int, today: datetime.date
+    ) -> typing.List[domain.Todo]:
+        return [todo for todo in await self.all(user_id) if todo.date_completed == today]
+
+    async def mark_complete(
+        self, *, user_id: int, todo_id: int, today: datetime.date
+    ) -> typing.Optional[domain.Todo]:
+        async with self._uow:
+            completed = await self._run(
+                lambda repo: repo.mark_completed(user_id=user_id, item_id=todo_id, today=today)
+            )
+            await self._uow.commit()
+            return completed
+
+    async def mark_many_complete(
+        self, *, user_id: int, todo_ids: typing.List[int], today: datetime.date
+    ) -> typing.List[domain.Todo]:
+        async with self._uow:
+            completed = await self._run(
+                lambda repo: repo.mark_many_completed(user_id=user_id, item_ids=todo_ids, today=today)
+            )
+            await self._uow.commit()
+            return completed
+
+    async def page(
+        self, *, user_id: int, after_id: typing.Optional[int], limit: int
+    ) -> typing.List[domain.Todo]:
+        async with self._uow.read_only():
+            return await self._run(lambda repo: repo.page(user_id=user_id, after_id=after_id, limit=limit))
+
+    async def patch_todo(
+        self,
+        *,
+        user_id: int,
+        todo_id: int,
+        todo_type: typing.Type[domain.Todo],
+        updates: typing.Dict[str, typing.Any],
+    ) -> typing.Optional[domain.Todo]:
+        values = todo_type.validate_updates(updates)
+        async with self._uow:
+            patched = await self._run(
+                lambda repo: repo.patch(user_id=user_id, item_id=todo_id, todo_type=todo_type, updates=values)
+            )
+            await self._uow.commit()
+            return patched
+
+    async def patch_todos(
+        self, *, user_id: int, patches: typing.List[domain.TodoPatch]
+    ) -> typing.List[typing.Optional[domain.Todo]]:
+        values = [p.todo_type.validate_updates(p.updates) for p in patches]
+        async with self._uow:
+            patched = await self._run(
+                lambda repo: [
+                    repo.patch(user_id=user_id, item_id=p.todo_id, todo_type=p.todo_type, updates=v)
+                    for p, v in zip(patches, values)
+                ]
+            )
+            await self._uow.commit()
+            return patched
+
+    async def refresh_due_dates(self, *, today: datetime.date) -> int:
+        # a transaction per batch keeps the rows in memory and the locks held down to REFRESH_BATCH_SIZE
+        updated = 0
+        after_id: typing.Optional[int] = None
+        while True:
+            async with self._uow:
+                batch_updated, after_id = await self._run(
+                    lambda repo: repo.refresh_due_dates(today, after_id=after_id, limit=REFRESH_BATCH_SIZE)
+                )
+                await self._uow.commit()
+            updated += batch_updated
+            if after_id is None:
+                return updated
+
+    async def stream(self, *, user_id: int) -> typing.AsyncIterator[domain.Todo]:
+        # run_sync can't hand rows back one batch at a time, so this reads the cursor through the async session
+        async with self._uow.read_only():
+            result = await self._uow.session.stream(
+                adapter.sqlalchemy_todo_repository.select_todos(user_id=user_id).execution_options(
+                    yield_per=STREAM_BATCH_SIZE
+                )
+            )
+            async for row in result:
+                yield adapter.sqlalchemy_todo_repository.to_domain(row)
+
+    async def update_todo(self, *, user_id: int, todo: domain.Todo, today: datetime.date) -> domain.Todo:
+        async with self._uow:
+            updated_todo = await self._run(lambda repo: repo.update(user_id=user_id, item=todo, today=today))
+            await self._uow.commit()
+            return updated_todo
+
+    async def _run(self, fn: typing.Callable[[domain.TodoRepository], T], /) -> T:
+        def run_with_repo(session: orm.Session) -> T:
+            return fn(adapter.SqlAlchemyTodoRepository(session))
+
+        return await self._uow.run_sync(run_with_repo)
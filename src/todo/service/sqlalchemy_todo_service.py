@@ -1,69 +1,155 @@
 import datetime
 import typing
 
+from starlette.concurrency import run_in_threadpool
+
 from src import core
 from src.todo import domain, adapter
 
 __all__ = ("SqlAlchemyTodoService",)
 
+T = typing.TypeVar("T")
+
+REFRESH_BATCH_SIZE = 1_000
+
+STREAM_BATCH_SIZE = 500
+
 
 class SqlAlchemyTodoService(domain.TodoService):
+    """Todos over blocking SQLAlchemy sessions, each unit of work runs in the threadpool to keep the event loop free"""
+
     def __init__(self, /, uow: core.SqlAlchemyUnitOfWork):
         self._uow = uow
 
-    def all(self, /, user_id: int) -> typing.List[domain.Todo]:
-        with self._uow:
-            return self._repo.all(user_id)
+    async def all(self, /, user_id: int) -> typing.List[domain.Todo]:
+        return await self._read(lambda repo: repo.all(user_id))
+
+    async def add_todo(self, *, user_id: int, todo: domain.Todo, today: datetime.date) -> domain.Todo:
+        return await self._write(lambda repo: repo.add(user_id=user_id, item=todo, today=today))
 
-    def add_todo(self, *, user_id: int, todo: domain.Todo) -> domain.Todo:
-        with self._uow:
-            new_todo = self._repo.add(user_id=user_id, item=todo)
-            self._uow.commit()
-            return new_todo
+    async def add_todos(
+        self, *, user_id: int, todos: typing.List[domain.Todo], today: datetime.date
+    ) -> typing.List[domain.Todo]:
+        return await self._write(lambda repo: repo.add_many(user_id=user_id, items=todos, today=today))
 
-    def delete_todo(self, *, user_id: int, todo_id: int) -> None:
-        with self._uow:
-            self._repo.remove(user_id=user_id, item_id=todo_id)
-            self._uow.commit()
+    async def delete_todo(self, *, user_id: int, todo_id: int) -> None:
+        await self._write(lambda repo: repo.remove(user_id=user_id, item_id=todo_id))
 
-    def get_by_id(self, *, user_id: int, todo_id: int) -> typing.Optional[domain.Todo]:
+    async def delete_todos(self, *, user_id: int, todo_ids: typing.List[int]) -> typing.List[int]:
+        return await self._write(lambda repo: repo.remove_many(user_id=user_id, item_ids=todo_ids))
+
+    async def get_by_id(self, *, user_id: int, todo_id: int) -> typing.Optional[domain.Todo]:
         assert todo_id > 0, f"Todo id values should be positive, but got {todo_id!r}."
-        with self._uow:
-            todo = self._repo.get_by_id(user_id=user_id, todo_id=todo_id)
-            if todo and todo.user_id == user_id:
-                return todo
-            else:
-                raise core.exception.AuthException("Todo belongs to another user")
-
-    def get_current_todos(
+        todo = await self._read(lambda repo: repo.get_by_id(user_id=user_id, todo_id=todo_id))
+        if todo and todo.user_id == user_id:
+            return todo
+        else:
+            raise core.exception.AuthException("Todo belongs to another user")
+
+    async def get_by_ids(self, *, user_id: int, todo_ids: typing.List[int]) -> typing.List[domain.Todo]:
+        return await self._read(lambda repo: repo.get_by_ids(user_id=user_id, todo_ids=todo_ids))
+
+    async def get_current_todos(
         self,
         *,
         user_id: int,
         category: str,
-        today: datetime.date = datetime.date.today(),
+        today: datetime.date,
+    ) -> typing.List[domain.Todo]:
+        candidates = await self._read(
+            lambda repo: repo.current_candidates(user_id=user_id, category=category, today=today)
+        )
+        display = domain.evaluate_due_dates(candidates, today).display
+        return [todo for todo, shown in zip(candidates, display) if shown]
+
+    async def get_todos_completed_today(
+        self, *, user_id: int, today: datetime.date
+    ) -> typing.List[domain.Todo]:
+        return [todo for todo in await self.all(user_id) if todo.date_completed == today]
+
+    async def mark_complete(
+        self, *, user_id: int, todo_id: int, today: datetime.date
+    ) -> typing.Optional[domain.Todo]:
+        return await self._write(lambda repo: repo.mark_completed(user_id=user_id, item_id=todo_id, today=today))
+
+    async def mark_many_complete(
+        self, *, user_id: int, todo_ids: typing.List[int], today: datetime.date
     ) -> typing.List[domain.Todo]:
-        return [
-            todo
-            for todo in self.all(user_id)
-            if todo.display(today) and todo.category == category
-        ]
-
-    def get_todos_completed_today(
-        self, *, user_id: int, today: datetime.date = datetime.date.today()
+        return await self._write(
+            lambda repo: repo.mark_many_completed(user_id=user_id, item_ids=todo_ids, today=today)
+        )
+
+    async def page(
+        self, *, user_id: int, after_id: typing.Optional[int], limit: int
     ) -> typing.List[domain.Todo]:
-        return [todo for todo in self.all(user_id) if todo.date_completed == today]
+        return await self._read(lambda repo: repo.page(user_id=user_id, after_id=after_id, limit=limit))
+
+    async def patch_todo(
+        self,
+        *,
+        user_id: int,
+        todo_id: int,
+        todo_type: typing.Type[domain.Todo],
+        updates: typing.Dict[str, typing.Any],
+    ) -> typing.Optional[domain.Todo]:
+        values = todo_type.validate_updates(updates)
+        return await self._write(
+            lambda repo: repo.patch(user_id=user_id, item_id=todo_id, todo_type=todo_type, updates=values)
+        )
+
+    async def patch_todos(
+        self, *, user_id: int, patches: typing.List[domain.TodoPatch]
+    ) -> typing.List[typing.Optional[domain.Todo]]:
+        values = [p.todo_type.validate_updates(p.updates) for p in patches]
+        return await self._write(
+            lambda repo: [
+                repo.patch(user_id=user_id, item_id=p.todo_id, todo_type=p.todo_type, updates=v)
+                for p, v in zip(patches, values)
+            ]
+        )
+
+    async def refresh_due_dates(self, *, today: datetime.date) -> int:
+        # a transaction per batch keeps the rows in memory and the locks held down to REFRESH_BATCH_SIZE
+        updated = 0
+        after_id: typing.Optional[int] = None
+        while True:
+            batch_updated, after_id = await self._write(
+                lambda repo: repo.refresh_due_dates(today, after_id=after_id, limit=REFRESH_BATCH_SIZE)
+            )
+            updated += batch_updated
+            if after_id is None:
+                return updated
+
+    async def stream(self, *, user_id: int) -> typing.AsyncIterator[domain.Todo]:
+        # a session can't follow the stream from one threadpool thread to the next, so each batch is a keyset page
+        after_id: typing.Optional[int] = None
+        while True:
+            batch = await self.page(user_id=user_id, after_id=after_id, limit=STREAM_BATCH_SIZE)
+            for todo in batch:
+                yield todo
+            if len(batch) < STREAM_BATCH_SIZE:
+                return
+            after_id = batch[-1].todo_id
+
+    async def update_todo(self, *, user_id: int, todo: domain.Todo, today: datetime.date) -> domain.Todo:
+        return await self._write(lambda repo: repo.update(user_id=user_id, item=todo, today=today))
+
+    async def _read(self, fn: typing.Callable[[domain.TodoRepository], T], /) -> T:
+        def read() -> T:
+            with self._uow.read_only():
+                return fn(self._repo)
+
+        return await run_in_threadpool(read)
 
-    def mark_complete(self, *, user_id: int, todo_id: int) -> None:
-        with self._uow:
-            self._repo.mark_completed(user_id=user_id, item_id=todo_id)
-            self._uow.commit()
+    async def _write(self, fn: typing.Callable[[domain.TodoRepository], T], /) -> T:
+        def write() -> T:
+            with self._uow:
+                result = fn(self._repo)
+                self._uow.commit()
+                return result
 
-    def update_todo(self, *, user_id: int, todo: domain.Todo) -> domain.Todo:
-        with self._uow:
-            updated_todo = self._repo.update(user_id=user_id, item=todo)
-            self._uow.commit()
-            return updated_todo
+        return await run_in_threadpool(write)
 
     @property
     def _repo(self) -> domain.TodoRepository:
-        return adapter.SqlAlchemyTodoRepository(self._uow.session)
\ No newline at end of file
+        return adapter.SqlAlchemyTodoRepository(self._uow.session)
@@ -2,9 +2,11 @@ import asyncio
 import dataclasses
 import typing
 
+import fastapi
 import pydantic
+import pytest
 
-from src import auth, api
+from src import auth, api, core
 from src.api.routes import get_current_active_user
 from src.api.routes.auth import login, get_user, register
 from src.auth import domain
@@ -20,15 +22,25 @@ ACCESS_TOKEN = "test_user." + PASSWORD_HASH
 
 
 class DummyPasswordHasher(auth.PasswordHashService):
-    def create(self, /, plain_password: pydantic.SecretStr) -> str:
+    async def create(self, /, plain_password: pydantic.SecretStr) -> str:
         return dummy_hasher(plain_password)
 
-    def verify(
+    async def verify(
         self, *, hashed_password: str, plain_password: pydantic.SecretStr
     ) -> bool:
         return dummy_hasher(plain_password) == hashed_password
 
 
+class BusyPasswordHasher(auth.PasswordHashService):
+    async def create(self, /, plain_password: pydantic.SecretStr) -> str:
+        raise core.exception.ServiceBusy("Too many password hashes are pending.")
+
+    async def verify(
+        self, *, hashed_password: str, plain_password: pydantic.SecretStr
+    ) -> bool:
+        raise core.exception.ServiceBusy("Too many password hashes are pending.")
+
+
 class DummyTokenService(auth.TokenService):
     def create(self, /, data: typing.Dict[str, typing.Any]) -> domain.Token:
         return domain.Token(access_token=ACCESS_TOKEN, token_type="bearer")
@@ -39,7 +51,7 @@ class DummyTokenService(auth.TokenService):
 
 
 class DummyUserService(auth.UserService):
-    def create_user(
+    async def create_user(
         self, *, username: str, email: pydantic.EmailStr, password_hash: str
     ) -> domain.User:
         return domain.User(
@@ -49,7 +61,7 @@ class DummyUserService(auth.UserService):
             password_hash=password_hash,
         )
 
-    def get_user(self, /, username: str) -> domain.User:
+    async def get_user(self, /, username: str) -> domain.User:
         return domain.User(
             user_id=1,
             username="test_user",
@@ -57,7 +69,7 @@ class DummyUserService(auth.UserService):
             password_hash=PASSWORD_HASH,
         )
 
-    def remove_user(self, username: str) -> None:
+    async def remove_user(self, username: str) -> None:
         pass
 
 
@@ -71,8 +83,10 @@ def test_get_current_active_user_happy_path() -> None:
     token_service = DummyTokenService()
     user_service = DummyUserService()
 
-    user = get_current_active_user(
-        token=ACCESS_TOKEN, token_service=token_service, user_service=user_service
+    user = asyncio.run(
+        get_current_active_user(
+            token=ACCESS_TOKEN, token_service=token_service, user_service=user_service
+        )
     )
     assert user == auth.User(
         user_id=1,
@@ -134,3 +148,30 @@ def test_register_happy_path():
         )
     )
     assert result == api.UserResponse(username=username, email=email)
+
+
+def test_login_and_register_answer_503_with_retry_after_when_the_hasher_is_busy() -> None:
+    with pytest.raises(fastapi.HTTPException) as login_error:
+        asyncio.run(
+            login(
+                form_data=MockOAuth2PasswordRequestForm(username="test_user", password="1234"),
+                user_service=DummyUserService(),
+                password_hasher=BusyPasswordHasher(),
+                token_service=DummyTokenService(),
+            )
+        )
+    with pytest.raises(fastapi.HTTPException) as register_error:
+        asyncio.run(
+            register(
+                username="test_user",
+                email=pydantic.EmailStr("test_user@gmail.com"),
+                password="1234",
+                user_service=DummyUserService(),
+                password_hasher=BusyPasswordHasher(),
+            )
+        )
+
+    for error in (login_error.value, register_error.value):
+        response = asyncio.run(api.http_error_handler(None, error))  # type: ignore
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
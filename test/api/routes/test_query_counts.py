@@ -0,0 +1,153 @@
+import asyncio
+import datetime
+import typing
+
+import pydantic
+import pytest
+import sqlalchemy as sa
+from sqlalchemy import orm, pool
+
+from src import auth, core, todo
+from src.api.routes import get_current_active_user
+from src.api.routes.todos import add_todos, all_todos, mark_todo_complete, update_daily_todo, update_todos
+
+TODAY = datetime.date(2021, 3, 20)
+
+
+class Services(typing.NamedTuple):
+    query_log: core.QueryLog
+    session_factory: orm.sessionmaker
+    user: auth.User
+
+    def todo_service(self) -> todo.TodoService:
+        return todo.SqlAlchemyTodoService(core.SqlAlchemyUnitOfWork(self.session_factory))
+
+    def user_service(self) -> auth.UserService:
+        return auth.SqlalchemyUserService(core.SqlAlchemyUnitOfWork(self.session_factory))
+
+
+@pytest.fixture(scope="function")
+def services() -> Services:
+    # the sync services run their sessions in the threadpool
+    engine = sa.create_engine(
+        "sqlite://", poolclass=pool.StaticPool, connect_args={"check_same_thread": False}
+    )
+    with engine.begin() as con:
+        con.execute(sa.text("ATTACH DATABASE ':memory:' AS auth"))
+        con.execute(sa.text("ATTACH DATABASE ':memory:' AS todo"))
+        core.Base.metadata.create_all(con)
+    query_log = core.QueryLog()
+    query_log.listen(engine)
+    session_factory = orm.sessionmaker(bind=engine)
+    user_service = auth.SqlalchemyUserService(core.SqlAlchemyUnitOfWork(session_factory))
+    user = asyncio.run(
+        user_service.create_user(
+            username="test_user", email=pydantic.EmailStr("test_user@gmail.com"), password_hash="1234" * 15
+        )
+    )
+    return Services(query_log=query_log, session_factory=session_factory, user=user)
+
+
+def add_daily_todos(services: Services, /, count: int) -> typing.List[int]:
+    result = asyncio.run(
+        add_todos(
+            items=[
+                {"frequency": "daily", "description": f"Todo {i}", "start_date": TODAY.isoformat()}
+                for i in range(count)
+            ],
+            today=TODAY,
+            current_user=services.user,
+            todo_service=services.todo_service(),
+        )
+    )
+    return [item.todo_id for item in result.results]
+
+
+def test_get_current_active_user_runs_one_query(services: Services) -> None:
+    class TokenService(auth.TokenService):
+        def create(self, /, data: typing.Dict[str, typing.Any]) -> auth.Token:
+            raise NotImplementedError
+
+        def username(self, /, token: str) -> str:
+            return token
+
+    with services.query_log.record() as queries:
+        user = asyncio.run(
+            get_current_active_user(
+                token="test_user", token_service=TokenService(), user_service=services.user_service()
+            )
+        )
+    assert user.user_id == services.user.user_id
+    assert len(queries) == 1
+
+
+def test_add_todos_only_runs_the_inserts(services: Services) -> None:
+    with services.query_log.record() as queries:
+        todo_ids = add_daily_todos(services, 20)
+    assert len(todo_ids) == 20
+    # sqlite can't return the ids of an executemany, so the ORM inserts a row at a time, but reads nothing per row
+    assert [statement.split()[0] for statement in core.repeated_statements(queries, at_least=2)] == ["INSERT"]
+    assert len(queries) == 20
+
+
+def test_all_todos_runs_one_query(services: Services) -> None:
+    add_daily_todos(services, 20)
+    with services.query_log.record() as queries:
+        asyncio.run(
+            all_todos(
+                after=None,
+                limit=None,
+                stream=False,
+                if_none_match=None,
+                today=TODAY,
+                current_user=services.user,
+                todo_service=services.todo_service(),
+                todo_list_cache=None,
+            )
+        )
+    assert len(queries) == 1
+
+
+def test_updating_and_completing_a_todo_skip_the_read_before_the_write(services: Services) -> None:
+    [todo_id] = add_daily_todos(services, 1)
+
+    # sqlite can't return the updated row, so the row is selected after the UPDATE, with RETURNING it is one query
+    with services.query_log.record() as queries:
+        updated = asyncio.run(
+            update_daily_todo(
+                todo_id=todo_id,
+                description="Make Bed",
+                today=TODAY,
+                current_user=services.user,
+                todo_service=services.todo_service(),
+            )
+        )
+    assert updated.description == "Make Bed"
+    assert [q.statement.split()[0] for q in queries] == ["UPDATE", "SELECT"]
+
+    with services.query_log.record() as queries:
+        completed = asyncio.run(
+            mark_todo_complete(
+                todo_id=todo_id, today=TODAY, current_user=services.user, todo_service=services.todo_service()
+            )
+        )
+    assert completed.todo_id == todo_id
+    assert [q.statement.split()[0] for q in queries] == ["UPDATE", "SELECT"]
+
+
+def test_update_todos_writes_only_the_given_columns(services: Services) -> None:
+    todo_ids = add_daily_todos(services, 2)
+
+    with services.query_log.record() as queries:
+        result = asyncio.run(
+            update_todos(
+                items=[{"todo_id": todo_id, "note": f"Note {todo_id}"} for todo_id in todo_ids],
+                today=TODAY,
+                current_user=services.user,
+                todo_service=services.todo_service(),
+            )
+        )
+    assert [r.todo.note for r in result.results] == [f"Note {todo_id}" for todo_id in todo_ids]
+    updates = [q.statement for q in queries if q.statement.startswith("UPDATE")]
+    assert len(updates) == 2
+    assert all("note=" in statement and "date_added" not in statement for statement in updates)
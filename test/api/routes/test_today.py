@@ -0,0 +1,23 @@
+import asyncio
+import datetime
+
+import fastapi
+import freezegun
+import pytest
+import zoneinfo
+
+from src.api.routes.today import get_today
+
+
+@freezegun.freeze_time("2021-06-15 18:00:00")
+def test_get_today_uses_the_callers_timezone() -> None:
+    assert asyncio.run(get_today(x_timezone="Pacific/Kiritimati", default_timezone=None)) == datetime.date(2021, 6, 16)
+    assert asyncio.run(get_today(x_timezone="America/Los_Angeles", default_timezone=None)) == datetime.date(2021, 6, 15)
+    assert asyncio.run(
+        get_today(x_timezone=None, default_timezone=zoneinfo.ZoneInfo("Asia/Tokyo"))
+    ) == datetime.date(2021, 6, 16)
+
+
+def test_get_today_rejects_unknown_timezones() -> None:
+    with pytest.raises(fastapi.HTTPException):
+        asyncio.run(get_today(x_timezone="Mars/Olympus_Mons", default_timezone=None))
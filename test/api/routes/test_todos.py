@@ -2,8 +2,10 @@ import asyncio
 import datetime
 import typing
 
+import fastapi
 import freezegun
 import pydantic
+import pytest
 
 from src.api.routes.todos import (
     update_todo,
@@ -21,7 +23,16 @@ from src.api.routes.todos import (
     update_xdays_todo,
     add_yearly_todo,
     delete_todo,
+    current_todos,
+    mark_todo_complete,
+    mark_todos_complete,
     all_todos,
+    add_todos,
+    update_todos,
+    delete_todos,
+    ndjson_lines,
+    todo_calendar,
+    calendar_lines,
 )
 
 from src import todo as todo_domain, core, api, auth
@@ -31,41 +42,114 @@ class DummyTodoService(todo_domain.TodoService):
     def __init__(self, /, todos: typing.List[todo_domain.Todo]):
         self._todos = todos
 
-    def all(self, /, user_id: int) -> typing.List[todo_domain.Todo]:
+    async def all(self, /, user_id: int) -> typing.List[todo_domain.Todo]:
         return self._todos
 
-    def add_todo(self, *, user_id: int, todo: todo_domain.Todo) -> todo_domain.Todo:
+    async def add_todo(self, *, user_id: int, todo: todo_domain.Todo, today: datetime.date) -> todo_domain.Todo:
         self._todos.append(todo)
         return todo
 
-    def delete_todo(self, *, user_id: int, todo_id: int) -> None:
+    async def add_todos(
+        self, *, user_id: int, todos: typing.List[todo_domain.Todo], today: datetime.date
+    ) -> typing.List[todo_domain.Todo]:
+        next_id = max((t.todo_id for t in self._todos), default=0) + 1
+        new_todos = [t.copy(update={"todo_id": next_id + i}) for i, t in enumerate(todos)]
+        self._todos.extend(new_todos)
+        return new_todos
+
+    async def delete_todo(self, *, user_id: int, todo_id: int) -> None:
         self._todos = [t for t in self._todos if t.todo_id != todo_id]
 
-    def get_by_id(
+    async def delete_todos(self, *, user_id: int, todo_ids: typing.List[int]) -> typing.List[int]:
+        deleted = [t.todo_id for t in self._todos if t.user_id == user_id and t.todo_id in todo_ids]
+        self._todos = [t for t in self._todos if t.todo_id not in deleted]
+        return deleted
+
+    async def get_by_id(
         self, *, user_id: int, todo_id: int
     ) -> typing.Optional[todo_domain.Todo]:
         return next(
             t for t in self._todos if t.user_id == user_id and t.todo_id == todo_id
         )
 
-    def get_current_todos(
+    async def get_by_ids(
+        self, *, user_id: int, todo_ids: typing.List[int]
+    ) -> typing.List[todo_domain.Todo]:
+        return [t for t in self._todos if t.user_id == user_id and t.todo_id in todo_ids]
+
+    async def get_current_todos(
         self,
         *,
         user_id: int,
         category: str,
-        today: datetime.date = datetime.date.today(),
+        today: datetime.date,
     ) -> typing.List[todo_domain.Todo]:
-        raise NotImplementedError
+        return [
+            t for t in self._todos
+            if t.user_id == user_id and t.category == category and t.display(today)
+        ]
 
-    def get_todos_completed_today(
-        self, *, user_id: int, today: datetime.date = datetime.date.today()
+    async def get_todos_completed_today(
+        self, *, user_id: int, today: datetime.date
     ) -> typing.List[todo_domain.Todo]:
         raise NotImplementedError
 
-    def mark_complete(self, *, user_id: int, todo_id: int) -> None:
+    async def mark_complete(
+        self, *, user_id: int, todo_id: int, today: datetime.date
+    ) -> typing.Optional[todo_domain.Todo]:
+        completed = await self.mark_many_complete(user_id=user_id, todo_ids=[todo_id], today=today)
+        return completed[0] if completed else None
+
+    async def mark_many_complete(
+        self, *, user_id: int, todo_ids: typing.List[int], today: datetime.date
+    ) -> typing.List[todo_domain.Todo]:
+        self._todos = [
+            t.copy(update={"date_completed": today})
+            if t.user_id == user_id and t.todo_id in todo_ids else t
+            for t in self._todos
+        ]
+        return [t for t in self._todos if t.user_id == user_id and t.todo_id in todo_ids]
+
+    async def page(
+        self, *, user_id: int, after_id: typing.Optional[int], limit: int
+    ) -> typing.List[todo_domain.Todo]:
+        return [t for t in sorted(self._todos, key=lambda t: t.todo_id) if t.todo_id > (after_id or 0)][:limit]
+
+    async def patch_todo(
+        self,
+        *,
+        user_id: int,
+        todo_id: int,
+        todo_type: typing.Type[todo_domain.Todo],
+        updates: typing.Dict[str, typing.Any],
+    ) -> typing.Optional[todo_domain.Todo]:
+        values = todo_type.validate_updates(updates)
+        for index, t in enumerate(self._todos):
+            if (
+                t.user_id == user_id
+                and t.todo_id == todo_id
+                and (set(values) <= set(todo_domain.Todo.__fields__) or type(t) is todo_type)
+            ):
+                self._todos[index] = t.copy(update=values)
+                return self._todos[index]
+        return None
+
+    async def patch_todos(
+        self, *, user_id: int, patches: typing.List[todo_domain.TodoPatch]
+    ) -> typing.List[typing.Optional[todo_domain.Todo]]:
+        return [
+            await self.patch_todo(user_id=user_id, todo_id=p.todo_id, todo_type=p.todo_type, updates=p.updates)
+            for p in patches
+        ]
+
+    async def refresh_due_dates(self, *, today: datetime.date) -> int:
         raise NotImplementedError
 
-    def update_todo(self, *, user_id: int, todo: todo_domain.Todo) -> todo_domain.Todo:
+    async def stream(self, *, user_id: int) -> typing.AsyncIterator[todo_domain.Todo]:
+        for t in sorted(self._todos, key=lambda t: t.todo_id):
+            yield t
+
+    async def update_todo(self, *, user_id: int, todo: todo_domain.Todo, today: datetime.date) -> todo_domain.Todo:
         self._todos = []
         for t in self._todos:
             if t.todo_id == todo.todo_id:
@@ -105,11 +189,15 @@ def test_update_todo_happy_path():
             ),
         ]
     )
-    result = update_todo(
-        user_id=1,
-        todo_id=1,
-        todo_service=todo_service,
-        updates={"date_completed": datetime.date(2011, 2, 3)},
+    result = asyncio.run(
+        update_todo(
+            today=datetime.date.today(),
+            user_id=1,
+            todo_id=1,
+            todo_type=todo_domain.Daily,
+            todo_service=todo_service,
+            updates={"date_completed": datetime.date(2011, 2, 3)},
+        )
     )
     assert result == api.TodoResponse(
         todo_id=1,
@@ -127,6 +215,7 @@ def test_add_daily_todo_happy_path() -> None:
     todo_service = DummyTodoService([])
     result = asyncio.run(
         add_daily_todo(
+            today=datetime.date.today(),
             description="Make bed",
             note=None,
             start_date=datetime.date(2010, 1, 1),
@@ -180,6 +269,7 @@ def test_update_daily_todo_happy_path() -> None:
     )
     result = asyncio.run(
         update_daily_todo(
+            today=datetime.date.today(),
             todo_id=2,
             description="Make bed",
             current_user=auth.User(
@@ -207,6 +297,7 @@ def test_add_irregular_todo_happy_path() -> None:
     todo_service = DummyTodoService([])
     result = asyncio.run(
         add_irregular_todo(
+            today=datetime.date.today(),
             description="Make bed",
             note=None,
             start_date=datetime.date(2010, 1, 1),
@@ -270,6 +361,7 @@ def test_update_irregular_todo_happy_path() -> None:
     )
     result = asyncio.run(
         update_irregular_todo(
+            today=datetime.date.today(),
             todo_id=2,
             description="Make bed",
             current_user=auth.User(
@@ -297,6 +389,7 @@ def test_add_monthly_todo_happy_path():
     todo_service = DummyTodoService([])
     result = asyncio.run(
         add_monthly_todo(
+            today=datetime.date.today(),
             description="Dust",
             advance_days=3,
             month_day=10,
@@ -356,6 +449,7 @@ def test_update_monthly_todo_happy_path():
     )
     result = asyncio.run(
         update_monthly_todo(
+            today=datetime.date.today(),
             todo_id=1,
             description="Dust Really Good",
             current_user=auth.User(
@@ -383,6 +477,7 @@ def test_add_one_time_todo_happy_path():
     todo_service = DummyTodoService([])
     result = asyncio.run(
         add_one_time_todo(
+            today=datetime.date.today(),
             description="Make Bed",
             date=datetime.date(2010, 1, 1),
             note=None,
@@ -438,6 +533,7 @@ def test_update_one_time_todo_happy_path():
     )
     result = asyncio.run(
         update_one_time_todo(
+            today=datetime.date.today(),
             todo_id=2,
             description="Make Bed",
             date=datetime.date(2010, 1, 1),
@@ -467,6 +563,7 @@ def test_add_weekly_todo_happy_path():
     todo_service = DummyTodoService([])
     result = asyncio.run(
         add_weekly_todo(
+            today=datetime.date.today(),
             description="Make Bed",
             start_date=datetime.date(2010, 1, 1),
             note=None,
@@ -523,6 +620,7 @@ def test_update_one_time_todo_happy_path():
     )
     result = asyncio.run(
         update_weekly_todo(
+            today=datetime.date.today(),
             todo_id=2,
             description="Vaccum",
             current_user=auth.User(
@@ -550,6 +648,7 @@ def test_add_xdays_todo_happy_path():
     todo_service = DummyTodoService([])
     result = asyncio.run(
         add_xdays_todo(
+            today=datetime.date.today(),
             description="Make Bed",
             start_date=datetime.date(2010, 1, 1),
             note=None,
@@ -606,6 +705,7 @@ def test_update_xdays_todo_happy_path():
     )
     result = asyncio.run(
         update_xdays_todo(
+            today=datetime.date.today(),
             todo_id=2,
             description="Vaccum",
             current_user=auth.User(
@@ -633,6 +733,7 @@ def test_add_yearly_todo_happy_path():
     todo_service = DummyTodoService([])
     result = asyncio.run(
         add_yearly_todo(
+            today=datetime.date.today(),
             description="Make Bed",
             start_date=datetime.date(2010, 1, 1),
             note=None,
@@ -692,6 +793,7 @@ def test_update_yearly_todo_happy_path():
     )
     result = asyncio.run(
         update_xdays_todo(
+            today=datetime.date.today(),
             todo_id=2,
             description="Vaccum",
             current_user=auth.User(
@@ -759,6 +861,7 @@ def test_delete_todo():
     assert result is None
 
 
+@freezegun.freeze_time("2021-03-20")
 def test_all_todos_happy_path():
     todo_service = DummyTodoService(
         [
@@ -791,6 +894,7 @@ def test_all_todos_happy_path():
     )
     result = asyncio.run(
         all_todos(
+            today=datetime.date.today(),
             current_user=auth.User(
                 user_id=1,
                 username="test_user",
@@ -798,9 +902,11 @@ def test_all_todos_happy_path():
                 password_hash="1234" * 15,
             ),
             todo_service=todo_service,
+            if_none_match=None,
+            todo_list_cache=None,
         )
     )
-    assert result == [
+    assert pydantic.parse_raw_as(typing.List[api.TodoResponse], result.body) == [
         api.TodoResponse(
             todo_id=1,
             category=core.TodoCategory.Todo,
@@ -820,3 +926,460 @@ def test_all_todos_happy_path():
             note="",
         ),
     ]
+
+
+BULK_USER = auth.User(
+    user_id=1,
+    username="test_user",
+    email=pydantic.EmailStr("test_user@gmail.com"),
+    password_hash="1234" * 15,
+)
+
+
+@freezegun.freeze_time("2010-01-01")
+def test_add_todos_reports_errors_per_item() -> None:
+    todo_service = DummyTodoService([])
+    result = asyncio.run(
+        add_todos(
+            today=datetime.date.today(),
+            items=[
+                {"frequency": "daily", "description": "Make bed"},
+                {"frequency": "hourly", "description": "Blink"},
+                {"frequency": "monthly", "description": "Pay rent", "month_day": 1, "advance_days": 3},
+                {"frequency": "weekly", "description": "Mow lawn", "week_day": 9},
+                {"frequency": "yearly", "description": "Never", "month": 2, "day": 30},
+            ],
+            current_user=BULK_USER,
+            todo_service=todo_service,
+        )
+    )
+    assert [r.index for r in result.results] == [0, 1, 2, 3, 4]
+    assert [r.todo_id for r in result.results] == [1, None, 2, None, None]
+    assert result.results[0].todo == api.TodoResponse(
+        todo_id=1,
+        category=core.TodoCategory.Todo,
+        description="Make bed",
+        frequency="Daily",
+        next=datetime.date(2010, 1, 1),
+        display=True,
+        note="",
+    )
+    assert result.results[1].errors[0]["loc"] == ["frequency"]
+    assert result.results[3].errors[0]["loc"] == ("week_day",)
+    assert result.results[4].errors[0]["loc"] == ("__root__",)
+    assert [t.description for t in todo_service._todos] == ["Make bed", "Pay rent"]
+
+
+@freezegun.freeze_time("2010-01-01")
+def test_update_todos_reports_errors_per_item() -> None:
+    todo_service = DummyTodoService(
+        [
+            todo_domain.Monthly(
+                todo_id=1,
+                user_id=1,
+                category=core.TodoCategory.Todo,
+                description="Pay rent",
+                advance_days=3,
+                note="",
+                start_date=datetime.date(2009, 1, 1),
+                date_added=datetime.date(2009, 1, 1),
+                date_completed=None,
+                month_day=1,
+            ),
+            todo_domain.Daily(
+                todo_id=2,
+                user_id=2,
+                category=core.TodoCategory.Todo,
+                description="Someone else's",
+                note="",
+                start_date=datetime.date(2009, 1, 1),
+                date_added=datetime.date(2009, 1, 1),
+                date_completed=None,
+            ),
+        ]
+    )
+    result = asyncio.run(
+        update_todos(
+            today=datetime.date.today(),
+            items=[
+                {"todo_id": 1, "description": "Pay the rent", "frequency": "daily"},
+                {"todo_id": 2, "description": "Not mine"},
+                {"todo_id": 1, "month_day": "first"},
+                {"todo_id": 1, "date_added": "2001-01-01", "next_due_date": "2001-01-01"},
+                {"todo_id": 1, "date_completed": "2010-01-01"},
+            ],
+            current_user=BULK_USER,
+            todo_service=todo_service,
+        )
+    )
+    assert result.results[0].todo.description == "Pay the rent"
+    assert result.results[0].todo.frequency == str(todo_service._todos[0])
+    assert result.results[1].errors[0]["msg"] == "Todo does not exist."
+    assert result.results[2].errors[0]["loc"] == ("month_day",)
+    assert [e["loc"] for e in result.results[3].errors] == [("date_added",), ("next_due_date",)]
+    assert result.results[4].errors[0]["loc"] == ["date_completed"]
+    assert todo_service._todos[0].date_added == datetime.date(2009, 1, 1)
+    assert todo_service._todos[0].date_completed is None
+    assert todo_service._todos[1].description == "Someone else's"
+
+
+@freezegun.freeze_time("2010-12-01")
+def test_bulk_and_single_routes_check_the_same_field_ranges() -> None:
+    todo_service = DummyTodoService(
+        [
+            todo_domain.XDays(
+                todo_id=1,
+                user_id=1,
+                category=core.TodoCategory.Todo,
+                description="Water plants",
+                advance_days=0,
+                note="",
+                start_date=datetime.date(2010, 1, 1),
+                date_added=datetime.date(2010, 1, 1),
+                date_completed=None,
+                days=3,
+            )
+        ]
+    )
+    today = datetime.date.today()
+    added = asyncio.run(
+        add_todos(
+            today=today,
+            items=[
+                {"frequency": "xdays", "description": "Never", "days": 0, "start_date": "2010-01-01"},
+                # December and January both have a 31st, but February doesn't
+                {"frequency": "monthly", "description": "Pay rent", "month_day": 31},
+            ],
+            current_user=BULK_USER,
+            todo_service=todo_service,
+        )
+    )
+    assert [r.errors[0]["loc"] for r in added.results] == [("days",), ("month_day",)]
+
+    patched = asyncio.run(
+        update_todos(
+            today=today,
+            items=[{"todo_id": 1, "days": 0}, {"todo_id": 1, "advance_days": -1}],
+            current_user=BULK_USER,
+            todo_service=todo_service,
+        )
+    )
+    assert [r.errors[0]["loc"] for r in patched.results] == [("days",), ("advance_days",)]
+    assert todo_service._todos[0].days == 3
+
+    with pytest.raises(fastapi.HTTPException) as e:
+        asyncio.run(
+            add_xdays_todo(
+                today=today,
+                description="Never",
+                start_date=datetime.date(2010, 1, 1),
+                days=0,
+                note=None,
+                current_user=BULK_USER,
+                todo_service=todo_service,
+            )
+        )
+    assert e.value.status_code == 400
+
+    with pytest.raises(fastapi.HTTPException) as e:
+        asyncio.run(
+            update_monthly_todo(
+                today=today,
+                todo_id=1,
+                description=None,
+                advance_days=None,
+                month_day=31,
+                note=None,
+                start_date=None,
+                current_user=BULK_USER,
+                todo_service=todo_service,
+            )
+        )
+    assert e.value.status_code == 400
+    assert len(todo_service._todos) == 1
+
+
+def test_delete_todos_reports_missing_todos() -> None:
+    todo_service = DummyTodoService(
+        [
+            todo_domain.Daily(
+                todo_id=todo_id,
+                user_id=user_id,
+                category=core.TodoCategory.Todo,
+                description="Dust",
+                note="",
+                start_date=datetime.date(2009, 1, 1),
+                date_added=datetime.date(2009, 1, 1),
+                date_completed=None,
+            )
+            for todo_id, user_id in [(1, 1), (2, 1), (3, 2)]
+        ]
+    )
+    result = asyncio.run(
+        delete_todos(todo_ids=[2, 3, 4], current_user=BULK_USER, todo_service=todo_service)
+    )
+    assert [(r.todo_id, r.errors is None) for r in result.results] == [(2, True), (3, False), (4, False)]
+    assert [t.todo_id for t in todo_service._todos] == [1, 3]
+
+
+def make_daily_todos(count: int, /) -> typing.List[todo_domain.Todo]:
+    return [
+        todo_domain.Daily(
+            todo_id=todo_id,
+            user_id=1,
+            category=core.TodoCategory.Todo,
+            description=f"Todo {todo_id}",
+            note="",
+            start_date=datetime.date(2009, 1, 1),
+            date_added=datetime.date(2009, 1, 1),
+            date_completed=None,
+        )
+        for todo_id in range(1, count + 1)
+    ]
+
+
+def test_all_todos_pages_by_todo_id() -> None:
+    todo_service = DummyTodoService(make_daily_todos(5))
+    first_page = asyncio.run(
+        all_todos(today=datetime.date.today(), limit=2, current_user=BULK_USER, todo_service=todo_service)
+    )
+    assert [t.todo_id for t in pydantic.parse_raw_as(typing.List[api.TodoResponse], first_page.body)] == [1, 2]
+    assert first_page.headers["X-Next-After"] == "2"
+
+    last_page = asyncio.run(
+        all_todos(today=datetime.date.today(), after=4, limit=2, current_user=BULK_USER, todo_service=todo_service)
+    )
+    assert [t.todo_id for t in pydantic.parse_raw_as(typing.List[api.TodoResponse], last_page.body)] == [5]
+    assert "X-Next-After" not in last_page.headers
+
+
+def test_all_todos_rejects_pages_that_are_too_big() -> None:
+    with pytest.raises(fastapi.HTTPException):
+        asyncio.run(all_todos(today=datetime.date.today(), limit=1_001, current_user=BULK_USER, todo_service=DummyTodoService([])))
+
+
+@freezegun.freeze_time("2010-01-01")
+def test_ndjson_lines() -> None:
+    todo_service = DummyTodoService(make_daily_todos(3))
+
+    async def collect() -> typing.List[str]:
+        return [line async for line in ndjson_lines(todo_service.stream(user_id=1), today=datetime.date.today())]
+
+    lines = asyncio.run(collect())
+    assert all(line.endswith("\n") for line in lines)
+    assert [api.TodoResponse.parse_raw(line).todo_id for line in lines] == [1, 2, 3]
+
+
+def test_calendar_lines_are_in_date_order() -> None:
+    weekly = todo_domain.Weekly(
+        todo_id=4,
+        user_id=1,
+        category=core.TodoCategory.Todo,
+        description="Weekly",
+        note="",
+        start_date=datetime.date(2009, 1, 1),
+        date_added=datetime.date(2009, 1, 1),
+        date_completed=None,
+        week_day=todo_domain.Weekday.Monday,
+        advance_days=0,
+    )
+    lines = list(
+        calendar_lines(
+            [*make_daily_todos(1), weekly], start=datetime.date(2021, 3, 1), end=datetime.date(2021, 3, 8)
+        )
+    )
+    occurrences = [api.OccurrenceResponse.parse_raw(line) for line in lines]
+    assert [(o.date.day, o.todo_id) for o in occurrences] == [
+        (1, 1), (1, 4), (2, 1), (3, 1), (4, 1), (5, 1), (6, 1), (7, 1), (8, 1), (8, 4)
+    ]
+
+
+def test_todo_calendar_rejects_bad_ranges() -> None:
+    for start, end in [
+        (datetime.date(2021, 3, 2), datetime.date(2021, 3, 1)),
+        (datetime.date(2000, 1, 1), datetime.date(2021, 1, 1)),
+    ]:
+        with pytest.raises(fastapi.HTTPException):
+            asyncio.run(
+                todo_calendar(start=start, end=end, current_user=BULK_USER, todo_service=DummyTodoService([]))
+            )
+
+
+class CountingTodoService(DummyTodoService):
+    def __init__(self, todos: typing.List[todo_domain.Todo]):
+        super().__init__(todos)
+        self.all_calls = 0
+        self.current_calls = 0
+
+    async def all(self, /, user_id: int) -> typing.List[todo_domain.Todo]:
+        self.all_calls += 1
+        return await super().all(user_id)
+
+    async def get_current_todos(
+        self, *, user_id: int, category: str, today: datetime.date
+    ) -> typing.List[todo_domain.Todo]:
+        self.current_calls += 1
+        return await super().get_current_todos(user_id=user_id, category=category, today=today)
+
+
+def test_all_todos_serves_cached_lists_and_not_modified() -> None:
+    inner = CountingTodoService(make_daily_todos(2))
+    cache = todo_domain.InMemoryTodoListCache(max_size=10, ttl_seconds=60)
+    todo_service = todo_domain.CachedTodoService(inner, cache=cache)
+
+    def get(if_none_match: typing.Optional[str] = None) -> fastapi.Response:
+        return asyncio.run(
+            all_todos(
+                today=datetime.date.today(),
+                if_none_match=if_none_match,
+                current_user=BULK_USER,
+                todo_service=todo_service,
+                todo_list_cache=cache,
+            )
+        )
+
+    first = get()
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+    assert [t.todo_id for t in pydantic.parse_raw_as(typing.List[api.TodoResponse], first.body)] == [1, 2]
+
+    not_modified = get(if_none_match=etag)
+    assert not_modified.status_code == 304
+    assert not_modified.body == b""
+    assert get(if_none_match=f'"other", W/{etag}').status_code == 304
+    assert inner.all_calls == 1
+
+    asyncio.run(todo_service.delete_todo(user_id=BULK_USER.user_id, todo_id=1))
+    changed = get(if_none_match=etag)
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert [t.todo_id for t in pydantic.parse_raw_as(typing.List[api.TodoResponse], changed.body)] == [2]
+    assert inner.all_calls == 2
+
+
+def test_calendar_lines_merge_in_the_holiday_calendar() -> None:
+    lines = list(
+        calendar_lines(
+            make_daily_todos(1),
+            start=datetime.date(2021, 12, 24),
+            end=datetime.date(2021, 12, 26),
+            holiday_calendar=todo_domain.HolidayCalendar(first_year=2021, last_year=2021),
+        )
+    )
+    occurrences = [api.OccurrenceResponse.parse_raw(line) for line in lines]
+    assert [(o.date.day, o.description) for o in occurrences] == [
+        (24, "Todo 1"), (25, "Todo 1"), (25, "Christmas"), (26, "Todo 1")
+    ]
+
+
+def test_current_todos_hide_todos_once_marked_complete() -> None:
+    today = datetime.date(2021, 3, 20)
+    current_user = auth.User(
+        user_id=1,
+        username="test_user",
+        email=pydantic.EmailStr("test_user@gmail.com"),
+        password_hash="1234" * 15,
+    )
+    inner = CountingTodoService(
+        [
+            todo_domain.Daily(
+                todo_id=todo_id,
+                user_id=1,
+                category=category,
+                description=f"Todo {todo_id}",
+                advance_days=0,
+                note="",
+                start_date=datetime.date(2021, 1, 1),
+                date_added=datetime.date(2021, 1, 1),
+                date_completed=None,
+            )
+            for todo_id, category in (
+                (1, core.TodoCategory.Todo),
+                (2, core.TodoCategory.Todo),
+                (3, core.TodoCategory.Reminder),
+            )
+        ]
+    )
+    cache = todo_domain.InMemoryTodoListCache(max_size=10, ttl_seconds=60)
+    todo_service = todo_domain.CachedTodoService(inner, cache=cache)
+
+    def current(category: core.TodoCategory = core.TodoCategory.Todo) -> typing.List[int]:
+        response = asyncio.run(
+            current_todos(
+                category=category,
+                if_none_match=None,
+                today=today,
+                current_user=current_user,
+                todo_service=todo_service,
+                todo_list_cache=cache,
+            )
+        )
+        return [t.todo_id for t in pydantic.parse_raw_as(typing.List[api.TodoResponse], response.body)]
+
+    assert current() == [1, 2]
+    assert current() == [1, 2]
+    assert current(core.TodoCategory.Reminder) == [3]
+    # cached per category, and apart from the full list
+    assert inner.current_calls == 2
+    assert inner.all_calls == 0
+    result = asyncio.run(
+        mark_todo_complete(
+            todo_id=1, today=today, current_user=current_user, todo_service=todo_service
+        )
+    )
+    assert result.todo_id == 1
+    assert not result.display
+    assert current() == [2]
+    assert inner.current_calls == 3
+
+    with pytest.raises(fastapi.HTTPException) as e:
+        asyncio.run(
+            mark_todo_complete(
+                todo_id=4, today=today, current_user=current_user, todo_service=todo_service
+            )
+        )
+    assert e.value.status_code == 404
+
+
+def test_mark_todos_complete_reports_missing_todos() -> None:
+    todo_service = DummyTodoService(make_daily_todos(3))
+    result = asyncio.run(
+        mark_todos_complete(
+            todo_ids=[3, 7, 1],
+            today=datetime.date(2021, 3, 20),
+            current_user=BULK_USER,
+            todo_service=todo_service,
+        )
+    )
+    assert [r.todo_id for r in result.results] == [3, 7, 1]
+    assert [r.errors is None for r in result.results] == [True, False, True]
+    assert [r.todo.display for r in result.results if r.todo] == [False, False]
+
+
+def test_update_todo_rejects_invalid_updates_and_missing_todos() -> None:
+    todo_service = DummyTodoService(make_daily_todos(1))
+    with pytest.raises(fastapi.HTTPException) as e:
+        asyncio.run(
+            update_todo(
+                today=datetime.date(2021, 3, 20),
+                user_id=1,
+                todo_id=1,
+                todo_type=todo_domain.Daily,
+                todo_service=todo_service,
+                updates={"advance_days": "soon"},
+            )
+        )
+    assert e.value.status_code == 400
+
+    with pytest.raises(fastapi.HTTPException) as e:
+        asyncio.run(
+            update_todo(
+                today=datetime.date(2021, 3, 20),
+                user_id=1,
+                todo_id=1,
+                todo_type=todo_domain.Weekly,
+                todo_service=todo_service,
+                updates={"week_day": 3},
+            )
+        )
+    assert e.value.status_code == 404
@@ -0,0 +1,42 @@
+import datetime
+import typing
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+
+from src import api, core
+from src.api import json_response
+
+
+def make_responses() -> typing.List[api.TodoResponse]:
+    return [
+        api.TodoResponse.construct(
+            todo_id=todo_id,
+            category=core.TodoCategory.Reminder,
+            description='Café "au lait"\n',
+            frequency="Daily",
+            next=datetime.date(2021, 3, todo_id),
+            display=todo_id % 2 == 0,
+            note="",
+        )
+        for todo_id in range(1, 4)
+    ]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dump_todo_list_matches_json_response(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    if use_orjson and json_response.orjson is None:
+        pytest.skip("orjson is not installed")
+    if not use_orjson:
+        monkeypatch.setattr(json_response, "orjson", None)
+    todos = make_responses()
+    assert api.dump_todo_list(todos) == JSONResponse(jsonable_encoder(todos)).body
+
+
+def test_todo_list_response_renders_todos() -> None:
+    todos = make_responses()
+    result = api.TodoListResponse(todos, headers={"X-Next-After": "3"})
+    assert result.media_type == "application/json"
+    assert result.headers["X-Next-After"] == "3"
+    assert result.body == api.dump_todo_list(todos)
@@ -0,0 +1,31 @@
+import asyncio
+import typing
+
+import pytest
+from starlette.responses import PlainTextResponse
+from starlette.types import Receive, Scope, Send
+
+from src import api, core
+
+
+async def list_todos(scope: Scope, receive: Receive, send: Send) -> None:
+    scope["endpoint"] = list_todos
+    await PlainTextResponse("[]", status_code=200)(scope, receive, send)
+
+
+def test_metrics_middleware_times_requests_by_route(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(core.metrics, "enabled", True)
+    before = core.metrics.request_seconds.count(route="list_todos", status="200")
+    sent: typing.List[typing.Dict[str, typing.Any]] = []
+
+    async def receive() -> typing.Dict[str, typing.Any]:
+        return {"type": "http.request", "body": b""}
+
+    async def send(message: typing.Dict[str, typing.Any]) -> None:
+        sent.append(message)
+
+    middleware = api.MetricsMiddleware(list_todos)
+    asyncio.run(middleware({"type": "http", "method": "GET", "path": "/api/todos", "headers": []}, receive, send))
+
+    assert sent[0]["status"] == 200
+    assert core.metrics.request_seconds.count(route="list_todos", status="200") == before + 1
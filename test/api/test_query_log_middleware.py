@@ -0,0 +1,43 @@
+import asyncio
+import logging
+import typing
+
+import pytest
+import sqlalchemy as sa
+from starlette.responses import PlainTextResponse
+from starlette.types import Receive, Scope, Send
+
+from src import api, core
+
+ENGINE = sa.create_engine("sqlite://")
+
+
+async def list_todos(scope: Scope, receive: Receive, send: Send) -> None:
+    with ENGINE.connect() as con:
+        for todo_id in range(5):
+            con.execute(sa.text("SELECT :todo_id"), {"todo_id": todo_id})
+    await PlainTextResponse("[]", status_code=200)(scope, receive, send)
+
+
+def test_query_log_middleware_counts_queries_and_warns_about_repeated_ones(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    query_log = core.QueryLog()
+    query_log.listen(ENGINE)
+    sent: typing.List[typing.Dict[str, typing.Any]] = []
+
+    async def receive() -> typing.Dict[str, typing.Any]:
+        return {"type": "http.request", "body": b""}
+
+    async def send(message: typing.Dict[str, typing.Any]) -> None:
+        sent.append(message)
+
+    middleware = api.QueryLogMiddleware(list_todos, query_log=query_log)
+    with caplog.at_level(logging.WARNING, logger="todo-api.requests"):
+        asyncio.run(
+            middleware({"type": "http", "method": "GET", "path": "/api/todos", "headers": []}, receive, send)
+        )
+
+    assert (b"x-query-count", b"5") in sent[0]["headers"]
+    [record] = caplog.records
+    assert record.getMessage() == "GET /api/todos ran the same statement 5 times: SELECT ?"
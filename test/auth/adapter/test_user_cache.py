@@ -0,0 +1,134 @@
+import asyncio
+import threading
+import typing
+
+import pydantic
+
+from src import auth, core
+
+
+def make_user(username: str) -> auth.User:
+    return auth.User(
+        user_id=1,
+        username=username,
+        email=pydantic.EmailStr(f"{username}@gmail.com"),
+        password_hash="x" * 60,
+    )
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ThreadRecordingStore(core.InMemoryKeyValueStore):
+    """Records the threads the store is called from, a redis client blocks whichever thread calls it"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.threads: typing.Set[int] = set()
+
+    def get(self, name: str) -> typing.Optional[bytes]:
+        self.threads.add(threading.get_ident())
+        return super().get(name)
+
+    def set(self, name: str, value: bytes, ex: typing.Optional[int] = None) -> bool:
+        self.threads.add(threading.get_ident())
+        return super().set(name, value, ex=ex)
+
+    def delete(self, *names: str) -> int:
+        self.threads.add(threading.get_ident())
+        return super().delete(*names)
+
+
+async def set_user(cache: auth.UserCache, user: auth.User, /) -> None:
+    await cache.set(user, version=await cache.version(user.username))
+
+
+def test_in_memory_user_cache_evicts_least_recently_used() -> None:
+    async def main() -> None:
+        cache = auth.InMemoryUserCache(max_size=2, ttl_seconds=60)
+        await set_user(cache, make_user("a"))
+        await set_user(cache, make_user("b"))
+        assert await cache.get("a") == make_user("a")
+        await set_user(cache, make_user("c"))
+        assert await cache.get("b") is None
+        assert await cache.get("a") == make_user("a")
+        assert await cache.get("c") == make_user("c")
+
+    asyncio.run(main())
+
+
+def test_in_memory_user_cache_expires_entries() -> None:
+    async def main() -> None:
+        clock = FakeClock()
+        cache = auth.InMemoryUserCache(max_size=10, ttl_seconds=60, clock=clock)
+        await set_user(cache, make_user("a"))
+        clock.now = 59
+        assert await cache.get("a") == make_user("a")
+        clock.now = 60
+        assert await cache.get("a") is None
+
+    asyncio.run(main())
+
+
+def test_in_memory_user_cache_delete() -> None:
+    async def main() -> None:
+        cache = auth.InMemoryUserCache(max_size=10, ttl_seconds=60)
+        await set_user(cache, make_user("a"))
+        await cache.delete("a")
+        await cache.delete("missing")
+        assert await cache.get("a") is None
+
+    asyncio.run(main())
+
+
+def test_key_value_user_cache_round_trips_users_and_expires_them() -> None:
+    async def main() -> None:
+        clock = FakeClock()
+        cache = auth.KeyValueUserCache(core.InMemoryKeyValueStore(clock=clock), ttl_seconds=60)
+        await set_user(cache, make_user("a"))
+        assert await cache.get("a") == make_user("a")
+        clock.now = 60
+        assert await cache.get("a") is None
+
+        await set_user(cache, make_user("b"))
+        await cache.delete("b")
+        assert await cache.get("b") is None
+
+    asyncio.run(main())
+
+
+def test_key_value_user_cache_calls_the_store_off_the_event_loop() -> None:
+    store = ThreadRecordingStore()
+
+    async def main() -> None:
+        cache = auth.KeyValueUserCache(store, ttl_seconds=60)
+        await set_user(cache, make_user("a"))
+        assert await cache.get("a") == make_user("a")
+        await cache.delete("a")
+
+    asyncio.run(main())
+    assert store.threads
+    assert threading.get_ident() not in store.threads
+
+
+def test_user_caches_drop_users_read_before_a_delete() -> None:
+    async def main() -> None:
+        for cache in (
+            auth.InMemoryUserCache(max_size=10, ttl_seconds=60),
+            auth.KeyValueUserCache(core.InMemoryKeyValueStore(), ttl_seconds=60),
+        ):
+            version = await cache.version("a")
+            # the user is removed while a reader that took version is still reading it
+            await cache.delete("a")
+            await cache.set(make_user("a"), version=version)
+            assert await cache.get("a") is None, cache
+
+            await set_user(cache, make_user("a"))
+            assert await cache.get("a") == make_user("a"), cache
+
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+import asyncio
+import time
+
+import bcrypt
+import pydantic
+import pytest
+
+from src import auth, core
+
+
+class SlowContext:
+    """Stands in for the passlib context, taking as long as a bcrypt hash of cost 12"""
+
+    def hash(self, secret: str) -> str:
+        time.sleep(0.25)
+        return secret[::-1]
+
+    def verify(self, secret: str, hashed: str) -> bool:
+        time.sleep(0.25)
+        return secret[::-1] == hashed
+
+
+def make_hasher(**kwargs) -> auth.BcryptPasswordHashService:  # type: ignore
+    hasher = auth.BcryptPasswordHashService(**kwargs)
+    hasher._context = SlowContext()  # type: ignore
+    return hasher
+
+
+def test_bcrypt_password_hash_service_does_not_block_the_event_loop() -> None:
+    hasher = make_hasher(max_workers=2)
+
+    async def main() -> int:
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        hashed = await hasher.create(pydantic.SecretStr("1234"))
+        assert await hasher.verify(hashed_password=hashed, plain_password=pydantic.SecretStr("1234"))
+        ticker.cancel()
+        return ticks
+
+    try:
+        assert asyncio.run(main()) > 20
+    finally:
+        hasher.close()
+
+
+def test_bcrypt_password_hash_service_rejects_calls_beyond_max_pending() -> None:
+    hasher = make_hasher(max_workers=1, max_pending=2)
+
+    async def main() -> None:
+        results = await asyncio.gather(
+            *(hasher.create(pydantic.SecretStr(str(i))) for i in range(3)),
+            return_exceptions=True,
+        )
+        assert results[:2] == ["0", "1"]
+        assert isinstance(results[2], core.exception.ServiceBusy)
+        assert await hasher.create(pydantic.SecretStr("12")) == "21"
+
+    try:
+        asyncio.run(main())
+    finally:
+        hasher.close()
+
+
+@pytest.mark.skipif(
+    int(bcrypt.__version__.split(".")[0]) >= 5,
+    reason="passlib 1.7 cannot load bcrypt 5, which rejects passwords over 72 bytes",
+)
+def test_bcrypt_password_hash_service_round_trip() -> None:
+    hasher = auth.BcryptPasswordHashService(rounds=4)
+
+    async def main() -> None:
+        hashed = await hasher.create(pydantic.SecretStr("1234"))
+        assert hashed.startswith("$2b$04$")
+        assert await hasher.verify(hashed_password=hashed, plain_password=pydantic.SecretStr("1234"))
+        assert not await hasher.verify(hashed_password=hashed, plain_password=pydantic.SecretStr("4321"))
+
+    try:
+        asyncio.run(main())
+    finally:
+        hasher.close()
@@ -0,0 +1,97 @@
+import asyncio
+
+import pydantic
+import pytest
+
+from src import auth, core
+
+
+class CountingUserService(auth.UserService):
+    def __init__(self) -> None:
+        self.users = {}
+        self.get_user_calls = 0
+
+    async def create_user(
+        self, *, username: str, email: pydantic.EmailStr, password_hash: str
+    ) -> auth.User:
+        user = auth.User(
+            user_id=len(self.users) + 1,
+            username=username,
+            email=email,
+            password_hash=password_hash,
+        )
+        self.users[username] = user
+        return user
+
+    async def get_user(self, /, username: str) -> auth.User:
+        self.get_user_calls += 1
+        if user := self.users.get(username):
+            return user
+        raise core.exception.CredentialsException("User not found")
+
+    async def remove_user(self, username: str) -> None:
+        self.users.pop(username, None)
+
+
+def test_cached_user_service_only_looks_a_user_up_once() -> None:
+    inner = CountingUserService()
+    service = auth.CachedUserService(inner, cache=auth.InMemoryUserCache(max_size=10, ttl_seconds=60))
+
+    async def main() -> None:
+        created = await service.create_user(
+            username="mark", email=pydantic.EmailStr("mark@gmail.com"), password_hash="x" * 60
+        )
+        for _ in range(5):
+            assert await service.get_user("mark") == created
+
+    asyncio.run(main())
+    assert inner.get_user_calls == 1
+
+
+def test_cached_user_service_forgets_removed_and_recreated_users() -> None:
+    inner = CountingUserService()
+    service = auth.CachedUserService(inner, cache=auth.InMemoryUserCache(max_size=10, ttl_seconds=60))
+
+    async def main() -> None:
+        await service.create_user(
+            username="mark", email=pydantic.EmailStr("mark@gmail.com"), password_hash="x" * 60
+        )
+        await service.get_user("mark")
+        await service.remove_user("mark")
+        with pytest.raises(core.exception.CredentialsException):
+            await service.get_user("mark")
+
+        inner.users["mark"] = auth.User(
+            user_id=2, username="mark", email=pydantic.EmailStr("mark@gmail.com"), password_hash="y" * 60
+        )
+        await service.get_user("mark")
+        recreated = await service.create_user(
+            username="mark", email=pydantic.EmailStr("mark2@gmail.com"), password_hash="z" * 60
+        )
+        assert await service.get_user("mark") == recreated
+
+    asyncio.run(main())
+
+
+def test_cached_user_service_does_not_cache_a_user_removed_while_it_was_read() -> None:
+    inner = CountingUserService()
+    service = auth.CachedUserService(inner, cache=auth.InMemoryUserCache(max_size=10, ttl_seconds=60))
+
+    class RemovedWhileReading(CountingUserService):
+        async def get_user(self, /, username: str) -> auth.User:
+            user = await inner.get_user(username)
+            await service.remove_user(username)
+            return user
+
+        async def remove_user(self, username: str) -> None:
+            await inner.remove_user(username)
+
+    async def main() -> None:
+        await inner.create_user(username="mark", email=pydantic.EmailStr("mark@gmail.com"), password_hash="x" * 60)
+        service._user_service = RemovedWhileReading()
+        assert (await service.get_user("mark")).username == "mark"
+        service._user_service = inner
+        with pytest.raises(core.exception.CredentialsException):
+            await service.get_user("mark")
+
+    asyncio.run(main())
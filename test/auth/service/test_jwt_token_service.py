@@ -0,0 +1,67 @@
+import datetime
+import time
+
+import pytest
+from starlette.datastructures import Secret
+
+from src import auth, core
+
+
+def make_token_service(
+    expires_delta: datetime.timedelta = datetime.timedelta(minutes=60), **kwargs  # type: ignore
+) -> auth.JwtTokenService:
+    return auth.JwtTokenService(
+        secret_key=Secret("1234567890"),
+        expires_delta=expires_delta,
+        algorithm="HS256",
+        **kwargs,
+    )
+
+
+def test_jwt_token_service_round_trip() -> None:
+    token_service = make_token_service()
+    token = token_service.create({"sub": "mark"})
+    assert token_service.username(token.access_token) == "mark"
+
+
+def test_jwt_token_service_caches_decoded_tokens() -> None:
+    token_service = make_token_service(decode_cache_size=1)
+    mark = token_service.create({"sub": "mark"}).access_token
+    bob = token_service.create({"sub": "bob"}).access_token
+
+    assert [token_service.username(mark) for _ in range(3)] == ["mark"] * 3
+    assert token_service.cache_info() == {"hits": 2, "misses": 1, "size": 1, "max_size": 1}
+
+    assert token_service.username(bob) == "bob"
+    assert token_service.username(mark) == "mark"
+    assert token_service.cache_info() == {"hits": 2, "misses": 3, "size": 1, "max_size": 1}
+
+
+def test_jwt_token_service_decodes_tokens_again_once_their_exp_has_passed() -> None:
+    now = time.time()
+    token_service = make_token_service(decode_cache_size=10, clock=lambda: now)
+    token = token_service.create({"sub": "mark"}).access_token
+    token_service.username(token)
+    token_service.username(token)
+    assert token_service.cache_info()["hits"] == 1
+
+    now += 60 * 60
+    token_service.username(token)
+    assert token_service.cache_info()["hits"] == 1
+    assert token_service.cache_info()["misses"] == 2
+
+
+def test_jwt_token_service_rejects_expired_tokens() -> None:
+    token_service = make_token_service(datetime.timedelta(seconds=-1), decode_cache_size=10)
+    token = token_service.create({"sub": "mark"}).access_token
+    with pytest.raises(core.exception.AuthException):
+        token_service.username(token)
+    assert token_service.cache_info()["size"] == 0
+
+
+def test_jwt_token_service_rejects_tampered_tokens_even_if_cached() -> None:
+    token_service = make_token_service(decode_cache_size=10)
+    token = token_service.create({"sub": "mark"}).access_token
+    token_service.username(token)
+    with pytest.raises(core.exception.AuthException):
+        token_service.username(token[:-2] + ("AA" if not token.endswith("AA") else "BB"))
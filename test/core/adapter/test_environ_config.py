@@ -0,0 +1,15 @@
+import pytest
+
+from src import core
+
+
+def test_todo_list_cache_defaults_to_redis_only_when_there_is_a_redis_url(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("TODO_LIST_CACHE", raising=False)
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    assert core.EnvironConfig().todo_list_cache == "none"
+
+    monkeypatch.setenv("REDIS_URL", "redis://localhost:6379/0")
+    assert core.EnvironConfig().todo_list_cache == "redis"
+
+    monkeypatch.setenv("TODO_LIST_CACHE", "memory")
+    assert core.EnvironConfig().todo_list_cache == "memory"
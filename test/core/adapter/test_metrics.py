@@ -0,0 +1,63 @@
+import datetime
+
+import pytest
+from sqlalchemy import orm
+
+from src import core, todo
+
+
+@pytest.fixture
+def metrics(monkeypatch: pytest.MonkeyPatch) -> core.Metrics:
+    monkeypatch.setattr(core.metrics, "enabled", True)
+    return core.metrics
+
+
+def test_metrics_record_nothing_until_enabled() -> None:
+    registry = core.Metrics()
+    counter = registry.counter("test_total", "A test counter")
+    histogram = registry.histogram("test_seconds", "A test histogram")
+    counter.inc(route="a")
+    with histogram.time(route="a"):
+        pass
+    assert counter.value(route="a") == 0
+    assert histogram.count(route="a") == 0
+
+    registry.enable()
+    counter.inc(route="a")
+    assert counter.value(route="a") == 1
+
+
+def test_metrics_render_the_prometheus_text_format() -> None:
+    registry = core.Metrics()
+    registry.enable()
+    registry.counter("test_total", "A test counter").inc(2, route='say "hi"')
+    histogram = registry.histogram("test_seconds", "A test histogram", buckets=(0.1, 1))
+    histogram.observe(0.05, route="a")
+    histogram.observe(0.5, route="a")
+    registry.gauge("test_open", "A test gauge", lambda: 3)
+
+    lines = registry.render().splitlines()
+    assert "# TYPE test_total counter" in lines
+    assert 'test_total{route="say \\"hi\\""} 2' in lines
+    assert "# TYPE test_seconds histogram" in lines
+    assert 'test_seconds_bucket{route="a",le="0.1"} 1' in lines
+    assert 'test_seconds_bucket{route="a",le="1"} 2' in lines
+    assert 'test_seconds_bucket{route="a",le="+Inf"} 2' in lines
+    assert 'test_seconds_sum{route="a"} 0.55' in lines
+    assert 'test_seconds_count{route="a"} 2' in lines
+    assert "test_open 3" in lines
+
+
+def test_metered_repositories_label_their_queries(session: orm.Session, metrics: core.Metrics) -> None:
+    metrics.listen(session.get_bind())
+    labels = {"repository": "SqlAlchemyTodoRepository", "method": "mark_completed"}
+    queries_before = metrics.db_queries.value(**labels)
+    calls_before = metrics.repository_seconds.count(**labels)
+
+    repo = todo.SqlAlchemyTodoRepository(session)
+    repo.mark_completed(user_id=1, item_id=1, today=datetime.date(2021, 3, 20))
+
+    assert metrics.repository_seconds.count(**labels) == calls_before + 1
+    # an UPDATE then a SELECT on sqlite, one UPDATE ... RETURNING where the dialect has it
+    assert metrics.db_queries.value(**labels) - queries_before in (1, 2)
+    assert metrics.db_query_seconds.count(**labels) > 0
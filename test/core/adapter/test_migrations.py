@@ -0,0 +1,63 @@
+import pytest
+import sqlalchemy as sa
+from sqlalchemy import pool
+
+from src import core
+
+
+@pytest.fixture(scope="function")
+def engine() -> sa.engine.Engine:
+    engine = sa.create_engine("sqlite://", poolclass=pool.StaticPool)
+    with engine.connect() as con:
+        con.execute(sa.text("ATTACH DATABASE ':memory:' AS auth"))
+        con.execute(sa.text("ATTACH DATABASE ':memory:' AS todo"))
+    return engine
+
+
+def test_migrate_creates_the_current_schema(engine: sa.engine.Engine) -> None:
+    with engine.begin() as con:
+        assert core.migrate(con) == core.MIGRATIONS[-1].version
+
+    inspector = sa.inspect(engine)
+    columns = {col["name"] for col in inspector.get_columns("todo", schema="todo")}
+    assert columns == {col.name for col in core.TodoDTO.__table__.columns}
+    indexes = {ix["name"] for ix in inspector.get_indexes("todo", schema="todo")}
+    assert indexes == {ix.name for ix in core.TodoDTO.__table__.indexes}
+
+
+def test_migrate_upgrades_an_older_schema_and_keeps_its_rows(engine: sa.engine.Engine) -> None:
+    with engine.begin() as con:
+        assert core.migrate(con, target_version=1) == 1
+        con.execute(
+            sa.text(
+                "INSERT INTO todo.todo (advance_days, date_added, description, note, category, frequency) "
+                "VALUES (0, '2021-01-01', 'Dust', '', 'Todo', 'Daily')"
+            )
+        )
+
+    with engine.begin() as con:
+        assert core.current_schema_version(con) == 1
+        assert core.migrate(con) == core.MIGRATIONS[-1].version
+        rows = con.execute(sa.text("SELECT description, next_due_date FROM todo.todo")).fetchall()
+    assert rows == [("Dust", None)]
+
+
+def test_migrate_accepts_a_schema_built_by_create_all(engine: sa.engine.Engine) -> None:
+    core.Base.metadata.create_all(engine)
+    with engine.begin() as con:
+        assert core.current_schema_version(con) == 0
+        assert core.migrate(con) == core.MIGRATIONS[-1].version
+
+    with engine.begin() as con:
+        assert core.migrate(con) == core.MIGRATIONS[-1].version
+        applied = con.execute(sa.text("SELECT version FROM schema_version")).scalars().all()
+    assert applied == [m.version for m in core.MIGRATIONS]
+
+
+def test_migrate_skips_the_advisory_lock_on_sqlite(engine: sa.engine.Engine) -> None:
+    statements = []
+    sa.event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    with engine.begin() as con:
+        assert core.migrate(con) == core.MIGRATIONS[-1].version
+    assert statements
+    assert not any("pg_advisory" in statement for statement in statements)
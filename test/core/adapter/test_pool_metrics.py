@@ -0,0 +1,26 @@
+import sqlalchemy as sa
+from sqlalchemy import pool
+
+from src import core
+
+
+def test_pool_metrics_tracks_checkouts() -> None:
+    engine = sa.create_engine("sqlite://", poolclass=pool.QueuePool, pool_size=2, max_overflow=0)
+    pool_metrics = core.PoolMetrics()
+    pool_metrics.listen(engine)
+
+    with engine.connect() as con1, engine.connect() as con2:
+        con1.execute(sa.text("SELECT 1"))
+        con2.execute(sa.text("SELECT 1"))
+        assert pool_metrics.checked_out == 2
+
+    with engine.connect() as con:
+        con.execute(sa.text("SELECT 1"))
+
+    metrics = pool_metrics.as_dict()
+    assert metrics["connections_opened"] == 2
+    assert metrics["checkouts"] == 3
+    assert metrics["checkins"] == 3
+    assert metrics["checked_out"] == 0
+    assert metrics["peak_checked_out"] == 2
+    assert metrics["checked_out_seconds"] > 0
@@ -0,0 +1,70 @@
+import asyncio
+import logging
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy import pool
+from sqlalchemy.ext import asyncio as sa_asyncio
+
+from src import core
+
+
+@core.metered
+class Repository:
+    def __init__(self, /, con: sa.engine.Connection):
+        self._con = con
+
+    def one(self) -> int:
+        return self._con.execute(sa.text("SELECT 1")).scalar()
+
+
+def test_query_log_records_the_queries_of_the_current_context() -> None:
+    engine = sa.create_engine("sqlite://")
+    query_log = core.QueryLog()
+    query_log.listen(engine)
+
+    with engine.connect() as con:
+        con.execute(sa.text("SELECT 0"))
+        with query_log.record() as queries:
+            Repository(con).one()
+            Repository(con).one()
+        con.execute(sa.text("SELECT 2"))
+
+    assert [(q.statement, q.repository, q.method) for q in queries] == [
+        ("SELECT 1", "Repository", "one"),
+        ("SELECT 1", "Repository", "one"),
+    ]
+    assert core.repeated_statements(queries, at_least=2) == {"SELECT 1": 2}
+    assert core.repeated_statements(queries, at_least=3) == {}
+
+
+def test_query_log_records_queries_of_async_engines() -> None:
+    query_log = core.QueryLog()
+
+    async def run() -> int:
+        engine = sa_asyncio.create_async_engine("sqlite+aiosqlite://", poolclass=pool.StaticPool)
+        query_log.listen(engine.sync_engine)
+        with query_log.record() as queries:
+            async with engine.connect() as con:
+                await con.execute(sa.text("SELECT 1"))
+        await engine.dispose()
+        return len(queries)
+
+    assert asyncio.run(run()) == 1
+
+
+def test_query_log_logs_slow_queries(caplog: pytest.LogCaptureFixture) -> None:
+    engine = sa.create_engine("sqlite://")
+    query_log = core.QueryLog(slow_query_ms=1)
+    query_log.listen(engine)
+
+    with caplog.at_level(logging.WARNING, logger="todo-api.queries"):
+        with engine.connect() as con:
+            Repository(con).one()
+            assert not caplog.records
+
+            query_log.slow_query_seconds = 0.000_000_001
+            Repository(con).one()
+
+    [record] = caplog.records
+    assert "in Repository.one: SELECT 1" in record.getMessage()
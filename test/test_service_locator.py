@@ -0,0 +1,52 @@
+import asyncio
+import datetime
+
+import pytest
+
+from src import core, service_locator
+
+
+def test_statement_timeout_connect_args_for_psycopg2() -> None:
+    actual = service_locator.statement_timeout_connect_args(
+        db_url="postgresql://user:pw@localhost/todo", statement_timeout_ms=500
+    )
+    assert actual == {"options": "-c statement_timeout=500"}
+
+
+def test_statement_timeout_connect_args_for_asyncpg() -> None:
+    actual = service_locator.statement_timeout_connect_args(
+        db_url="postgresql+asyncpg://user:pw@localhost/todo", statement_timeout_ms=500
+    )
+    assert actual == {"server_settings": {"statement_timeout": "500"}}
+
+
+def test_statement_timeout_connect_args_rejects_other_databases() -> None:
+    with pytest.raises(core.exception.InvalidConfigurationSetting):
+        service_locator.statement_timeout_connect_args(db_url="sqlite://", statement_timeout_ms=500)
+
+
+def test_cache_hits_and_misses_are_exported_as_counters(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("USER_CACHE", "memory")
+    monkeypatch.setenv("TODO_LIST_CACHE", "memory")
+    monkeypatch.setenv("JWT_DECODE_CACHE_SIZE", "10")
+    locator = service_locator.SqlAlchemyServiceLocator(core.EnvironConfig())
+
+    token_service = locator.token_service()
+    token = token_service.create({"sub": "test_user"}).access_token
+    token_service.username(token)
+    token_service.username(token)
+    user_cache = locator.user_cache
+    assert user_cache is not None
+    asyncio.run(user_cache.get("test_user"))
+    todo_list_cache = locator.todo_list_cache()
+    assert todo_list_cache is not None
+    asyncio.run(todo_list_cache.get(user_id=1, today=datetime.date(2021, 3, 20)))
+
+    lines = core.metrics.render().splitlines()
+    assert "# TYPE todo_api_jwt_decode_cache_hits_total counter" in lines
+    assert "todo_api_jwt_decode_cache_hits_total 1" in lines
+    assert "todo_api_jwt_decode_cache_misses_total 1" in lines
+    assert "todo_api_user_cache_hits_total 0" in lines
+    assert "todo_api_user_cache_misses_total 1" in lines
+    assert "todo_api_todo_list_cache_hits_total 0" in lines
+    assert "todo_api_todo_list_cache_misses_total 1" in lines
@@ -1,7 +1,53 @@
+import pathlib
 import typing
 
 import sqlalchemy as sa
+from sqlalchemy import orm, pool
+from sqlalchemy.ext import asyncio as sa_asyncio
+
+from src import core
 
 
 def dto_to_dict(obj) -> typing.Dict[str, typing.Any]:  # type: ignore
     return {key: attr.value for key, attr in sorted(sa.inspect(obj).attrs.items())}
+
+
+def attach_schemas(engine: sa.engine.Engine, /, folder: pathlib.Path) -> None:
+    """Give every new sqlite connection the auth and todo schemas, each in its own file under folder"""
+
+    @sa.event.listens_for(engine, "connect")
+    def attach(dbapi_connection, _):  # type: ignore
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"ATTACH DATABASE '{folder / 'auth.db'}' AS auth")
+        cursor.execute(f"ATTACH DATABASE '{folder / 'todo.db'}' AS todo")
+        cursor.execute("PRAGMA todo.journal_mode=WAL")
+        cursor.close()
+
+
+def create_file_session_factory(folder: pathlib.Path) -> orm.sessionmaker:
+    engine = sa.create_engine(
+        f"sqlite:///{folder / 'main.db'}",
+        connect_args={"check_same_thread": False, "timeout": 30},
+    )
+    attach_schemas(engine, folder)
+    core.Base.metadata.create_all(engine)
+    return orm.sessionmaker(bind=engine)
+
+
+async def create_async_session_factory(
+    folder: typing.Optional[pathlib.Path] = None,
+) -> orm.sessionmaker:
+    if folder is None:
+        engine = sa_asyncio.create_async_engine("sqlite+aiosqlite://", poolclass=pool.StaticPool)
+        async with engine.begin() as con:
+            await con.execute(sa.text("ATTACH DATABASE ':memory:' AS auth"))
+            await con.execute(sa.text("ATTACH DATABASE ':memory:' AS todo"))
+            await con.run_sync(core.Base.metadata.create_all)
+    else:
+        engine = sa_asyncio.create_async_engine(
+            f"sqlite+aiosqlite:///{folder / 'main.db'}", connect_args={"timeout": 30}
+        )
+        attach_schemas(engine.sync_engine, folder)
+        async with engine.begin() as con:
+            await con.run_sync(core.Base.metadata.create_all)
+    return orm.sessionmaker(bind=engine, class_=sa_asyncio.AsyncSession, expire_on_commit=False)
@@ -1,4 +1,5 @@
 import datetime
+import random
 
 import pytest
 import sqlalchemy as sa
@@ -9,6 +10,8 @@ from src import core, todo
 
 from test.test_utils.sa_test_utils import *
 
+TODAY = datetime.date(2021, 3, 20)
+
 
 # from src import core, auth, todo
 #
@@ -45,14 +48,14 @@ def test_sqlalchemy_todo_repository_add(session: orm.Session) -> None:
         user_id=1,
         week_day=todo.Weekday.Sunday,
     )
-    result = repo.add(user_id=1, item=new_todo)
+    result = repo.add(user_id=1, item=new_todo, today=TODAY)
 
     after_insert_ct = session.query(core.TodoDTO).count()
     assert after_insert_ct == 1
 
     actual_dto = session.query(core.TodoDTO).first()
     assert actual_dto is not None
-    expected_dto: core.TodoDTO = src.todo.adapter.sqlalchemy_todo_repository.from_domain(result)
+    expected_dto: core.TodoDTO = src.todo.adapter.sqlalchemy_todo_repository.from_domain(result, today=TODAY)
     assert dto_to_dict(actual_dto) == dto_to_dict(expected_dto)
 
 
@@ -73,7 +76,8 @@ def test_sqlalchemy_todo_repository_all(session: orm.Session) -> None:
                 todo_id=1,
                 user_id=1,
                 week_day=todo.Weekday.Sunday,
-            )
+            ),
+            today=TODAY,
         ),
         src.todo.adapter.sqlalchemy_todo_repository.from_domain(
             todo.Weekly(
@@ -87,7 +91,8 @@ def test_sqlalchemy_todo_repository_all(session: orm.Session) -> None:
                 todo_id=2,
                 user_id=2,
                 week_day=todo.Weekday.Sunday,
-            )
+            ),
+            today=TODAY,
         ),
         src.todo.adapter.sqlalchemy_todo_repository.from_domain(
             todo.Weekly(
@@ -101,7 +106,8 @@ def test_sqlalchemy_todo_repository_all(session: orm.Session) -> None:
                 todo_id=3,
                 user_id=1,
                 week_day=todo.Weekday.Sunday,
-            )
+            ),
+            today=TODAY,
         ),
     ]
     session.add_all(todo_dtos)
@@ -131,7 +137,8 @@ def test_sqlalchemy_todo_repository_get_by_id(session: orm.Session) -> None:
                 todo_id=1,
                 user_id=1,
                 week_day=todo.Weekday.Sunday,
-            )
+            ),
+            today=TODAY,
         ),
         src.todo.adapter.sqlalchemy_todo_repository.from_domain(
             todo.Weekly(
@@ -145,7 +152,8 @@ def test_sqlalchemy_todo_repository_get_by_id(session: orm.Session) -> None:
                 todo_id=2,
                 user_id=2,
                 week_day=todo.Weekday.Sunday,
-            )
+            ),
+            today=TODAY,
         ),
         src.todo.adapter.sqlalchemy_todo_repository.from_domain(
             todo.Weekly(
@@ -159,7 +167,8 @@ def test_sqlalchemy_todo_repository_get_by_id(session: orm.Session) -> None:
                 todo_id=3,
                 user_id=1,
                 week_day=todo.Weekday.Sunday,
-            )
+            ),
+            today=TODAY,
         ),
     ]
     session.add_all(todo_dtos)
@@ -188,7 +197,8 @@ def test_sqlalchemy_todo_repository_mark_completed(session: orm.Session) -> None
                 todo_id=1,
                 user_id=1,
                 week_day=todo.Weekday.Sunday
-            )
+            ),
+            today=TODAY,
         ),
         src.todo.adapter.sqlalchemy_todo_repository.from_domain(
             todo.Weekly(
@@ -202,7 +212,8 @@ def test_sqlalchemy_todo_repository_mark_completed(session: orm.Session) -> None
                 todo_id=2,
                 user_id=2,
                 week_day=todo.Weekday.Sunday,
-            )
+            ),
+            today=TODAY,
         ),
         src.todo.adapter.sqlalchemy_todo_repository.from_domain(
             todo.Weekly(
@@ -216,20 +227,132 @@ def test_sqlalchemy_todo_repository_mark_completed(session: orm.Session) -> None
                 todo_id=3,
                 user_id=1,
                 week_day=todo.Weekday.Sunday,
-            )
+            ),
+            today=TODAY,
         ),
     ]
     session.add_all(todo_dtos)
     session.commit()
 
     repo = todo.SqlAlchemyTodoRepository(session)
-    repo.mark_completed(user_id=2, item_id=2, today=datetime.date(2020, 12, 31))
+    completed = repo.mark_completed(user_id=2, item_id=2, today=datetime.date(2020, 12, 31))
     session.commit()
 
+    assert completed is not None
+    assert completed.todo_id == 2
+    assert completed.date_completed == datetime.date(2020, 12, 31)
+    assert not completed.display(datetime.date(2020, 12, 31))
     actual = session.query(core.TodoDTO).filter_by(todo_id=2).first()
     assert actual is not None
     assert actual.date_completed == datetime.date(2020, 12, 31)
 
+    # todo 1 belongs to another user and todo 4 doesn't exist
+    assert repo.mark_completed(user_id=2, item_id=1, today=datetime.date(2020, 12, 31)) is None
+    assert repo.mark_completed(user_id=2, item_id=4, today=datetime.date(2020, 12, 31)) is None
+    assert session.query(core.TodoDTO).filter_by(todo_id=1).one().date_completed is None
+
+
+def test_sqlalchemy_todo_repository_mark_many_completed(session: orm.Session) -> None:
+    session.add_all(
+        src.todo.adapter.sqlalchemy_todo_repository.from_domain(
+            todo.Daily(
+                advance_days=0,
+                category=core.TodoCategory.Todo,
+                date_added=datetime.date(2010, 1, 2),
+                date_completed=None,
+                description=f"Todo {todo_id}",
+                note="",
+                start_date=None,
+                todo_id=todo_id,
+                user_id=1 if todo_id < 4 else 2,
+            ),
+            today=TODAY,
+        )
+        for todo_id in range(1, 5)
+    )
+    session.commit()
+
+    repo = todo.SqlAlchemyTodoRepository(session)
+    completed = repo.mark_many_completed(user_id=1, item_ids=[3, 1, 4, 99], today=datetime.date(2020, 12, 31))
+    session.commit()
+
+    assert sorted(t.todo_id for t in completed) == [1, 3]
+    assert all(t.date_completed == datetime.date(2020, 12, 31) for t in completed)
+    assert {
+        dto.todo_id: dto.date_completed for dto in session.query(core.TodoDTO)
+    } == {1: datetime.date(2020, 12, 31), 2: None, 3: datetime.date(2020, 12, 31), 4: None}
+
+
+def test_sqlalchemy_todo_repository_patch(session: orm.Session) -> None:
+    today = datetime.date(2021, 3, 20)
+    session.add_all(
+        [
+            src.todo.adapter.sqlalchemy_todo_repository.from_domain(
+                todo.Yearly(
+                    advance_days=3,
+                    category=core.TodoCategory.Todo,
+                    date_added=datetime.date(2010, 1, 2),
+                    date_completed=None,
+                    description="Dust",
+                    note="",
+                    start_date=None,
+                    todo_id=1,
+                    user_id=1,
+                    month=todo.Month.January,
+                    day=11,
+                ),
+                today=today,
+            ),
+            src.todo.adapter.sqlalchemy_todo_repository.from_domain(
+                todo.Once(
+                    advance_days=0,
+                    category=core.TodoCategory.Todo,
+                    date_added=datetime.date(2010, 1, 2),
+                    date_completed=None,
+                    description="Renew passport",
+                    note="",
+                    start_date=datetime.date(2021, 5, 1),
+                    todo_id=2,
+                    user_id=1,
+                    once_date=datetime.date(2021, 5, 1),
+                ),
+                today=today,
+            ),
+        ]
+    )
+    session.commit()
+    repo = todo.SqlAlchemyTodoRepository(session)
+
+    # fields that can't move the due date keep the materialized due dates
+    patched = repo.patch(user_id=1, item_id=1, todo_type=todo.Yearly, updates={"description": "Dust well"})
+    assert patched is not None
+    assert patched.description == "Dust well"
+    assert patched.due_dates_as_of == today
+    assert patched.next_due_date == patched.current_date(today)
+
+    patched = repo.patch(
+        user_id=1, item_id=1, todo_type=todo.Yearly, updates={"month": todo.Month.June, "day": 2}
+    )
+    assert patched is not None
+    assert isinstance(patched, todo.Yearly)
+    assert (patched.month, patched.day, patched.description) == (todo.Month.June, 2, "Dust well")
+    assert patched.next_due_date is None
+    assert patched.current_date(today) == datetime.date(2021, 6, 2)
+
+    patched = repo.patch(
+        user_id=1, item_id=2, todo_type=todo.Once, updates={"once_date": datetime.date(2021, 6, 1)}
+    )
+    assert patched is not None
+    assert patched.once_date == datetime.date(2021, 6, 1)  # type: ignore
+
+    # another user's todo, and a field the todo's type doesn't have
+    assert repo.patch(user_id=2, item_id=1, todo_type=todo.Yearly, updates={"note": "x"}) is None
+    assert repo.patch(user_id=1, item_id=2, todo_type=todo.Yearly, updates={"day": 3}) is None
+    session.commit()
+
+    dto = session.query(core.TodoDTO).filter_by(todo_id=2).one()
+    assert (dto.start_date, dto.month_day, dto.note) == (datetime.date(2021, 6, 1), None, "")
+
 
 def test_sqlalchemy_todo_repository_remove(session: orm.Session) -> None:
     initial_ct = session.query(core.TodoDTO).count()
@@ -248,7 +371,8 @@ def test_sqlalchemy_todo_repository_remove(session: orm.Session) -> None:
                 todo_id=1,
                 user_id=1,
                 week_day=todo.Weekday.Sunday
-            )
+            ),
+            today=TODAY,
         ),
         src.todo.adapter.sqlalchemy_todo_repository.from_domain(
             todo.Weekly(
@@ -262,7 +386,8 @@ def test_sqlalchemy_todo_repository_remove(session: orm.Session) -> None:
                 todo_id=2,
                 user_id=2,
                 week_day=todo.Weekday.Sunday,
-            )
+            ),
+            today=TODAY,
         ),
         src.todo.adapter.sqlalchemy_todo_repository.from_domain(
             todo.Weekly(
@@ -276,7 +401,8 @@ def test_sqlalchemy_todo_repository_remove(session: orm.Session) -> None:
                 todo_id=3,
                 user_id=1,
                 week_day=todo.Weekday.Sunday,
-            )
+            ),
+            today=TODAY,
         ),
     ]
     session.add_all(todo_dtos)
@@ -307,7 +433,8 @@ def test_sqlalchemy_todo_repository_update(session: orm.Session) -> None:
                 todo_id=1,
                 user_id=1,
                 week_day=todo.Weekday.Sunday,
-            )
+            ),
+            today=TODAY,
         ),
         src.todo.adapter.sqlalchemy_todo_repository.from_domain(
             todo.Weekly(
@@ -321,7 +448,8 @@ def test_sqlalchemy_todo_repository_update(session: orm.Session) -> None:
                 todo_id=2,
                 user_id=2,
                 week_day=todo.Weekday.Sunday,
-            )
+            ),
+            today=TODAY,
         ),
         src.todo.adapter.sqlalchemy_todo_repository.from_domain(
             todo.Weekly(
@@ -335,7 +463,8 @@ def test_sqlalchemy_todo_repository_update(session: orm.Session) -> None:
                 todo_id=3,
                 user_id=1,
                 week_day=todo.Weekday.Sunday,
-            )
+            ),
+            today=TODAY,
         ),
     ]
     session.add_all(todo_dtos)
@@ -355,9 +484,163 @@ def test_sqlalchemy_todo_repository_update(session: orm.Session) -> None:
     )
 
     repo = todo.SqlAlchemyTodoRepository(session)
-    repo.update(user_id=2, item=updated_todo)
+    repo.update(user_id=2, item=updated_todo, today=TODAY)
     session.commit()
 
     actual = session.query(core.TodoDTO).filter_by(todo_id=2).first()
     assert actual is not None
     assert actual.description == "Fly a Kite"
+
+
+def random_todo(rng: random.Random, todo_id: int) -> todo.Todo:
+    def random_date() -> datetime.date:
+        return datetime.date(2019, 1, 1) + datetime.timedelta(days=rng.randint(0, 3 * 365))
+
+    common = dict(
+        advance_days=rng.choice([0, 0, 1, 3, 7, 14, 30, 60]),
+        category=rng.choice(list(core.TodoCategory)),
+        date_added=datetime.date(2019, 1, 1),
+        date_completed=rng.choice([None, random_date()]),
+        description=f"Todo {todo_id}",
+        note="",
+        start_date=random_date(),
+        todo_id=todo_id,
+        user_id=1,
+    )
+    frequency = rng.choice(list(core.FrequencyDbName))
+    if frequency == core.FrequencyDbName.DAILY:
+        return todo.Daily(**common)
+    elif frequency == core.FrequencyDbName.EASTER:
+        return todo.Easter(**common)
+    elif frequency == core.FrequencyDbName.IRREGULAR:
+        return todo.Irregular(
+            **common,
+            month=todo.Month(rng.randint(1, 12)),
+            week_day=todo.Weekday(rng.randint(1, 7)),
+            week_number=rng.randint(1, 5),
+        )
+    elif frequency == core.FrequencyDbName.MONTHLY:
+        return todo.Monthly(**common, month_day=rng.randint(1, 28))
+    elif frequency == core.FrequencyDbName.ONCE:
+        return todo.Once(**(common | {"start_date": (once_date := random_date())}), once_date=once_date)
+    elif frequency == core.FrequencyDbName.WEEKLY:
+        return todo.Weekly(**common, week_day=todo.Weekday(rng.randint(1, 7)))
+    elif frequency == core.FrequencyDbName.XDAYS:
+        return todo.XDays(**common, days=rng.randint(1, 30))
+    elif rng.random() < 0.2:
+        # falls back to the last leap year's Feb 29 outside of leap years
+        return todo.Yearly(**common, month=todo.Month.February, day=29)
+    else:
+        return todo.Yearly(**common, month=todo.Month(rng.randint(1, 12)), day=rng.randint(1, 28))
+
+
+def test_sqlalchemy_todo_repository_current_candidates_matches_display(session: orm.Session) -> None:
+    rng = random.Random(42)
+    todos = [random_todo(rng, todo_id) for todo_id in range(1, 501)]
+    for t in todos:
+        dto = src.todo.adapter.sqlalchemy_todo_repository.from_domain(t, today=TODAY)
+        # rows written before the due dates were materialized
+        dto.next_due_date = dto.display_from_date = dto.due_dates_as_of = None
+        session.add(dto)
+    session.commit()
+
+    repo = todo.SqlAlchemyTodoRepository(session)
+    for days in range(0, 3 * 365, 11):
+        today = datetime.date(2019, 6, 1) + datetime.timedelta(days=days)
+        for category in core.TodoCategory:
+            candidates = repo.current_candidates(user_id=1, category=category.value, today=today)
+            expected = {t.todo_id for t in todos if t.category == category and t.display(today)}
+            assert {t.todo_id for t in candidates if t.display(today)} == expected, today
+            assert len(candidates) < len([t for t in todos if t.category == category])
+
+
+def test_sqlalchemy_todo_repository_materialized_due_dates_match_display(session: orm.Session) -> None:
+    rng = random.Random(7)
+    todos = [random_todo(rng, todo_id) for todo_id in range(1, 501)]
+    first_day = datetime.date(2019, 6, 1)
+    session.add_all(
+        src.todo.adapter.sqlalchemy_todo_repository.from_domain(t, today=first_day) for t in todos
+    )
+    session.commit()
+
+    repo = todo.SqlAlchemyTodoRepository(session)
+    for days in range(0, 2 * 365, 5):
+        today = first_day + datetime.timedelta(days=days)
+        if days % 3 == 0:
+            repo.refresh_due_dates(today, after_id=None, limit=len(todos))
+            session.commit()
+
+        for t in repo.all(user_id=1):
+            assert t.due_date(today) == t.current_date(today), (t, today)
+
+        for category in core.TodoCategory:
+            candidates = repo.current_candidates(user_id=1, category=category.value, today=today)
+            expected = {t.todo_id for t in todos if t.category == category and t.display(today)}
+            assert {t.todo_id for t in candidates if t.display(today)} == expected, today
+
+
+def test_sqlalchemy_todo_repository_reads_match_validated_todos(session: orm.Session) -> None:
+    rng = random.Random(14)
+    session.add_all(
+        src.todo.adapter.sqlalchemy_todo_repository.from_domain(random_todo(rng, todo_id), today=TODAY)
+        for todo_id in range(1, 201)
+    )
+    session.commit()
+    session.expunge_all()
+
+    todos = todo.SqlAlchemyTodoRepository(session).all(user_id=1)
+    # read as plain rows, without TodoDTO instances in the identity map
+    assert len(todos) == 200
+    assert not session.identity_map
+    for t in todos:
+        validated = type(t)(**t.dict())
+        assert t == validated
+        assert {k: type(v) for k, v in t} == {k: type(v) for k, v in validated}
+
+
+def test_sqlalchemy_todo_repository_bulk_methods(session: orm.Session) -> None:
+    rng = random.Random(3)
+    repo = todo.SqlAlchemyTodoRepository(session)
+
+    added = repo.add_many(user_id=1, items=[random_todo(rng, -1) for _ in range(1200)], today=TODAY)
+    repo.add_many(user_id=2, items=[random_todo(rng, -1) for _ in range(10)], today=TODAY)
+    session.commit()
+    assert len({t.todo_id for t in added}) == 1200
+    assert session.query(core.TodoDTO).filter_by(user_id=1).count() == 1200
+
+    other_user_ids = [t.todo_id for t in repo.all(2)]
+    ids = [t.todo_id for t in added[:1100]] + other_user_ids
+    assert {t.todo_id for t in repo.get_by_ids(user_id=1, todo_ids=ids)} == set(ids[:1100])
+
+    updated = repo.update_many(
+        user_id=1,
+        items=[t.copy(update={"description": "Updated"}) for t in added[:600]]
+        + [t.copy(update={"description": "Updated"}) for t in repo.all(2)],
+        today=TODAY,
+    )
+    session.commit()
+    assert len(updated) == 610
+    assert session.query(core.TodoDTO).filter_by(description="Updated").count() == 600
+    assert session.query(core.TodoDTO).filter_by(user_id=2, description="Updated").count() == 0
+
+    removed = repo.remove_many(user_id=1, item_ids=ids + [999_999])
+    session.commit()
+    assert sorted(removed) == sorted(ids[:1100])
+    assert session.query(core.TodoDTO).filter_by(user_id=1).count() == 100
+    assert session.query(core.TodoDTO).filter_by(user_id=2).count() == 10
+
+
+def test_sqlalchemy_todo_repository_page(session: orm.Session) -> None:
+    rng = random.Random(5)
+    repo = todo.SqlAlchemyTodoRepository(session)
+    repo.add_many(user_id=1, items=[random_todo(rng, -1) for _ in range(25)], today=TODAY)
+    repo.add_many(user_id=2, items=[random_todo(rng, -1) for _ in range(5)], today=TODAY)
+    session.commit()
+    expected = sorted(t.todo_id for t in repo.all(1))
+
+    pages, after_id = [], None
+    while page := repo.page(user_id=1, after_id=after_id, limit=10):
+        pages.append([t.todo_id for t in page])
+        after_id = page[-1].todo_id
+    assert [len(p) for p in pages] == [10, 10, 5]
+    assert sum(pages, []) == expected
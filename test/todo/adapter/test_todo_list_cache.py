@@ -0,0 +1,94 @@
+import asyncio
+import datetime
+import threading
+import typing
+
+import pytest
+
+from src import core, todo
+from test.auth.adapter.test_user_cache import FakeClock, ThreadRecordingStore
+
+TODAY = datetime.date(2021, 6, 15)
+
+TODO_LIST = todo.CachedTodoList(etag='"abc"', body=b'[{"todo_id":1}]')
+
+
+CACHES = pytest.mark.parametrize(
+    "make_cache",
+    [
+        lambda clock: todo.InMemoryTodoListCache(max_size=10, ttl_seconds=60, clock=clock),
+        lambda clock: todo.KeyValueTodoListCache(core.InMemoryKeyValueStore(clock=clock), ttl_seconds=60),
+    ],
+    ids=["in_memory", "key_value"],
+)
+
+
+async def set_list(cache: todo.TodoListCache, /, user_id: int) -> None:
+    await cache.set(user_id=user_id, version=await cache.version(user_id), today=TODAY, value=TODO_LIST)
+
+
+@CACHES
+def test_todo_list_cache_round_trips_lists_per_day_and_category(make_cache: typing.Callable[[FakeClock], todo.TodoListCache]) -> None:
+    async def main() -> None:
+        cache = make_cache(FakeClock())
+        await set_list(cache, 1)
+        assert await cache.get(user_id=1, today=TODAY) == TODO_LIST
+        assert await cache.get(user_id=1, today=TODAY, category="todo") is None
+        assert await cache.get(user_id=1, today=TODAY + datetime.timedelta(days=1)) is None
+        assert await cache.get(user_id=2, today=TODAY) is None
+
+    asyncio.run(main())
+
+
+@CACHES
+def test_todo_list_cache_expires_lists(make_cache: typing.Callable[[FakeClock], todo.TodoListCache]) -> None:
+    async def main() -> None:
+        clock = FakeClock()
+        cache = make_cache(clock)
+        await set_list(cache, 1)
+        clock.now = 60
+        assert await cache.get(user_id=1, today=TODAY) is None
+
+    asyncio.run(main())
+
+
+@CACHES
+def test_todo_list_cache_ignores_lists_read_before_an_invalidation(make_cache: typing.Callable[[FakeClock], todo.TodoListCache]) -> None:
+    async def main() -> None:
+        cache = make_cache(FakeClock())
+        await set_list(cache, 1)
+        stale_version = await cache.version(1)
+        await cache.invalidate(1)
+        assert await cache.get(user_id=1, today=TODAY) is None
+
+        await cache.set(user_id=1, version=stale_version, today=TODAY, value=TODO_LIST)
+        assert await cache.get(user_id=1, today=TODAY) is None
+
+    asyncio.run(main())
+
+
+def test_in_memory_todo_list_cache_evicts_least_recently_used_users() -> None:
+    async def main() -> None:
+        cache = todo.InMemoryTodoListCache(max_size=2, ttl_seconds=60)
+        for user_id in (1, 2):
+            await set_list(cache, user_id)
+        await cache.get(user_id=1, today=TODAY)
+        await set_list(cache, 3)
+        assert await cache.get(user_id=1, today=TODAY) == TODO_LIST
+        assert await cache.get(user_id=2, today=TODAY) is None
+
+    asyncio.run(main())
+
+
+def test_key_value_todo_list_cache_calls_the_store_off_the_event_loop() -> None:
+    store = ThreadRecordingStore()
+
+    async def main() -> None:
+        cache = todo.KeyValueTodoListCache(store, ttl_seconds=60)
+        await set_list(cache, 1)
+        assert await cache.get(user_id=1, today=TODAY) == TODO_LIST
+        await cache.invalidate(1)
+
+    asyncio.run(main())
+    assert store.threads
+    assert threading.get_ident() not in store.threads
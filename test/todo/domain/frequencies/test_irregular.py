@@ -1,6 +1,8 @@
+import calendar
 import datetime
 
 from src import todo, core
+from src.todo.domain.todos import irregular
 
 
 def test_calculate_presidents_day() -> None:
@@ -21,3 +23,36 @@ def test_calculate_presidents_day() -> None:
     assert presidents_day.current_date(datetime.date(2021, 2, 1)) == datetime.date(
         2021, 2, 15
     )
+
+
+def scan_x_weekday_of_month(year: int, month: int, week_num: int, week_day: todo.Weekday) -> datetime.date:
+    dates = [
+        dt
+        for day in range(1, calendar.monthrange(year, month)[1] + 1)
+        if (dt := datetime.date(year, month, day)).weekday() == week_day.py_weekday
+    ]
+    return dates[min(week_num, len(dates)) - 1]
+
+
+def test_get_x_weekday_of_month_matches_a_scan_of_the_month() -> None:
+    for year in range(2019, 2030):
+        for month in range(1, 13):
+            for week_day in todo.Weekday:
+                for week_num in range(1, 6):
+                    assert irregular.get_x_weekday_of_month(
+                        year, month, week_num, week_day
+                    ) == scan_x_weekday_of_month(year, month, week_num, week_day)
+
+
+def test_get_x_weekday_of_month_includes_the_last_day_of_the_month() -> None:
+    # February 28th 2021 is the 4th Sunday
+    assert irregular.get_x_weekday_of_month(2021, 2, 4, todo.Weekday.Sunday) == datetime.date(2021, 2, 28)
+    # and the last, so a 5th Sunday means the 4th
+    assert irregular.get_x_weekday_of_month(2021, 2, 5, todo.Weekday.Sunday) == datetime.date(2021, 2, 28)
+
+
+def test_x_weekday_table_lists_every_week_day_of_each_month() -> None:
+    table = irregular.x_weekday_table(2021)
+    assert len(table) == 12 * 7
+    assert table[(5, todo.Weekday.Sunday)] == tuple(datetime.date(2021, 5, day) for day in (2, 9, 16, 23, 30))
+    assert sum(len(dates) for dates in table.values()) == 365
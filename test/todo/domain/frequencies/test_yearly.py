@@ -0,0 +1,51 @@
+import datetime
+
+import pytest
+
+from src import todo, core
+
+
+@pytest.mark.parametrize(
+    "advance_days,today,expected,description",
+    [
+        (
+            0,
+            datetime.date(2024, 3, 1),
+            datetime.date(2024, 2, 29),
+            "In a leap year, a Feb 29 todo should return that year's Feb 29.",
+        ),
+        (
+            0,
+            datetime.date(2026, 10, 19),
+            datetime.date(2024, 2, 29),
+            "Outside of leap years, a Feb 29 todo should return the previous leap year's Feb 29.",
+        ),
+        (
+            30,
+            datetime.date(2028, 2, 1),
+            datetime.date(2028, 2, 29),
+            "Within its advance days, a Feb 29 todo should return the next leap year's Feb 29.",
+        ),
+    ],
+)
+def test_yearly_on_feb_29(
+    advance_days: int,
+    today: datetime.date,
+    expected: datetime.date,
+    description: str,
+) -> None:
+    yearly = todo.Yearly(
+        advance_days=advance_days,
+        category=core.TodoCategory.Todo,
+        date_added=datetime.date(2010, 1, 1),
+        date_completed=None,
+        description="test",
+        note="",
+        start_date=datetime.date(2010, 1, 1),
+        todo_id=1,
+        user_id=1,
+        month=todo.Month.February,
+        day=29,
+    )
+    assert yearly.current_date(today=today) == expected, description
+    assert todo.evaluate_due_dates([yearly], today).current_dates == [expected], description
@@ -0,0 +1,73 @@
+import datetime
+import random
+
+from src import core, todo
+
+
+def random_todo(rng: random.Random, todo_id: int) -> todo.Todo:
+    def random_date() -> datetime.date:
+        return datetime.date(2015, 1, 1) + datetime.timedelta(days=rng.randint(0, 10 * 365))
+
+    common = dict(
+        advance_days=rng.choice([0, 0, 1, 3, 7, 14, 30, 60, 200]),
+        category=rng.choice(list(core.TodoCategory)),
+        date_added=datetime.date(2015, 1, 1),
+        date_completed=rng.choice([None, random_date()]),
+        description=f"Todo {todo_id}",
+        note="",
+        start_date=random_date(),
+        todo_id=todo_id,
+        user_id=1,
+    )
+    frequency = rng.choice(list(core.FrequencyDbName))
+    if frequency == core.FrequencyDbName.DAILY:
+        t: todo.Todo = todo.Daily(**common)
+    elif frequency == core.FrequencyDbName.EASTER:
+        t = todo.Easter(**common)
+    elif frequency == core.FrequencyDbName.IRREGULAR:
+        t = todo.Irregular(
+            **common,
+            month=todo.Month(rng.randint(1, 12)),
+            week_day=todo.Weekday(rng.randint(1, 7)),
+            week_number=rng.randint(1, 5),
+        )
+    elif frequency == core.FrequencyDbName.MONTHLY:
+        t = todo.Monthly(**common, month_day=rng.randint(1, 28))
+    elif frequency == core.FrequencyDbName.ONCE:
+        t = todo.Once(**common, once_date=random_date())
+    elif frequency == core.FrequencyDbName.WEEKLY:
+        t = todo.Weekly(**common, week_day=todo.Weekday(rng.randint(1, 7)))
+    elif frequency == core.FrequencyDbName.XDAYS:
+        t = todo.XDays(**common, days=rng.randint(1, 60))
+    else:
+        t = todo.Yearly(**common, month=todo.Month(rng.randint(1, 12)), day=rng.randint(1, 28))
+
+    if rng.random() < 0.5:
+        # materialized by the repository on some earlier day
+        as_of = random_date()
+        next_due_date = t.current_date(as_of)
+        t = t.copy(
+            update={
+                "next_due_date": next_due_date,
+                "display_from_date": next_due_date - datetime.timedelta(days=t.advance_days),
+                "due_dates_as_of": as_of,
+            }
+        )
+    return t
+
+
+def test_evaluate_due_dates_matches_the_per_todo_methods() -> None:
+    rng = random.Random(12)
+    for _ in range(50):
+        todos = [random_todo(rng, todo_id) for todo_id in range(200)]
+        today = datetime.date(2015, 1, 1) + datetime.timedelta(days=rng.randint(0, 10 * 365))
+
+        due_dates = todo.evaluate_due_dates(todos, today)
+
+        assert due_dates.current_dates == [t.current_date(today) for t in todos], today
+        assert due_dates.display == [t.display(today) for t in todos], today
+        assert due_dates.days_until == [t.days_until(today) for t in todos], today
+
+
+def test_evaluate_due_dates_of_no_todos() -> None:
+    assert todo.evaluate_due_dates([], datetime.date(2021, 1, 1)) == todo.DueDates([], [], [])
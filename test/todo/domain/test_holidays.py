@@ -0,0 +1,31 @@
+import datetime
+
+from src import todo
+
+
+def test_holiday_calendar_matches_the_holiday_rules() -> None:
+    calendar = todo.HolidayCalendar(first_year=2020, last_year=2025)
+    for start, end in [
+        (datetime.date(2021, 3, 1), datetime.date(2023, 2, 28)),
+        # partly outside of the precomputed years
+        (datetime.date(2019, 6, 1), datetime.date(2020, 6, 1)),
+        (datetime.date(2025, 6, 1), datetime.date(2027, 6, 1)),
+    ]:
+        expected = sorted(
+            (dt, holiday.description) for holiday in todo.HOLIDAYS for dt in holiday.occurrences(start, end)
+        )
+        assert sorted((dt, holiday.description) for dt, holiday in calendar.between(start, end)) == expected
+
+
+def test_holiday_calendar_on() -> None:
+    calendar = todo.HolidayCalendar(first_year=2021, last_year=2021)
+    assert [h.description for h in calendar.on(datetime.date(2021, 12, 25))] == ["Christmas"]
+    assert [h.description for h in calendar.on(datetime.date(2021, 4, 4))] == ["Easter"]
+    assert calendar.on(datetime.date(2021, 4, 5)) == []
+
+
+def test_generate_holidays_copies_the_shared_rules() -> None:
+    holidays = todo.generate_holidays(7)
+    assert len(holidays) == len(todo.HOLIDAYS)
+    assert {h.user_id for h in holidays} == {7}
+    assert {h.user_id for h in todo.HOLIDAYS} == {0}
@@ -0,0 +1,50 @@
+import datetime
+import itertools
+import random
+
+from src import core, todo
+from test.todo.domain.test_due_dates import random_todo
+
+
+def test_occurrences_match_current_date() -> None:
+    rng = random.Random(13)
+    for todo_id in range(200):
+        t = random_todo(rng, todo_id).copy(update={"advance_days": 0})
+        start = datetime.date(2015, 1, 1) + datetime.timedelta(days=rng.randint(0, 10 * 365))
+        end = start + datetime.timedelta(days=rng.randint(0, 800))
+        # current_date only ever returns due dates, and every due date is returned on some day near it
+        expected = sorted(
+            {
+                dt
+                for days in range(-400, (end - start).days + 400)
+                if start <= (dt := t.current_date(start + datetime.timedelta(days=days))) <= end
+            }
+        )
+        assert list(t.occurrences(start, end)) == expected, t
+
+
+def test_occurrences_are_lazy() -> None:
+    t = todo.Daily(
+        todo_id=1,
+        user_id=1,
+        category=core.TodoCategory.Todo,
+        description="Daily",
+        note="",
+        start_date=datetime.date(2020, 1, 1),
+        date_added=datetime.date(2020, 1, 1),
+        date_completed=None,
+    )
+    # an open-ended range only works if dates are produced on demand
+    first = list(itertools.islice(t.occurrences(datetime.date(2020, 1, 1), datetime.date.max), 3))
+    assert first == [datetime.date(2020, 1, 1), datetime.date(2020, 1, 2), datetime.date(2020, 1, 3)]
+
+
+def test_merge_occurrences_orders_every_todo_by_date() -> None:
+    rng = random.Random(14)
+    todos = [random_todo(rng, todo_id) for todo_id in range(50)]
+    start, end = datetime.date(2020, 1, 1), datetime.date(2021, 12, 31)
+    merged = list(todo.merge_occurrences(todos, start=start, end=end))
+    assert [dt for dt, _ in merged] == sorted(dt for dt, _ in merged)
+    assert sorted((dt, t.todo_id) for dt, t in merged) == sorted(
+        (dt, t.todo_id) for t in todos for dt in t.occurrences(start, end)
+    )
@@ -0,0 +1,22 @@
+import datetime
+
+import pydantic
+import pytest
+
+from src import todo
+
+
+def test_validate_updates_checks_only_the_given_fields() -> None:
+    assert todo.Yearly.validate_updates({"month": 3, "day": "4", "description": " Dust "}) == {
+        "month": todo.Month.March,
+        "day": 4,
+        "description": "Dust",
+    }
+    assert todo.Once.validate_updates({"once_date": "2021-03-20"}) == {"once_date": datetime.date(2021, 3, 20)}
+    assert todo.Daily.validate_updates({}) == {}
+
+
+def test_validate_updates_reports_every_bad_field() -> None:
+    with pytest.raises(pydantic.ValidationError) as e:
+        todo.Yearly.validate_updates({"month": 13, "week_number": 1, "todo_id": 3, "day": 4})
+    assert [error["loc"] for error in e.value.errors()] == [("month",), ("week_number",), ("todo_id",)]
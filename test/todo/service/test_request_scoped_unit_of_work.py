@@ -0,0 +1,86 @@
+import asyncio
+import datetime
+import pathlib
+import typing
+from concurrent import futures
+
+import pytest
+from sqlalchemy import orm
+
+from src import core, service_locator, todo
+
+from test.test_utils.sa_test_utils import *
+
+REQUESTS = 200
+
+
+def new_todo(user_id: int) -> todo.Todo:
+    return todo.Daily(
+        advance_days=0,
+        category=core.TodoCategory.Todo,
+        date_added=datetime.date(2010, 1, 2),
+        date_completed=None,
+        description=f"Todo for user {user_id}",
+        note="",
+        start_date=None,
+        todo_id=-1,
+        user_id=user_id,
+    )
+
+
+async def handle_request(todo_service: todo.TodoService, user_id: int) -> None:
+    await todo_service.add_todo(user_id=user_id, todo=new_todo(user_id), today=datetime.date(2010, 1, 2))
+    await asyncio.sleep(0)
+    todos = await todo_service.all(user_id)
+    assert [t.description for t in todos] == [f"Todo for user {user_id}"]
+
+
+def recording(session_factory: orm.sessionmaker, /) -> typing.Tuple[typing.Callable[[], typing.Any], list]:
+    sessions: typing.List[typing.Any] = []
+
+    def create_session() -> typing.Any:
+        session = session_factory()
+        sessions.append(session)
+        return session
+
+    return create_session, sessions
+
+
+def test_concurrent_async_requests_do_not_share_sessions(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("TODO_LIST_CACHE", "none")
+    locator = service_locator.AsyncSqlAlchemyServiceLocator(core.EnvironConfig())
+
+    async def run() -> None:
+        create_session, sessions = recording(await create_async_session_factory(tmp_path))
+        # the locator would open DB_URL, the test hands it a sqlite database with the schemas attached instead
+        locator._async_session_factory = locator._async_read_only_session_factory = create_session  # type: ignore
+        # what FastAPI does for the todo_service dependency of each request
+        todo_services = [locator.todo_service() for _ in range(REQUESTS)]
+        await asyncio.gather(
+            *(handle_request(todo_service, user_id) for user_id, todo_service in enumerate(todo_services, 1))
+        )
+        assert len({id(todo_service._uow) for todo_service in todo_services}) == REQUESTS  # type: ignore
+        assert len({id(session) for session in sessions}) == 2 * REQUESTS
+
+    asyncio.run(run())
+
+
+def test_threaded_sync_requests_do_not_share_sessions(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("TODO_LIST_CACHE", "none")
+    locator = service_locator.SqlAlchemyServiceLocator(core.EnvironConfig())
+    create_session, sessions = recording(create_file_session_factory(tmp_path))
+    locator._session_factory = locator._read_only_session_factory = create_session  # type: ignore
+    todo_services = [locator.todo_service() for _ in range(REQUESTS)]
+
+    def run(user_id: int) -> None:
+        asyncio.run(handle_request(todo_services[user_id - 1], user_id))
+
+    with futures.ThreadPoolExecutor(max_workers=16) as executor:
+        for result in [executor.submit(run, user_id) for user_id in range(1, REQUESTS + 1)]:
+            result.result()
+    assert len({id(todo_service._uow) for todo_service in todo_services}) == REQUESTS  # type: ignore
+    assert len({id(session) for session in sessions}) == 2 * REQUESTS
@@ -0,0 +1,160 @@
+import asyncio
+import datetime
+import logging
+
+import pytest
+
+import src.todo.adapter.sqlalchemy_todo_repository
+import src.todo.service.sqlalchemy_async_todo_service
+
+from src import core, todo
+
+from test.test_utils.sa_test_utils import *
+
+TODAY = datetime.date(2021, 3, 20)
+
+
+def test_sqlalchemy_async_todo_service_add_and_all() -> None:
+    async def run() -> None:
+        session_factory = await create_async_session_factory()
+        todo_service = todo.SqlAlchemyAsyncTodoService(core.SqlAlchemyAsyncUnitOfWork(session_factory))
+        new_todo = await todo_service.add_todo(
+            user_id=1,
+            todo=todo.Weekly(
+                advance_days=1,
+                category=core.TodoCategory.Todo,
+                date_added=datetime.date(2010, 1, 2),
+                date_completed=None,
+                description="Grocery Shopping",
+                note="",
+                start_date=None,
+                todo_id=-1,
+                user_id=1,
+                week_day=todo.Weekday.Sunday,
+            ),
+            today=TODAY,
+        )
+        assert new_todo.todo_id > 0
+        # the due dates are materialized as of the request's day, not the server's
+        assert new_todo.due_dates_as_of == TODAY
+
+        completed = await todo_service.mark_complete(
+            user_id=1, todo_id=new_todo.todo_id, today=datetime.date(2021, 6, 15)
+        )
+        assert completed is not None
+        assert completed.date_completed == datetime.date(2021, 6, 15)
+        assert await todo_service.mark_complete(
+            user_id=2, todo_id=new_todo.todo_id, today=datetime.date(2021, 6, 15)
+        ) is None
+
+        actual = await todo_service.all(user_id=1)
+        assert [t.description for t in actual] == ["Grocery Shopping"]
+        assert actual[0].date_completed == datetime.date(2021, 6, 15)
+        assert await todo_service.all(user_id=2) == []
+
+    asyncio.run(run())
+
+
+def test_sqlalchemy_async_todo_service_delete_todo() -> None:
+    async def run() -> None:
+        session_factory = await create_async_session_factory()
+        todo_service = todo.SqlAlchemyAsyncTodoService(core.SqlAlchemyAsyncUnitOfWork(session_factory))
+        new_todo = await todo_service.add_todo(
+            user_id=1,
+            todo=todo.Daily(
+                advance_days=0,
+                category=core.TodoCategory.Todo,
+                date_added=datetime.date(2010, 1, 2),
+                date_completed=None,
+                description="Make Bed",
+                note="",
+                start_date=None,
+                todo_id=-1,
+                user_id=1,
+            ),
+            today=TODAY,
+        )
+        await todo_service.delete_todo(user_id=1, todo_id=new_todo.todo_id)
+        assert await todo_service.all(user_id=1) == []
+
+    asyncio.run(run())
+
+
+def test_sqlalchemy_async_todo_service_page_and_stream() -> None:
+    async def run() -> None:
+        session_factory = await create_async_session_factory()
+        todo_service = todo.SqlAlchemyAsyncTodoService(core.SqlAlchemyAsyncUnitOfWork(session_factory))
+        await todo_service.add_todos(
+            user_id=1,
+            todos=[
+                todo.Daily(
+                    advance_days=0,
+                    category=core.TodoCategory.Todo,
+                    date_added=datetime.date(2010, 1, 2),
+                    date_completed=None,
+                    description=f"Todo {i}",
+                    note="",
+                    start_date=None,
+                    todo_id=-1,
+                    user_id=1,
+                )
+                for i in range(7)
+            ],
+            today=TODAY,
+        )
+        first_page = await todo_service.page(user_id=1, after_id=None, limit=5)
+        second_page = await todo_service.page(user_id=1, after_id=first_page[-1].todo_id, limit=5)
+        assert [t.description for t in first_page + second_page] == [f"Todo {i}" for i in range(7)]
+
+        streamed = [t.description async for t in todo_service.stream(user_id=1)]
+        assert streamed == [f"Todo {i}" for i in range(7)]
+        assert [t async for t in todo_service.stream(user_id=2)] == []
+
+    asyncio.run(run())
+
+
+def test_sqlalchemy_async_todo_service_refresh_due_dates_in_batches(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    monkeypatch.setattr(src.todo.service.sqlalchemy_async_todo_service, "REFRESH_BATCH_SIZE", 3)
+    common = dict(
+        advance_days=0,
+        category=core.TodoCategory.Todo,
+        date_added=datetime.date(2010, 1, 2),
+        date_completed=None,
+        note="",
+        start_date=None,
+        todo_id=-1,
+        user_id=1,
+    )
+
+    async def run() -> None:
+        session_factory = await create_async_session_factory()
+        todo_service = todo.SqlAlchemyAsyncTodoService(core.SqlAlchemyAsyncUnitOfWork(session_factory))
+        todos = await todo_service.add_todos(
+            user_id=1,
+            todos=[todo.Daily(**common, description=f"Todo {i}") for i in range(6)]
+            + [todo.Yearly(**common, description="Leap day", month=todo.Month.February, day=29)],
+            today=TODAY,
+        )
+        async with session_factory() as session:
+            # written before the days of the month were checked
+            dto = src.todo.adapter.sqlalchemy_todo_repository.from_domain(
+                todo.Yearly(**common, description="Impossible", month=todo.Month.February, day=1),
+                today=TODAY,
+            )
+            dto.month_day = 30
+            dto.next_due_date = dto.display_from_date = dto.due_dates_as_of = None
+            session.add(dto)
+            await session.commit()
+
+        today = datetime.date(2026, 10, 19)
+        assert await todo_service.refresh_due_dates(today=today) == 7
+        refreshed = await todo_service.get_by_ids(user_id=1, todo_ids=[t.todo_id for t in todos])
+        assert [t.due_date(today) for t in refreshed] == [t.current_date(today) for t in refreshed]
+        assert refreshed[-1].due_date(today) == datetime.date(2024, 2, 29)
+
+    with caplog.at_level(logging.WARNING, logger="todo-api.todo_repository"):
+        asyncio.run(run())
+    [record] = caplog.records
+    assert record.getMessage().startswith("Could not refresh the due dates of todo 8:")
@@ -0,0 +1,34 @@
+import asyncio
+import pathlib
+import threading
+import typing
+
+import pydantic
+import sqlalchemy as sa
+from sqlalchemy import orm
+
+from src import auth, core, todo
+
+from test.test_utils.sa_test_utils import *
+
+
+def test_sync_services_query_off_the_event_loop(tmp_path: pathlib.Path) -> None:
+    session_factory: orm.sessionmaker = create_file_session_factory(tmp_path)
+    query_threads: typing.Set[int] = set()
+
+    @sa.event.listens_for(session_factory.kw["bind"], "before_cursor_execute")
+    def record_thread(*_: typing.Any) -> None:
+        query_threads.add(threading.get_ident())
+
+    async def run() -> None:
+        user_service = auth.SqlalchemyUserService(core.SqlAlchemyUnitOfWork(session_factory))
+        user = await user_service.create_user(
+            username="test_user", email=pydantic.EmailStr("test_user@gmail.com"), password_hash="1234" * 15
+        )
+        todo_service = todo.SqlAlchemyTodoService(core.SqlAlchemyUnitOfWork(session_factory))
+        assert await todo_service.all(user.user_id) == []
+        assert [t async for t in todo_service.stream(user_id=user.user_id)] == []
+
+    asyncio.run(run())
+    assert query_threads
+    assert threading.get_ident() not in query_threads